@@ -2,8 +2,43 @@ from .analyzer import Analyzer
 from .analysis_results import AnalysisResults
 from .benchmark_symbol import BenchmarkSymbol
 from .benchmark_performance import BenchmarkPerformance
+from .benchmark_provider import BenchmarkProvider
+from .benchmark_statistics_cache import BenchmarkStatisticsCache
+from .benchmark_store import BenchmarkStore
+from .csv_benchmark_provider import CsvBenchmarkProvider
+from .in_memory_benchmark_provider import InMemoryBenchmarkProvider
+from .local_file_benchmark_provider import LocalFileBenchmarkProvider
+from .parquet_benchmark_provider import ParquetBenchmarkProvider
+from .yahoo_finance_benchmark_provider import YahooFinanceBenchmarkProvider
+from .composite_benchmark import CompositeBenchmark
+from .correlation_method import CorrelationMethod
+from .correlation_matrix import CorrelationMatrix
+from .correlation_matrices import CorrelationMatrices
 from .daily_statistics import DailyStatistics
+from .intraday_equity import IntradayEquity
+from .intraday_equity_builder import IntradayEquityBuilder
+from .distribution_metric import DistributionMetric
+from .drawdown_episode import DrawdownEpisode
+from .drawdown_episode_index import DrawdownEpisodeIndex
 from .statistics_results import StatisticsResults
+from .period import Period
+from .periodical_performance import PeriodicalPerformance
+from .periodical_statistics import PeriodicalStatistics
+from .monte_carlo_method import MonteCarloMethod
+from .monte_carlo_results import MonteCarloResults
+from .monte_carlo_simulator import MonteCarloSimulator
+from .rolling_performance import RollingPerformance
+from .rolling_statistics import RollingStatistics
+from .rolling_statistics_builder import RollingStatisticsBuilder
 from .strategy_performance import StrategyPerformance
 from .strategy_daily_statistics import StrategyDailyStatistics
 from .trade_statistics import TradeStatistics
+from .trade_statistics_accumulator import TradeStatisticsAccumulator
+from .trade_ledger import TradeLedger
+from .trade_distribution import TradeDistribution
+from .trade_distributions import TradeDistributions
+from .walk_forward_mode import WalkForwardMode
+from .walk_forward_window import WalkForwardWindow
+from .walk_forward_runner import WalkForwardRunner
+from .results_cache import ResultsCache
+from .simulation_checkpoint import SimulationCheckpoint
@@ -3,6 +3,7 @@ from datetime import date as Date
 
 from ..entities import Trade
 from .benchmark_symbol import BenchmarkSymbol
+from .composite_benchmark import CompositeBenchmark
 from .statistics_results import StatisticsResults
 
 
@@ -12,12 +13,14 @@ class AnalysisResults:
         starting_capital: float,
         start_date: Date,
         end_date: Date,
-        benchmark_symbol: BenchmarkSymbol,
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark],
     ) -> None:
         self.__starting_capital: float = starting_capital
         self.__start_date: Date = start_date
         self.__end_date: Date = end_date
-        self.__benchmark_symbol: BenchmarkSymbol = benchmark_symbol
+        self.__benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark] = (
+            benchmark_symbol
+        )
         self.__results: Dict[str, StatisticsResults] = {}
 
     # -------------------------------------------------- Properties --------------------------------------------------
@@ -34,7 +37,7 @@ class AnalysisResults:
         return self.__end_date
 
     @property
-    def benchmark_symbol(self) -> BenchmarkSymbol:
+    def benchmark_symbol(self) -> Union[BenchmarkSymbol, str, CompositeBenchmark]:
         return self.__benchmark_symbol
 
     @property
@@ -1,25 +1,46 @@
-from typing import List, Union, Dict, overload, Any
-from datetime import date as Date
-import copy
+import os
+from typing import Iterable, Iterator, List, Dict, Tuple, Union, Optional
+from datetime import date as Date, timedelta as TimeDelta
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+
+from PyQt6.QtCore import QCoreApplication
 
 from ..entities import (
     Order,
     Instrument,
     Strategy as StrategyModel,
     BacktestReport,
-    Trade,
 )
+from ..trading.instruments import InstrumentRegistry
 from ..trading.strategies import Strategy
-from ..enums import OrderStatus, StrategyType
+from ..enums import OrderStatus, StrategyType, Resolution
 from ..events import OrderFilledEvent
-from ..repositories import OrderRepository, InstrumentRepository, StrategyRepository
+from ..repositories import OrderRepository, StrategyRepository
+from ..database_manager import DatabaseManager
 from .analysis_results import AnalysisResults
+from .benchmark_store import BenchmarkStore
 from .benchmark_symbol import BenchmarkSymbol
+from .composite_benchmark import CompositeBenchmark
+from .results_cache import ResultsCache
+from .simulation_checkpoint import SimulationCheckpoint
 from .statistics_builder import StatisticsBuilder
+from .intraday_equity_builder import IntradayEquityBuilder
 from .statistics_results import StatisticsResults
+from .trade_ledger import TradeLedger
 
 
 class Analyzer:
+    # Leaves a core to the GUI, a few workers already cover the usual number of selected strategies.
+    DEFAULT_MAX_WORKERS: int = max(1, min(4, (os.cpu_count() or 1) - 1))
+
+    __worker_application: Optional[QCoreApplication] = None
+
+    # Workers are spawned once and kept between analyses, as starting them takes seconds.
+    __executor: Optional[ProcessPoolExecutor] = None
+    __executor_settings: Tuple[int, str] = (0, "")
+
     @classmethod
     def analyze_reports(
         cls,
@@ -27,7 +48,8 @@ class Analyzer:
         starting_capital: float,
         start_date: Date,
         end_date: Date,
-        benchmark_symbol: BenchmarkSymbol,
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark],
+        max_workers: int = 1,
     ) -> AnalysisResults:
         results: AnalysisResults = AnalysisResults(
             starting_capital, start_date, end_date, benchmark_symbol
@@ -39,7 +61,7 @@ class Analyzer:
         )
 
         # Builds strategy results.
-        instruments: List[Instrument] = InstrumentRepository.query_all()
+        models: List[StrategyModel] = []
 
         for report in report_models:
             model: Union[StrategyModel, None] = StrategyRepository.query_by_id(
@@ -47,51 +69,26 @@ class Analyzer:
             )
             assert model is not None
             model.default_report_id = report.id
-            strategy_id: str = f"{model.id}:{model.default_report_id}"
-
-            # Create strategy instance by report model.
-            strategy: Strategy = Strategy(strategy_id, model.description, model.type)
-
-            # Get filted orders by date range.
-            orders: List[Order] = list(
-                filter(
-                    lambda order: order.datetime.date() >= start_date
-                    and order.datetime.date() <= end_date,
-                    OrderRepository.query_by_strategy_id(strategy.id),
-                )
-            )
-
-            # Start runtime sumulation.
-            for order in orders:
-                instrument: Union[Instrument, None] = next(
-                    filter(
-                        lambda instrument: instrument.symbol == order.symbol,
-                        instruments,
-                    ),
-                    None,
-                )
-
-                if instrument is None:
-                    raise RuntimeError(
-                        f"No data avaliable for this instrument: {order.symbol}"
-                    )
+            models.append(model)
 
-                e: OrderFilledEvent = cls.__try_match_order(strategy, instrument, order)
-                strategy.on_order_filled(e)
+        strategy_results: List[StatisticsResults] = cls.__run_strategies(
+            models,
+            benchmark_results,
+            benchmark_symbol,
+            starting_capital,
+            start_date,
+            end_date,
+            max_workers,
+        )
 
-            # Get trading results of strategy instance.
-            key: str = f"Strategy:{strategy_id}"
+        for model, statistics_results in zip(models, strategy_results):
             results.add(
-                key,
-                StatisticsBuilder.build_strategy(
-                    strategy.closed_trades,
-                    benchmark_results.total_performance.daily_statistics.returns,
-                    starting_capital,
-                    start_date,
-                    end_date,
-                ),
+                f"Strategy:{model.id}:{model.default_report_id}", statistics_results
             )
-        results.add(f"Benchmark:{benchmark_symbol.value}", benchmark_results)
+        results.add(
+            f"Benchmark:{BenchmarkSymbol.to_symbol(benchmark_symbol)}",
+            benchmark_results,
+        )
         return results
 
     @classmethod
@@ -101,7 +98,8 @@ class Analyzer:
         starting_capital: float,
         start_date: Date,
         end_date: Date,
-        benchmark_symbol: BenchmarkSymbol,
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark],
+        max_workers: int = 1,
     ) -> AnalysisResults:
         results: AnalysisResults = AnalysisResults(
             starting_capital, start_date, end_date, benchmark_symbol
@@ -113,66 +111,240 @@ class Analyzer:
         )
 
         # Builds strategy results.
-        instruments: List[Instrument] = InstrumentRepository.query_all()
+        strategy_results: List[StatisticsResults] = cls.__run_strategies(
+            strategies,
+            benchmark_results,
+            benchmark_symbol,
+            starting_capital,
+            start_date,
+            end_date,
+            max_workers,
+        )
 
-        portfolio_trades: List[Trade] = []
+        for model, statistics_results in zip(strategies, strategy_results):
+            # Get trading results of strategy instance.
+            key: str = f"Strategy:{model.id}:{model.default_report_id}"
+            results.add(key, statistics_results)
 
-        for model in strategies:
-            strategy_id: str = f"{model.id}:{model.default_report_id}"
+        if len(strategies) > 1:
+            # Portfolio strategy shares the trades of each strategy, ordered by exit time.
+            # Its trade statistics merge those of each strategy, only the path of the trades is accumulated again.
+            resolution: Resolution = Resolution.D
 
-            # Create strategy instance by report model.
-            strategy: Strategy = Strategy(strategy_id, model.description, model.type)
-
-            # Get filted orders by date range.
-            orders: List[Order] = list(
-                filter(
-                    lambda order: order.datetime.date() >= start_date
-                    and order.datetime.date() <= end_date,
-                    OrderRepository.query_by_strategy_id(strategy.id),
+            for model in strategies:
+                resolution = IntradayEquityBuilder.get_finest(
+                    resolution, model.resolution
                 )
-            )
 
-            cls.__mock_matching(strategy, instruments, orders)
-
-            if len(strategies) > 1:
-                for trade in strategy.closed_trades:
-                    portfolio_trades.append(copy.deepcopy(trade))
-
-            # Get trading results of strategy instance.
-            key: str = f"Strategy:{strategy_id}"
             results.add(
-                key,
+                "All",
                 StatisticsBuilder.build_strategy(
-                    strategy.closed_trades,
+                    TradeLedger.concatenate(
+                        [
+                            statistics_results.total_performance.ledger
+                            for statistics_results in strategy_results
+                        ]
+                    ),
                     benchmark_results.total_performance.daily_statistics.returns,
                     starting_capital,
                     start_date,
                     end_date,
+                    resolution,
+                    [
+                        statistics_results.total_performance.trade_accumulator
+                        for statistics_results in strategy_results
+                    ],
                 ),
             )
+        results.add(
+            f"Benchmark:{BenchmarkSymbol.to_symbol(benchmark_symbol)}",
+            benchmark_results,
+        )
+        return results
 
-        if len(strategies) > 1:
-            # Re-assign trade id for portfolio strategy.
-            # sorted_trades: List[Trade] = sorted(portfolio_trades, key = lambda trade: trade.exit_time.timestamp())
+    @classmethod
+    def run_strategy(
+        cls,
+        model: StrategyModel,
+        instruments: InstrumentRegistry,
+        benchmark_returns: Dict[Date, float],
+        starting_capital: float,
+        start_date: Date,
+        end_date: Date,
+    ) -> StatisticsResults:
+        """
+        Simulates the default report of a strategy and builds its statistics. Runs in worker processes when analyzing in parallel.
+        """
+        strategy_id: str = f"{model.id}:{model.default_report_id}"
+        checkpoint: Union[SimulationCheckpoint, None] = ResultsCache.get_checkpoint(
+            strategy_id, model.type, start_date, instruments
+        )
+        strategy: Strategy
+        replay_start_date: Date
+
+        if checkpoint is not None and checkpoint.end_date <= end_date:
+            # Continue from the previous end date, only the orders after it are replayed.
+            strategy = checkpoint.strategy
+            replay_start_date = checkpoint.end_date + TimeDelta(days=1)
+        else:
+            # Create strategy instance by report model.
+            strategy = Strategy(strategy_id, model.description, model.type, instruments)
+            replay_start_date = start_date
 
-            sorted_trades: List[Trade] = sorted(
-                portfolio_trades, key=lambda trade: trade.exit_time
+        # Stream orders in date range.
+        orders: Iterable[Order] = OrderRepository.iter_by_strategy_id_and_date_range(
+            strategy.id, replay_start_date, end_date
+        )
+
+        cls.__mock_matching(strategy, orders)
+        ResultsCache.put_checkpoint(
+            strategy_id,
+            model.type,
+            start_date,
+            instruments,
+            SimulationCheckpoint(strategy, end_date),
+        )
+
+        # Get trading results of strategy instance.
+        return StatisticsBuilder.build_strategy(
+            TradeLedger.from_trades(strategy.closed_trades),
+            benchmark_returns,
+            starting_capital,
+            start_date,
+            end_date,
+            model.resolution,
+        )
+
+    @classmethod
+    def initialize_worker(cls, database_name: str) -> None:
+        """
+        Prepares a worker process, which needs its own Qt application and database connection.
+        """
+        if QCoreApplication.instance() is None:
+            cls.__worker_application = QCoreApplication([])
+
+        DatabaseManager.DATABASE_NAME = database_name
+        DatabaseManager.connect()
+
+    @classmethod
+    def get_executor(cls, max_workers: int) -> ProcessPoolExecutor:
+        """
+        Worker processes shared by parallel work, e.g. strategies of an analysis or monte carlo batches.
+        """
+        settings: Tuple[int, str] = (max_workers, DatabaseManager.DATABASE_NAME)
+
+        if cls.__executor is None or cls.__executor_settings != settings:
+            cls.shutdown()
+            cls.__executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=get_context("spawn"),
+                initializer=cls.initialize_worker,
+                initargs=(DatabaseManager.DATABASE_NAME,),
             )
-            for i in range(len(sorted_trades)):
-                sorted_trades[i].id = i + 1
+            cls.__executor_settings = settings
+        return cls.__executor
 
-            results.add(
-                "All",
-                StatisticsBuilder.build_strategy(
-                    sorted_trades,
-                    benchmark_results.total_performance.daily_statistics.returns,
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Stops the worker processes, they are spawned again by the next parallel work.
+        """
+        if cls.__executor is not None:
+            cls.__executor.shutdown()
+            cls.__executor = None
+
+    @classmethod
+    def __run_strategies(
+        cls,
+        models: List[StrategyModel],
+        benchmark_results: StatisticsResults,
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark],
+        starting_capital: float,
+        start_date: Date,
+        end_date: Date,
+        max_workers: int,
+    ) -> List[StatisticsResults]:
+        # Instruments are loaded once and shared by every strategy.
+        instruments: InstrumentRegistry = InstrumentRegistry.load()
+        benchmark_returns: Dict[Date, float] = (
+            benchmark_results.total_performance.daily_statistics.returns
+        )
+
+        # Reuse cached results of unchanged reports, only the others are simulated.
+        results: List[Union[StatisticsResults, None]] = [
+            ResultsCache.get(
+                f"{model.id}:{model.default_report_id}",
+                model.type,
+                starting_capital,
+                start_date,
+                end_date,
+                benchmark_symbol,
+                benchmark_returns,
+                instruments,
+                model.resolution,
+            )
+            for model in models
+        ]
+        missing_models: List[StrategyModel] = [
+            model for model, result in zip(models, results) if result is None
+        ]
+
+        if max_workers <= 1 or len(missing_models) <= 1:
+            missing_results: List[StatisticsResults] = [
+                cls.run_strategy(
+                    model,
+                    instruments,
+                    benchmark_returns,
                     starting_capital,
                     start_date,
                     end_date,
-                ),
-            )
-        results.add(f"Benchmark:{benchmark_symbol.value}", benchmark_results)
-        return results
+                )
+                for model in missing_models
+            ]
+        else:
+            # Strategies are independent, fan them out and keep the results in order.
+            executor: ProcessPoolExecutor = cls.get_executor(max_workers)
+
+            try:
+                futures: List[Future] = [
+                    executor.submit(
+                        cls.run_strategy,
+                        model,
+                        instruments,
+                        benchmark_returns,
+                        starting_capital,
+                        start_date,
+                        end_date,
+                    )
+                    for model in missing_models
+                ]
+                missing_results = [future.result() for future in futures]
+            except BrokenProcessPool:
+                # A crashed worker breaks the pool, the next analysis starts a new one.
+                cls.shutdown()
+                raise
+
+        # Results against benchmark prices which are not final yet are not kept.
+        if BenchmarkStore.is_complete(benchmark_symbol, start_date, end_date):
+            for model, statistics_results in zip(missing_models, missing_results):
+                ResultsCache.put(
+                    f"{model.id}:{model.default_report_id}",
+                    model.type,
+                    starting_capital,
+                    start_date,
+                    end_date,
+                    benchmark_symbol,
+                    benchmark_returns,
+                    instruments,
+                    model.resolution,
+                    statistics_results,
+                )
+
+        remaining_results: Iterator[StatisticsResults] = iter(missing_results)
+        return [
+            result if result is not None else next(remaining_results)
+            for result in results
+        ]
 
     @classmethod
     def __try_match_order(
@@ -188,22 +360,9 @@ class Analyzer:
         return e
 
     @classmethod
-    def __mock_matching(
-        cls, strategy: Strategy, instruments: List[Instrument], orders: List[Order]
-    ) -> None:
+    def __mock_matching(cls, strategy: Strategy, orders: Iterable[Order]) -> None:
         # Start runtime sumulation.
         for order in orders:
-            instrument: Union[Instrument, None] = next(
-                filter(
-                    lambda instrument: instrument.symbol == order.symbol, instruments
-                ),
-                None,
-            )
-
-            if instrument is None:
-                raise RuntimeError(
-                    f"No data avaliable for this instrument: {order.symbol}"
-                )
-
+            instrument: Instrument = strategy.instruments.get(order.symbol)
             e: OrderFilledEvent = cls.__try_match_order(strategy, instrument, order)
             strategy.on_order_filled(e)
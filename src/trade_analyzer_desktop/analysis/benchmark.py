@@ -1,69 +1,88 @@
-import time
-from typing import Dict, List
-from datetime import (
-    date as Date,
-    datetime as DateTime,
-    timezone as TimeZone,
-    timedelta as TimeDelta,
-)
+import hashlib
+from typing import Dict, Iterable, List, Tuple, Union
+from datetime import date as Date
 
-from yfinance import Ticker
-from pandas import DataFrame, Timestamp
+import numpy as np
 
 from .benchmark_symbol import BenchmarkSymbol
+from .yahoo_finance_benchmark_provider import YahooFinanceBenchmarkProvider
 
 
 class Benchmark:
+    EPOCH_ORDINAL: int = Date(1970, 1, 1).toordinal()
+
     @staticmethod
     def get_historical_prices(
-        benchmark_symbol: BenchmarkSymbol,
+        benchmark_symbol: Union[BenchmarkSymbol, str],
         start_date: Date = Date.min,
         end_date: Date = Date.today(),
     ):
-        benchmark_prices: Dict[Date, float] = {}
-        data_frame: DataFrame = Ticker(benchmark_symbol.value).history(
-            interval="1d",
-            start=start_date.strftime("%Y-%m-%d") if start_date else None,
-            end=end_date.strftime("%Y-%m-%d") if end_date else None,
+        return Benchmark.daily_returns(
+            YahooFinanceBenchmarkProvider().fetch_prices(
+                BenchmarkSymbol.to_symbol(benchmark_symbol), start_date, end_date
+            ),
+            start_date,
+            end_date,
         )
-        prices: Dict[Timestamp, float] = data_frame["Close"].to_dict()
-
-        for timestamp, price in prices.items():
-            original_timestamp = time.mktime(timestamp.timetuple())
-            dt = DateTime.fromtimestamp(original_timestamp)
-            utc_timestamp = dt.replace(tzinfo=TimeZone.utc).timestamp()
-            benchmark_prices[Date.fromtimestamp(utc_timestamp)] = price
-
-        return Benchmark.daily_returns(benchmark_prices, start_date, end_date)
 
     @staticmethod
     def daily_returns(
         prices: Dict[Date, float], start_date: Date, end_date: Date
     ) -> Dict[Date, float]:
-        returns: Dict[Date, float] = {}
-        periods: List[Date] = list(
-            filter(
-                lambda date: date >= start_date and date <= end_date,
-                list(prices.keys()),
-            )
+        dates, returns = Benchmark.get_daily_returns(prices, start_date, end_date)
+        return dict(zip(dates, returns.tolist()))
+
+    @staticmethod
+    def get_daily_returns(
+        prices: Dict[Date, float], start_date: Date, end_date: Date
+    ) -> Tuple[List[Date], np.ndarray]:
+        """
+        Dates between the start and end date (both inclusive) with their returns, the return of the first date is 0.
+        """
+        dates: np.ndarray = Benchmark.to_datetime64(prices.keys(), len(prices))
+        closes: np.ndarray = np.fromiter(
+            prices.values(), dtype=np.float64, count=len(prices)
         )
-        returns[periods[0]] = 0
-        prev_date: Date = periods[0] - TimeDelta(days=1)
+        order: np.ndarray = np.argsort(dates, kind="stable")
+        dates, closes = dates[order], closes[order]
 
-        for current_date in periods:
-            prev_price: float = 0
-            has_previous: bool = False
+        is_in_range: np.ndarray = (dates >= np.datetime64(start_date, "D")) & (
+            dates <= np.datetime64(end_date, "D")
+        )
+        dates, closes = dates[is_in_range], closes[is_in_range]
+
+        if len(dates) == 0:
+            raise ValueError(f"No prices between {start_date} and {end_date}.")
 
-            prev_price = prices.get(prev_date, 0)
+        returns: np.ndarray = np.zeros(len(closes))
+        np.divide(
+            closes[1:] - closes[:-1],
+            closes[:-1],
+            out=returns[1:],
+            where=closes[:-1] != 0,
+        )
 
-            if prev_price != 0:
-                has_previous = True
+        # A date after a zero price has no return.
+        is_kept: np.ndarray = np.concatenate(([True], closes[:-1] != 0))
+        return dates[is_kept].tolist(), returns[is_kept]
 
-            if has_previous and prev_price != 0:
-                daily_returns: float = (prices[current_date] - prev_price) / prev_price
-                returns[current_date] = daily_returns
+    @staticmethod
+    def to_datetime64(dates: Iterable[Date], count: int) -> np.ndarray:
+        """
+        Converts dates to datetime64[D] through their ordinals, which is much faster than converting date objects one by one.
+        """
+        return (
+            np.fromiter(map(Date.toordinal, dates), dtype=np.int64, count=count)
+            - Benchmark.EPOCH_ORDINAL
+        ).astype("datetime64[D]")
 
-            elif has_previous:
-                returns[current_date] = 0
-            prev_date = current_date
-        return returns
+    @staticmethod
+    def get_digest(returns: Dict[Date, float]) -> str:
+        """
+        Digest of the dates and values of daily returns, which changes whenever the benchmark data does.
+        """
+        dates: np.ndarray = Benchmark.to_datetime64(returns.keys(), len(returns))
+        values: np.ndarray = np.fromiter(
+            returns.values(), dtype=np.float64, count=len(returns)
+        )
+        return hashlib.sha1(dates.tobytes() + values.tobytes()).hexdigest()
@@ -1,6 +1,8 @@
+from typing import Dict, Union
 from datetime import date as Date
 
 from .benchmark_symbol import BenchmarkSymbol
+from .composite_benchmark import CompositeBenchmark
 from .daily_statistics import DailyStatistics
 from .daily_statistics_builder import DailyStatisticsBuilder
 
@@ -8,15 +10,21 @@ from .daily_statistics_builder import DailyStatisticsBuilder
 class BenchmarkPerformance:
     def __init__(
         self,
-        benchmark_symbol: BenchmarkSymbol,
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark],
         starting_capital: float,
         start_date: Date,
         end_date: Date,
+        returns: Union[Dict[Date, float], None] = None,
     ):
+        # Daily returns which are already fetched are reused, e.g. by sub-period analysis.
         self.__daily_statistics: DailyStatistics = (
             DailyStatisticsBuilder.build_benchmark(
                 benchmark_symbol, starting_capital, start_date, end_date
             )
+            if returns is None
+            else DailyStatisticsBuilder.build_benchmark_returns(
+                returns, starting_capital
+            )
         )
 
     @property
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+from datetime import date as Date
+
+
+class BenchmarkProvider(ABC):
+    """
+    Source of daily close prices of benchmark symbols.
+    """
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def is_remote(self) -> bool:
+        """
+        Prices of remote providers are kept in the local benchmark store, others are read on every analysis.
+        """
+        return False
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    @abstractmethod
+    def has_symbol(self, symbol: str) -> bool: ...
+
+    @abstractmethod
+    def get_symbols(self) -> List[str]:
+        """
+        Symbols which are known to be available.
+        """
+        ...
+
+    @abstractmethod
+    def fetch_prices(
+        self, symbol: str, start_date: Date, end_date: Date
+    ) -> Dict[Date, float]:
+        """
+        Daily close prices between the start and end date (both inclusive) in date order.
+        """
+        ...
@@ -0,0 +1,84 @@
+from collections import OrderedDict
+from typing import Tuple, Union
+from datetime import date as Date
+
+from .benchmark_symbol import BenchmarkSymbol
+from .composite_benchmark import CompositeBenchmark
+from .statistics_results import StatisticsResults
+
+
+class BenchmarkStatisticsCache:
+    """
+    Process-wide LRU of benchmark statistics results, keyed by symbol, starting capital, dates and a digest of the benchmark returns.
+    """
+
+    MAX_SIZE: int = 8
+
+    __entries: "OrderedDict[Tuple[str, float, Date, Date, str], StatisticsResults]" = (
+        OrderedDict()
+    )
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    @classmethod
+    def get(
+        cls,
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark],
+        starting_capital: float,
+        start_date: Date,
+        end_date: Date,
+        returns_digest: str,
+    ) -> Union[StatisticsResults, None]:
+        key: Tuple[str, float, Date, Date, str] = cls.__get_key(
+            benchmark_symbol, starting_capital, start_date, end_date, returns_digest
+        )
+        statistics_results: Union[StatisticsResults, None] = cls.__entries.get(key)
+
+        if statistics_results is not None:
+            cls.__entries.move_to_end(key)
+        return statistics_results
+
+    @classmethod
+    def put(
+        cls,
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark],
+        starting_capital: float,
+        start_date: Date,
+        end_date: Date,
+        returns_digest: str,
+        statistics_results: StatisticsResults,
+    ) -> None:
+        """
+        Adds results as the most recently used entry, the least recently used ones are evicted beyond the max size.
+        """
+        key: Tuple[str, float, Date, Date, str] = cls.__get_key(
+            benchmark_symbol, starting_capital, start_date, end_date, returns_digest
+        )
+        cls.__entries[key] = statistics_results
+        cls.__entries.move_to_end(key)
+
+        while len(cls.__entries) > cls.MAX_SIZE:
+            cls.__entries.popitem(last=False)
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Drops every entry, e.g. after benchmark prices are changed.
+        """
+        cls.__entries.clear()
+
+    # -------------------------------------------------- Private Methods --------------------------------------------------
+    @staticmethod
+    def __get_key(
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark],
+        starting_capital: float,
+        start_date: Date,
+        end_date: Date,
+        returns_digest: str,
+    ) -> Tuple[str, float, Date, Date, str]:
+        return (
+            BenchmarkSymbol.to_symbol(benchmark_symbol),
+            float(starting_capital),
+            start_date,
+            end_date,
+            returns_digest,
+        )
@@ -0,0 +1,233 @@
+from typing import Dict, List, Tuple, Union
+from datetime import date as Date, datetime as DateTime, timedelta as TimeDelta
+
+from ..repositories import BenchmarkPriceRepository
+from .benchmark_provider import BenchmarkProvider
+from .benchmark_symbol import BenchmarkSymbol
+from .composite_benchmark import CompositeBenchmark
+from .yahoo_finance_benchmark_provider import YahooFinanceBenchmarkProvider
+
+
+class BenchmarkStore:
+    """
+    Local store of benchmark close prices, only dates which have never been fetched are requested from remote providers.
+    """
+
+    DIRECTORY: str = "benchmarks"  # Price files which are served as benchmarks.
+
+    is_offline: bool = False  # Serve prices from the store only, without fetching.
+
+    # Today's close is not final, so it is fetched again once it is older than this.
+    TODAY_REFRESH_INTERVAL: TimeDelta = TimeDelta(minutes=15)
+
+    # Time when the remote provider of a symbol last answered for today.
+    __today_fetched_at: Dict[str, DateTime] = {}
+
+    # Providers are asked in order, the first one which has a symbol serves it.
+    __providers: List[BenchmarkProvider] = [YahooFinanceBenchmarkProvider()]
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    @classmethod
+    def set_providers(cls, providers: List[BenchmarkProvider]) -> None:
+        cls.__providers = list(providers)
+
+    @classmethod
+    def register_provider(cls, provider: BenchmarkProvider) -> None:
+        """
+        Adds a provider which takes precedence over those registered before it.
+        """
+        cls.__providers.insert(0, provider)
+
+    @classmethod
+    def get_provider(cls, symbol: str) -> Union[BenchmarkProvider, None]:
+        for provider in cls.__providers:
+            if provider.has_symbol(symbol):
+                return provider
+        return None
+
+    @classmethod
+    def get_symbols(cls) -> List[str]:
+        """
+        Symbols of every provider without duplicates, in the order of providers.
+        """
+        symbols: Dict[str, None] = {}
+
+        for provider in cls.__providers:
+            symbols.update(dict.fromkeys(provider.get_symbols()))
+        return list(symbols.keys())
+
+    @classmethod
+    def get_prices(
+        cls,
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark],
+        start_date: Date,
+        end_date: Date,
+    ) -> Dict[Date, float]:
+        """
+        Returns close prices between the start and end date (both inclusive). Prices of remote providers are served from the store, missing dates are fetched first unless offline.
+        A composite benchmark is valued from the prices of its symbols.
+        """
+        if isinstance(benchmark_symbol, CompositeBenchmark):
+            return benchmark_symbol.build_prices(
+                {
+                    symbol: cls.get_prices(symbol, start_date, end_date)
+                    for symbol in benchmark_symbol.symbols
+                }
+            )
+
+        symbol: str = BenchmarkSymbol.to_symbol(benchmark_symbol)
+        provider: Union[BenchmarkProvider, None] = cls.get_provider(symbol)
+        prices: Dict[Date, float] = {}
+
+        if provider is not None and not provider.is_remote:
+            prices = provider.fetch_prices(symbol, start_date, end_date)
+        else:
+            if provider is not None and not cls.is_offline:
+                cls.__refresh(provider, symbol, start_date, end_date)
+
+            prices = BenchmarkPriceRepository.query_by_symbol_and_date_range(
+                symbol, start_date, end_date
+            )
+
+        if len(prices) == 0:
+            raise RuntimeError(
+                f"No {symbol} prices are available between {start_date} and {end_date}."
+            )
+        return prices
+
+    @classmethod
+    def refresh(
+        cls,
+        benchmark_symbol: Union[BenchmarkSymbol, str],
+        start_date: Date,
+        end_date: Date,
+    ) -> None:
+        """
+        Fetches prices of dates out of the stored range from the remote provider of a symbol.
+        """
+        symbol: str = BenchmarkSymbol.to_symbol(benchmark_symbol)
+        provider: Union[BenchmarkProvider, None] = cls.get_provider(symbol)
+
+        if provider is not None and provider.is_remote:
+            cls.__refresh(provider, symbol, start_date, end_date)
+
+    @classmethod
+    def is_complete(
+        cls,
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark],
+        start_date: Date,
+        end_date: Date,
+    ) -> bool:
+        """
+        Whether the provider has answered for every date between the start and end date. Prices of remote providers are not complete when a date has never been fetched, e.g. offline or after a failed fetch.
+        Today's close counts once it has been fetched today, results built from it are told apart by the returns they depend on.
+        """
+        if isinstance(benchmark_symbol, CompositeBenchmark):
+            return all(
+                cls.is_complete(symbol, start_date, end_date)
+                for symbol in benchmark_symbol.symbols
+            )
+
+        symbol: str = BenchmarkSymbol.to_symbol(benchmark_symbol)
+        provider: Union[BenchmarkProvider, None] = cls.get_provider(symbol)
+
+        if provider is None:
+            return False
+
+        if not provider.is_remote:
+            return True
+
+        today: Date = Date.today()
+        end_date = min(end_date, today)
+        stored_range: Union[Tuple[Date, Date], None] = (
+            BenchmarkPriceRepository.query_range_by_symbol(symbol)
+        )
+
+        if stored_range is None or start_date < stored_range[0]:
+            return False
+
+        if end_date <= stored_range[1]:
+            return True
+        return (
+            end_date == today
+            and stored_range[1] == today - TimeDelta(days=1)
+            and cls.__is_today_fetched(symbol, TimeDelta(days=1))
+        )
+
+    # -------------------------------------------------- Private Methods --------------------------------------------------
+    @classmethod
+    def __refresh(
+        cls,
+        provider: BenchmarkProvider,
+        symbol: str,
+        start_date: Date,
+        end_date: Date,
+    ) -> None:
+        """
+        Stored prices are kept when the provider fails.
+        """
+        # Today's close is not final, so the stored range ends yesterday at the latest.
+        today: Date = Date.today()
+        end_date = min(end_date, today)
+
+        if start_date > end_date:
+            return
+
+        stored_range: Union[Tuple[Date, Date], None] = (
+            BenchmarkPriceRepository.query_range_by_symbol(symbol)
+        )
+        missing_ranges: List[Tuple[Date, Date]] = []
+
+        if stored_range is None:
+            missing_ranges.append((start_date, end_date))
+        else:
+            # The stored range is kept contiguous, so a gap to it is fetched as well.
+            if start_date < stored_range[0]:
+                missing_ranges.append((start_date, stored_range[0] - TimeDelta(days=1)))
+
+            # Only today is missing once the stored range ends yesterday, which is not fetched again too often.
+            if end_date > stored_range[1] and not (
+                end_date == today
+                and stored_range[1] == today - TimeDelta(days=1)
+                and cls.__is_today_fetched(symbol, cls.TODAY_REFRESH_INTERVAL)
+            ):
+                missing_ranges.append((stored_range[1] + TimeDelta(days=1), end_date))
+
+        for missing_start_date, missing_end_date in missing_ranges:
+            try:
+                prices: Dict[Date, float] = provider.fetch_prices(
+                    symbol, missing_start_date, missing_end_date
+                )
+            except Exception as exception:
+                print(
+                    f"Failed to fetch {symbol} prices, stored prices are used: {exception}"
+                )
+                return
+
+            if not BenchmarkPriceRepository.insert_batch(symbol, prices):
+                return
+
+            if missing_end_date == today:
+                cls.__today_fetched_at[symbol] = DateTime.now()
+
+            stored_start_date: Date = missing_start_date
+            stored_end_date: Date = min(missing_end_date, today - TimeDelta(days=1))
+
+            if stored_range is not None:
+                stored_start_date = min(stored_start_date, stored_range[0])
+                stored_end_date = max(stored_end_date, stored_range[1])
+
+            if stored_start_date <= stored_end_date:
+                stored_range = (stored_start_date, stored_end_date)
+                BenchmarkPriceRepository.update_range(
+                    symbol, stored_start_date, stored_end_date
+                )
+
+    @classmethod
+    def __is_today_fetched(cls, symbol: str, max_age: TimeDelta) -> bool:
+        fetched_at: Union[DateTime, None] = cls.__today_fetched_at.get(symbol)
+        return (
+            fetched_at is not None
+            and fetched_at.date() == Date.today()
+            and DateTime.now() - fetched_at < max_age
+        )
@@ -1,4 +1,8 @@
 from enum import Enum
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from .composite_benchmark import CompositeBenchmark
 
 
 class BenchmarkSymbol(Enum):
@@ -6,3 +10,14 @@ class BenchmarkSymbol(Enum):
     SPY = "SPY"
     AGG = "AGG"
     GLD = "GLD"
+
+    @staticmethod
+    def to_symbol(
+        benchmark_symbol: Union["BenchmarkSymbol", str, "CompositeBenchmark"],
+    ) -> str:
+        """
+        Symbol of a preset or composite benchmark, symbols of other benchmarks are given as strings.
+        """
+        if isinstance(benchmark_symbol, str):
+            return benchmark_symbol
+        return benchmark_symbol.value
@@ -0,0 +1,129 @@
+from typing import Dict, List, Union
+from datetime import date as Date
+
+import numpy as np
+
+from .benchmark import Benchmark
+from .benchmark_symbol import BenchmarkSymbol
+from .period import Period
+from .periodical_statistics_builder import PeriodicalStatisticsBuilder
+
+
+class CompositeBenchmark:
+    """
+    Weighted basket of benchmark symbols, which is rebalanced to its weights at the close of every period.
+    """
+
+    def __init__(
+        self,
+        weights: Dict[Union[BenchmarkSymbol, str], float],
+        rebalance_period: Union[Period, None] = Period.Monthly,
+    ) -> None:
+        """
+        Weights are normalized to sum to 1, the basket is held without rebalancing when the period is None.
+        """
+        if len(weights) == 0:
+            raise ValueError("Composite benchmark has no symbols.")
+
+        if any(weight < 0 for weight in weights.values()):
+            raise ValueError("Weights of composite benchmark must not be negative.")
+
+        total_weight: float = sum(weights.values())
+
+        if total_weight <= 0:
+            raise ValueError("Weights of composite benchmark must sum to more than 0.")
+
+        self.__weights: Dict[str, float] = {
+            BenchmarkSymbol.to_symbol(symbol): weight / total_weight
+            for symbol, weight in weights.items()
+        }
+        self.__rebalance_period: Union[Period, None] = rebalance_period
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def weights(self) -> Dict[str, float]:
+        return self.__weights
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self.__weights.keys())
+
+    @property
+    def rebalance_period(self) -> Union[Period, None]:
+        return self.__rebalance_period
+
+    @property
+    def value(self) -> str:
+        """
+        Symbol which identifies the basket, as the value of a preset benchmark symbol does.
+        Weights are written in full precision, so different baskets never share a symbol.
+        """
+        components: str = " + ".join(
+            f"{weight!r} {symbol}" for symbol, weight in self.__weights.items()
+        )
+        rebalance: str = (
+            self.__rebalance_period.value
+            if self.__rebalance_period is not None
+            else "Buy and Hold"
+        )
+        return f"{components} ({rebalance})"
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    def build_prices(self, prices: Dict[str, Dict[Date, float]]) -> Dict[Date, float]:
+        """
+        Value of the basket from close prices of every symbol, starting at 1 on the first date all symbols have prices.
+        Dates of any symbol are used, a symbol without a price on a date keeps its previous close.
+        """
+        symbol_dates: List[np.ndarray] = [
+            Benchmark.to_datetime64(prices[symbol].keys(), len(prices[symbol]))
+            for symbol in self.symbols
+        ]
+        first_date: np.datetime64 = max(dates.min() for dates in symbol_dates)
+        dates: np.ndarray = np.unique(np.concatenate(symbol_dates))
+        dates = dates[dates >= first_date]
+
+        # Closes of each symbol are carried forward to the dates of the basket.
+        closes: np.ndarray = np.empty((len(dates), len(self.symbols)))
+
+        for column, symbol in enumerate(self.symbols):
+            order: np.ndarray = np.argsort(symbol_dates[column], kind="stable")
+            sorted_dates: np.ndarray = symbol_dates[column][order]
+            sorted_closes: np.ndarray = np.fromiter(
+                prices[symbol].values(), dtype=np.float64, count=len(order)
+            )[order]
+            closes[:, column] = sorted_closes[
+                np.searchsorted(sorted_dates, dates, side="right") - 1
+            ]
+
+        # Each segment between rebalances grows from the close where it was rebalanced.
+        segment_ids: np.ndarray = self.__get_segment_ids(dates)
+        is_segment_start: np.ndarray = np.concatenate(
+            ([True], segment_ids[1:] != segment_ids[:-1])
+        )
+        anchors: np.ndarray = np.maximum(np.flatnonzero(is_segment_start) - 1, 0)
+        anchor_indices: np.ndarray = anchors[np.cumsum(is_segment_start) - 1]
+
+        growth: np.ndarray = (closes / closes[anchor_indices]) @ np.fromiter(
+            self.__weights.values(), dtype=np.float64, count=len(self.__weights)
+        )
+
+        # Value at the end of every segment carries into the next one.
+        is_segment_end: np.ndarray = np.append(is_segment_start[1:], True)
+        segment_values: np.ndarray = np.concatenate(
+            ([1.0], np.cumprod(growth[is_segment_end])[:-1])
+        )
+        values: np.ndarray = segment_values[np.cumsum(is_segment_start) - 1] * growth
+        return dict(zip(dates.tolist(), values.tolist()))
+
+    # -------------------------------------------------- Private Methods --------------------------------------------------
+    def __get_segment_ids(self, dates: np.ndarray) -> np.ndarray:
+        """
+        Dates of the same segment are held between two rebalances.
+        """
+        if self.__rebalance_period is None:
+            return np.zeros(len(dates), dtype=np.int64)
+
+        months_per_period: int = PeriodicalStatisticsBuilder.MONTHS_PER_PERIOD[
+            self.__rebalance_period
+        ]
+        return dates.astype("datetime64[M]").astype(np.int64) // months_per_period
@@ -0,0 +1,32 @@
+from typing import Dict, List, Union
+
+import numpy as np
+
+from .analysis_results import AnalysisResults
+from .correlation_matrix import CorrelationMatrix
+from .correlation_matrix_builder import CorrelationMatrixBuilder
+from .correlation_method import CorrelationMethod
+
+
+class CorrelationMatrices:
+    """
+    The class represents correlation matrices of analysis results, the returns are aligned once and each method is built on first access.
+    """
+
+    def __init__(self, results: AnalysisResults) -> None:
+        self.__results: AnalysisResults = results
+        self.__keys: List[str] = []
+        self.__returns: Union[np.ndarray, None] = None
+        self.__matrices: Dict[CorrelationMethod, CorrelationMatrix] = {}
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    def get(self, method: CorrelationMethod) -> CorrelationMatrix:
+        if method not in self.__matrices:
+            if self.__returns is None:
+                self.__keys, self.__returns = CorrelationMatrixBuilder.build_returns(
+                    self.__results
+                )
+            self.__matrices[method] = CorrelationMatrixBuilder.build(
+                method, self.__keys, self.__returns
+            )
+        return self.__matrices[method]
@@ -0,0 +1,39 @@
+from typing import Dict, List
+
+import numpy as np
+
+from .correlation_method import CorrelationMethod
+
+
+class CorrelationMatrix:
+    """
+    The class represents pairwise correlations of the daily returns of result keys.
+    """
+
+    def __init__(
+        self, method: CorrelationMethod, keys: List[str], values: np.ndarray
+    ) -> None:
+        self.__method: CorrelationMethod = method
+        self.__keys: List[str] = keys
+        self.__indices: Dict[str, int] = {key: i for i, key in enumerate(keys)}
+        self.__values: np.ndarray = values
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def method(self) -> CorrelationMethod:
+        return self.__method
+
+    @property
+    def keys(self) -> List[str]:
+        return self.__keys
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Symmetric matrix ordered by keys, 0 for series without variation.
+        """
+        return self.__values
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    def get(self, key1: str, key2: str) -> float:
+        return float(self.__values[self.__indices[key1], self.__indices[key2]])
@@ -0,0 +1,106 @@
+from typing import Dict, List, Tuple, Union
+from datetime import date as Date
+
+import numpy as np
+
+from .analysis_results import AnalysisResults
+from .correlation_matrix import CorrelationMatrix
+from .correlation_method import CorrelationMethod
+from .statistics_results import StatisticsResults
+
+
+class CorrelationMatrixBuilder:
+    @staticmethod
+    def build_returns(results: AnalysisResults) -> Tuple[List[str], np.ndarray]:
+        """
+        Aligns the daily returns of every result key into a matrix, a row per date and a column per key.
+        Dates without a return are counted as 0.
+        """
+        keys: List[str] = []
+        series: List[Dict[Date, float]] = []
+
+        for key in results.keys:
+            statistics_results: Union[StatisticsResults, None] = results.get(key)
+            assert statistics_results is not None
+            returns: Dict[Date, float] = (
+                statistics_results.total_performance.daily_statistics.returns
+            )
+
+            if len(returns) != 0:
+                keys.append(key)
+                series.append(returns)
+
+        dates: List[Date] = sorted(set().union(*series)) if series else []
+        date_indices: Dict[Date, int] = {date: i for i, date in enumerate(dates)}
+        matrix: np.ndarray = np.zeros((len(dates), len(keys)))
+
+        for column, returns in enumerate(series):
+            rows: np.ndarray = np.fromiter(
+                (date_indices[date] for date in returns.keys()),
+                dtype=np.int64,
+                count=len(returns),
+            )
+            matrix[rows, column] = np.fromiter(
+                returns.values(), dtype=np.float64, count=len(returns)
+            )
+        return keys, matrix
+
+    @classmethod
+    def build(
+        cls, method: CorrelationMethod, keys: List[str], returns: np.ndarray
+    ) -> CorrelationMatrix:
+        if method == CorrelationMethod.Pearson:
+            values: np.ndarray = cls.__correlate(returns - returns.mean(axis=0))
+        elif method == CorrelationMethod.Spearman:
+            ranks: np.ndarray = cls.__rank(returns)
+            values = cls.__correlate(ranks - ranks.mean(axis=0))
+        elif method == CorrelationMethod.Downside:
+            # Co-movement of the shortfalls below 0, not centered.
+            values = cls.__correlate(np.minimum(returns, 0))
+        else:
+            raise ValueError(f"Unsupported correlation method: {method}")
+        return CorrelationMatrix(method, keys, values)
+
+    @staticmethod
+    def __correlate(deviations: np.ndarray) -> np.ndarray:
+        """
+        Normalized cross products of every pair of columns in one matrix product.
+        """
+        norms: np.ndarray = np.sqrt(np.einsum("ij,ij->j", deviations, deviations))
+        has_variation: np.ndarray = norms != 0
+        scale: np.ndarray = np.divide(
+            1, norms, out=np.zeros_like(norms), where=has_variation
+        )
+        normalized: np.ndarray = deviations * scale
+        values: np.ndarray = np.clip(normalized.T @ normalized, -1, 1)
+        np.fill_diagonal(values, has_variation.astype(np.float64))
+        return values
+
+    @staticmethod
+    def __rank(values: np.ndarray) -> np.ndarray:
+        """
+        Ranks of each column from 1, tied values share their average rank.
+        """
+        number_of_rows: int = values.shape[0]
+        order: np.ndarray = np.argsort(values, axis=0, kind="stable")
+        sorted_values: np.ndarray = np.take_along_axis(values, order, axis=0)
+        positions: np.ndarray = np.arange(number_of_rows)[:, None]
+
+        # Each run of equal values spans from its first to its last position.
+        is_first: np.ndarray = np.ones(values.shape, dtype=bool)
+        is_first[1:] = sorted_values[1:] != sorted_values[:-1]
+        is_last: np.ndarray = np.ones(values.shape, dtype=bool)
+        is_last[:-1] = is_first[1:]
+
+        first_positions: np.ndarray = np.maximum.accumulate(
+            np.where(is_first, positions, 0), axis=0
+        )
+        last_positions: np.ndarray = np.minimum.accumulate(
+            np.where(is_last, positions, number_of_rows - 1)[::-1], axis=0
+        )[::-1]
+
+        ranks: np.ndarray = np.empty(values.shape)
+        np.put_along_axis(
+            ranks, order, (first_positions + last_positions) / 2 + 1, axis=0
+        )
+        return ranks
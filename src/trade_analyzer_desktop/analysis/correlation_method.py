@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class CorrelationMethod(Enum):
+    Pearson = "Pearson"
+    Spearman = "Spearman"
+    Downside = "Downside"  # Correlation of the returns below 0.
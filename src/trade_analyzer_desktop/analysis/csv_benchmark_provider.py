@@ -0,0 +1,12 @@
+import pandas as pd
+
+from .local_file_benchmark_provider import LocalFileBenchmarkProvider
+
+
+class CsvBenchmarkProvider(LocalFileBenchmarkProvider):
+    def __init__(self, directory: str) -> None:
+        super().__init__(directory, ".csv")
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    def read_data_frame(self, path: str) -> pd.DataFrame:
+        return pd.read_csv(path)
@@ -0,0 +1,103 @@
+from typing import Dict, List
+from datetime import date as Date
+
+import numpy as np
+
+from .trade_ledger import TradeLedger
+
+
+class DailyAggregation:
+    """
+    The class represents daily profit/loss, equity and drawdown series aggregated from a trade ledger.
+    """
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        profit_loss: np.ndarray,
+        starting_capital: float,
+    ) -> None:
+        self.__dates: np.ndarray = dates
+        self.__profit_loss: np.ndarray = profit_loss
+        self.__equity: np.ndarray = starting_capital + np.cumsum(profit_loss)
+
+        previous_equity: np.ndarray = np.concatenate(
+            ([starting_capital], self.__equity[:-1])
+        )
+        max_equity: np.ndarray = np.maximum.accumulate(
+            np.maximum(self.__equity, starting_capital)
+        )
+
+        self.__previous_equity: np.ndarray = previous_equity
+        self.__returns: np.ndarray = profit_loss / previous_equity
+        self.__cumulative_returns: np.ndarray = self.__equity / starting_capital - 1
+        self.__drawdown: np.ndarray = self.__equity - max_equity
+        self.__drawdown_percent: np.ndarray = self.__drawdown / max_equity
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def dates(self) -> np.ndarray:
+        """
+        Dates of the series as datetime64[D].
+        """
+        return self.__dates
+
+    @property
+    def profit_loss(self) -> np.ndarray:
+        return self.__profit_loss
+
+    @property
+    def previous_equity(self) -> np.ndarray:
+        """
+        Equity at the end of the previous day.
+        """
+        return self.__previous_equity
+
+    @property
+    def returns(self) -> np.ndarray:
+        return self.__returns
+
+    @property
+    def equity(self) -> np.ndarray:
+        return self.__equity
+
+    @property
+    def cumulative_returns(self) -> np.ndarray:
+        return self.__cumulative_returns
+
+    @property
+    def drawdown(self) -> np.ndarray:
+        return self.__drawdown
+
+    @property
+    def drawdown_percent(self) -> np.ndarray:
+        return self.__drawdown_percent
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    @classmethod
+    def from_ledger(
+        cls, ledger: TradeLedger, dates: List[Date], starting_capital: float
+    ) -> "DailyAggregation":
+        """
+        Group trades by exit date in one pass. Trades which exit on a date out of `dates` are not counted.
+        """
+        days: np.ndarray = np.array(dates, dtype="datetime64[D]")
+        exit_dates: np.ndarray = ledger.exit_date
+
+        # Dates are ascending, so each trade finds its day by binary search.
+        indices: np.ndarray = np.searchsorted(days, exit_dates)
+        is_matched: np.ndarray = indices < len(days)
+        is_matched[is_matched] = days[indices[is_matched]] == exit_dates[is_matched]
+
+        profit_loss: np.ndarray = np.bincount(
+            indices[is_matched],
+            weights=ledger.net_profit_loss[is_matched],
+            minlength=len(days),
+        ).astype(np.float64)
+        return cls(days, profit_loss, starting_capital)
+
+    def to_series(self, values: np.ndarray) -> Dict[Date, float]:
+        """
+        Convert values aligned with `dates` to series keyed by date.
+        """
+        return dict(zip(self.__dates.tolist(), values.tolist()))
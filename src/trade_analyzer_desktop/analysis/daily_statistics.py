@@ -19,6 +19,7 @@ class DailyStatistics:
         # Metrix
         self.total_returns: float = 0  # The total net profit percentage.
         self.sharpe_ratio: float = 0  # Sharpe ratio with respect to risk free instrest rate: measures excess of return per unit of risk.
+        self.sortino_ratio: float = 0  # Sortino ratio with respect to risk free interest rate: measures excess of return per unit of downside risk.
         self.max_drawdown: float = 0
         self.max_drawdown_percent: float = 0  # Drawdown maximum percentage.
         self.average_win_rate: float = 0  # Average rate of return for winning trades.
@@ -1,12 +1,18 @@
 import math
-from typing import List, Dict
+from typing import List, Dict, Union
 from datetime import date as Date
 
+import numpy as np
+
 from .benchmark import Benchmark
+from .benchmark_store import BenchmarkStore
 from .benchmark_symbol import BenchmarkSymbol
+from .composite_benchmark import CompositeBenchmark
+from .daily_aggregation import DailyAggregation
 from .daily_statistics import DailyStatistics
+from .statistics_kernels import StatisticsKernels
 from .strategy_daily_statistics import StrategyDailyStatistics
-from ..entities import Trade
+from .trade_ledger import TradeLedger
 
 
 class DailyStatisticsBuilder:
@@ -16,57 +22,36 @@ class DailyStatisticsBuilder:
     @classmethod
     def build_benchmark(
         cls,
-        benchmark_symbol: BenchmarkSymbol,
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark],
         starting_capital: float,
         start_date: Date,
         end_date: Date,
     ) -> DailyStatistics:
-        # Get benchmark daily returns from yahoo finance
-        returns: Dict[Date, float] = Benchmark.get_historical_prices(
-            benchmark_symbol, start_date, end_date
+        # Get benchmark daily returns from the local store, which fetches missing prices from yahoo finance
+        dates, returns = Benchmark.get_daily_returns(
+            BenchmarkStore.get_prices(benchmark_symbol, start_date, end_date),
+            start_date,
+            end_date,
         )
+        return cls.__build_benchmark(dates, returns, starting_capital)
 
-        # Calculate daily pnl/equity as $, cumulative return as %
-        first_date: Date = list(returns.keys())[0]
-
-        net_profit_loss: Dict[Date, float] = {first_date: 0}
-        equity: Dict[Date, float] = {first_date: starting_capital}
-        cumulative_returns: Dict[Date, float] = {first_date: 0}
-        drawdown: Dict[Date, float] = {first_date: 0}
-        drawdown_percent: Dict[Date, float] = {first_date: 0}
-
-        max_equity: float = starting_capital
-
-        prev_date: Date = first_date
-
-        for i in range(0, len(returns)):
-            current_date: Date = list(returns.keys())[i]
-            net_profit_loss[current_date] = equity[prev_date] * returns[current_date]
-            benchmark_current_equity: float = (
-                equity[prev_date] + net_profit_loss[current_date]
-            )
-            equity[current_date] = benchmark_current_equity
-            max_equity = max(max_equity, benchmark_current_equity)
-            cumulative_returns[current_date] = (
-                benchmark_current_equity / starting_capital - 1
-            )
-            drawdown[current_date] = benchmark_current_equity - max_equity
-            drawdown_percent[current_date] = drawdown[current_date] / max_equity
-            prev_date = current_date
-
-        daily_statistics: DailyStatistics = DailyStatistics()
-        daily_statistics.net_profit_loss = net_profit_loss
-        daily_statistics.returns = returns
-        daily_statistics.equity = equity
-        daily_statistics.cumulative_returns = cumulative_returns
-        daily_statistics.drawdown = drawdown
-        daily_statistics.drawdown_percent = drawdown_percent
-        return daily_statistics
+    @classmethod
+    def build_benchmark_returns(
+        cls, returns: Dict[Date, float], starting_capital: float
+    ) -> DailyStatistics:
+        """
+        Builds benchmark statistics of daily returns which are already fetched.
+        """
+        return cls.__build_benchmark(
+            list(returns.keys()),
+            np.fromiter(returns.values(), dtype=np.float64, count=len(returns)),
+            starting_capital,
+        )
 
     @classmethod
     def build_strategy(
         cls,
-        trades: List[Trade],
+        ledger: TradeLedger,
         benchmark_returns: Dict[Date, float],
         starting_capital: float,
         start_date: Date,
@@ -74,116 +59,89 @@ class DailyStatisticsBuilder:
     ) -> StrategyDailyStatistics:
         daily_statistics: StrategyDailyStatistics = StrategyDailyStatistics()
 
-        first_date: Date = list(benchmark_returns.keys())[0]
-
-        daily_trades: Dict[Date, List[Trade]] = {first_date: []}
-        profit_loss: Dict[Date, float] = {first_date: 0}
-        returns: Dict[Date, float] = {first_date: 0}
-        equity: Dict[Date, float] = {first_date: starting_capital}
-        cumulative_returns: Dict[Date, float] = {first_date: 0}
-        drawdown: Dict[Date, float] = {first_date: 0}
-        drawdown_percent: Dict[Date, float] = {first_date: 0}
-        max_equity: float = starting_capital
-        prev_date: Date = first_date
-
-        for i in range(0, len(benchmark_returns)):
-            current_date: Date = list(benchmark_returns.keys())[i]
-            daily_trades[current_date] = list(
-                filter(lambda trade: trade.exit_time.date() == current_date, trades)
-            )
-            profit_loss[current_date] = sum(
-                trade.net_profit_loss for trade in daily_trades[current_date]
-            )
-            returns[current_date] = profit_loss[current_date] / equity[prev_date]
-            current_equity: float = equity[prev_date] + profit_loss[current_date]
-            equity[current_date] = current_equity
-            max_equity = max(max_equity, current_equity)
-            cumulative_returns[current_date] = (current_equity / starting_capital) - 1
-            drawdown[current_date] = current_equity - max_equity
-            drawdown_percent[current_date] = drawdown[current_date] / max_equity
-            prev_date = current_date
-
-        daily_statistics.net_profit_loss = profit_loss
+        # Min amount of samples to calculate variance.
+        if starting_capital == 0 or len(benchmark_returns) < 2:
+            return daily_statistics
+
+        dates: List[Date] = list(benchmark_returns.keys())
+        aggregation: DailyAggregation = DailyAggregation.from_ledger(
+            ledger, dates, starting_capital
+        )
+
+        returns: Dict[Date, float] = aggregation.to_series(aggregation.returns)
+        daily_statistics.net_profit_loss = aggregation.to_series(
+            aggregation.profit_loss
+        )
         daily_statistics.returns = returns
-        daily_statistics.equity = equity
-        daily_statistics.cumulative_returns = cumulative_returns
-        daily_statistics.drawdown = drawdown
-        daily_statistics.drawdown_percent = drawdown_percent
+        daily_statistics.equity = aggregation.to_series(aggregation.equity)
+        daily_statistics.cumulative_returns = aggregation.to_series(
+            aggregation.cumulative_returns
+        )
+        daily_statistics.drawdown = aggregation.to_series(aggregation.drawdown)
+        daily_statistics.drawdown_percent = aggregation.to_series(
+            aggregation.drawdown_percent
+        )
 
-        # Min amount of samples to calculate variance.
-        if starting_capital == 0 or len(benchmark_returns) < 2 or len(returns) < 2:
-            return StrategyDailyStatistics()
-
-        running_capital: float = starting_capital
-        total_profit: float = 0
-        total_loss: float = 0
-        number_of_winning_days: int = 0
-        number_of_lossing_days: int = 0
-
-        for pnl in profit_loss.values():
-            trade_profit_loss: float = pnl
-
-            if pnl > 0:
-                total_profit += trade_profit_loss / running_capital
-                number_of_winning_days += 1
-            else:
-                total_loss += trade_profit_loss / running_capital
-                number_of_lossing_days += 1
-            running_capital += trade_profit_loss
+        is_winning_day: np.ndarray = aggregation.profit_loss > 0
+        number_of_winning_days: int = int(is_winning_day.sum())
+        number_of_lossing_days: int = len(is_winning_day) - number_of_winning_days
 
         daily_statistics.average_win_rate = (
-            total_profit / number_of_winning_days if number_of_winning_days != 0 else 0
+            float(aggregation.returns[is_winning_day].sum()) / number_of_winning_days
+            if number_of_winning_days != 0
+            else 0
         )  # -> avg profit
         daily_statistics.average_loss_rate = (
-            total_loss / number_of_lossing_days if number_of_lossing_days != 0 else 0
+            float(aggregation.returns[~is_winning_day].sum()) / number_of_lossing_days
+            if number_of_lossing_days != 0
+            else 0
         )  # -> avg loss
         daily_statistics.profit_loss_ratio = (
             daily_statistics.average_win_rate / abs(daily_statistics.average_loss_rate)
             if daily_statistics.average_loss_rate != 0
             else 0
         )
-        daily_statistics.win_rate = (
-            number_of_winning_days / len(profit_loss) if len(profit_loss) != 0 else 0
-        )
+        daily_statistics.win_rate = number_of_winning_days / len(is_winning_day)
 
         daily_statistics.expectancy = (
             daily_statistics.win_rate * daily_statistics.profit_loss_ratio
             - (1 - daily_statistics.win_rate)
         )
 
-        if starting_capital != 0:
-            daily_statistics.total_returns = (
-                list(equity.values())[-1] / starting_capital - 1
-            )
+        final_equity: float = float(aggregation.equity[-1])
+        daily_statistics.total_returns = final_equity / starting_capital - 1
 
-        fraction_of_years: float = (
-            list(equity.keys())[-1] - list(equity.keys())[0]
-        ).days / 365
+        fraction_of_years: float = (dates[-1] - dates[0]).days / 365
 
         daily_statistics.compounding_annual_return = cls.compounding_annual_returns(
-            starting_capital, list(equity.values())[-1], fraction_of_years
+            starting_capital, final_equity, fraction_of_years
         )
 
         # daily_statistics.max_drawdown_pct = cls.drawdown_percent(equity, 3)
-        daily_statistics.max_drawdown = min(drawdown.values())
-        daily_statistics.max_drawdown_percent = min(drawdown_percent.values())
+        daily_statistics.max_drawdown = float(aggregation.drawdown.min())
+        daily_statistics.max_drawdown_percent = float(
+            aggregation.drawdown_percent.min()
+        )
 
-        daily_statistics.annual_variance = cls.annual_variance(
-            list(returns.values()), cls.TRADING_DAYS_PER_YEAR
+        strategy_values: np.ndarray = aggregation.returns
+        benchmark_values: np.ndarray = np.fromiter(
+            benchmark_returns.values(), dtype=np.float64, count=len(benchmark_returns)
+        )
+
+        daily_statistics.annual_variance = StatisticsKernels.annual_variance(
+            strategy_values, cls.TRADING_DAYS_PER_YEAR
         )
         daily_statistics.annual_standard_deviation = math.sqrt(
             daily_statistics.annual_variance
         )
 
-        benchmark_annual_returns: float = cls.annual_returns(
-            list(benchmark_returns.values()), cls.TRADING_DAYS_PER_YEAR
-        )
-        benchmark_variance: float = cls.annual_variance(
-            list(benchmark_returns.values())
+        benchmark_annual_returns: float = StatisticsKernels.annual_returns(
+            benchmark_values, cls.TRADING_DAYS_PER_YEAR
         )
+        benchmark_variance: float = StatisticsKernels.annual_variance(benchmark_values)
 
-        annaul_returns: float = cls.annual_returns(
-            list(returns.values()), cls.TRADING_DAYS_PER_YEAR
+        annaul_returns: float = StatisticsKernels.annual_returns(
+            strategy_values, cls.TRADING_DAYS_PER_YEAR
         )
 
         daily_statistics.sharpe_ratio = (
@@ -193,8 +151,18 @@ class DailyStatisticsBuilder:
             else 0
         )
 
+        # Only daily returns below zero count as risk.
+        annual_downside_deviation: float = StatisticsKernels.downside_deviation(
+            strategy_values
+        ) * math.sqrt(cls.TRADING_DAYS_PER_YEAR)
+        daily_statistics.sortino_ratio = (
+            (annaul_returns - cls.RISK_FREE_INTEREST) / annual_downside_deviation
+            if annual_downside_deviation != 0
+            else 0
+        )
+
         daily_statistics.beta = (
-            cls.covariance(list(returns.values()), list(benchmark_returns.values()))
+            StatisticsKernels.covariance(strategy_values, benchmark_values)
             / benchmark_variance
             if benchmark_variance != 0
             else 0
@@ -211,10 +179,8 @@ class DailyStatisticsBuilder:
             else 0
         )
 
-        daily_statistics.tracking_error = cls.tracking_error(
-            list(returns.values()),
-            list(benchmark_returns.values()),
-            cls.TRADING_DAYS_PER_YEAR,
+        daily_statistics.tracking_error = StatisticsKernels.tracking_error(
+            strategy_values, benchmark_values, cls.TRADING_DAYS_PER_YEAR
         )
 
         daily_statistics.information_ratio = (
@@ -238,17 +204,11 @@ class DailyStatisticsBuilder:
         benchmark_returns: List[float],
         trading_days_per_year: int = 252,
     ):
-        if len(returns) != len(benchmark_returns):
-            return 0
-        performance_difference: List[float] = []
-
-        for i in range(0, len(returns)):
-            performance_difference.append(returns[i] - benchmark_returns[i])
-
-        annual_performance: float = cls.annual_returns(
-            performance_difference, trading_days_per_year
+        return StatisticsKernels.tracking_error(
+            np.array(returns, dtype=np.float64),
+            np.array(benchmark_returns, dtype=np.float64),
+            trading_days_per_year,
         )
-        return math.sqrt(annual_performance) if annual_performance >= 0 else 0
 
     @classmethod
     def compounding_annual_returns(
@@ -280,43 +240,55 @@ class DailyStatisticsBuilder:
     def annual_returns(
         cls, return_list: List[float], trading_days_per_year: int = 252
     ) -> float:
-        return (
-            math.pow(
-                DailyStatisticsBuilder.get_mean(return_list) + 1, trading_days_per_year
-            )
-            - 1
+        return StatisticsKernels.annual_returns(
+            np.array(return_list, dtype=np.float64), trading_days_per_year
         )
 
     @classmethod
     def annual_variance(
         cls, return_list: List[float], trading_days_per_year: int = 252
     ) -> float:
-        length: int = int(len(return_list))
-        mean: float = sum(return_list) / length
-        variance: float = sum((i - mean) ** 2 for i in return_list) / length
-        return variance * trading_days_per_year if variance != 0 else 0
+        return StatisticsKernels.annual_variance(
+            np.array(return_list, dtype=np.float64), trading_days_per_year
+        )
 
     @classmethod
     def get_mean(cls, values: List[float]) -> float:
-        return sum(values) / len(values)
+        return StatisticsKernels.mean(np.array(values, dtype=np.float64))
 
     @classmethod
     def covariance(cls, series1: List[float], series2: List[float]) -> float:
         if len(series1) != len(series2):
-            length = min([len(series1), len(series2)])
-            new_list1: List[float] = series1[0 : length - 1]
-            new_list2: List[float] = series2[0 : length - 1]
-            return sum(
-                (new_list1[i] - cls.get_mean(new_list1))
-                * (new_list2[i] - cls.get_mean(new_list2))
-                for i in range(0, len(new_list1))
-            ) / len(new_list2)
-        length = min([len(series1), len(series2)])
-        return (
-            sum(
-                (series1[i] - cls.get_mean(series1))
-                * (series2[i] - cls.get_mean(series2))
-                for i in range(0, length)
-            )
-            / length
+            # Series of different length are cut to the shorter one without its last sample.
+            length: int = min([len(series1), len(series2)]) - 1
+            series1 = series1[0:length]
+            series2 = series2[0:length]
+        return StatisticsKernels.covariance(
+            np.array(series1, dtype=np.float64), np.array(series2, dtype=np.float64)
         )
+
+    @classmethod
+    def __build_benchmark(
+        cls, dates: List[Date], returns: np.ndarray, starting_capital: float
+    ) -> DailyStatistics:
+        # Calculate daily pnl/equity as $, cumulative return as %
+        equity: np.ndarray = starting_capital * np.cumprod(1 + returns)
+        previous_equity: np.ndarray = np.concatenate(([starting_capital], equity[:-1]))
+        net_profit_loss: np.ndarray = previous_equity * returns
+        max_equity: np.ndarray = np.maximum.accumulate(
+            np.maximum(equity, starting_capital)
+        )
+        drawdown: np.ndarray = equity - max_equity
+
+        daily_statistics: DailyStatistics = DailyStatistics()
+        daily_statistics.net_profit_loss = dict(zip(dates, net_profit_loss.tolist()))
+        daily_statistics.returns = dict(zip(dates, returns.tolist()))
+        daily_statistics.equity = dict(zip(dates, equity.tolist()))
+        daily_statistics.cumulative_returns = dict(
+            zip(dates, (equity / starting_capital - 1).tolist())
+        )
+        daily_statistics.drawdown = dict(zip(dates, drawdown.tolist()))
+        daily_statistics.drawdown_percent = dict(
+            zip(dates, (drawdown / max_equity).tolist())
+        )
+        return daily_statistics
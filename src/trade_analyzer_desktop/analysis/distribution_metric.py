@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class DistributionMetric(Enum):
+    ProfitLoss = "Profit/Loss"
+    Returns = "Returns"
+    Duration = "Duration (Hours)"
+    RMultiple = "R-Multiple"
@@ -0,0 +1,41 @@
+from typing import Union
+from datetime import date as Date, timedelta as TimeDelta
+
+
+class DrawdownEpisode:
+    """
+    The class represents a drawdown from a peak of equity until it is recovered.
+    """
+
+    def __init__(
+        self,
+        peak_date: Date,
+        trough_date: Date,
+        recovery_date: Union[Date, None],
+        peak_equity: float,
+        trough_equity: float,
+        duration: TimeDelta,
+    ) -> None:
+        self.peak_date: Date = peak_date
+        self.trough_date: Date = trough_date
+        self.recovery_date: Union[Date, None] = (
+            recovery_date  # None if equity has not recovered at the end date.
+        )
+        self.peak_equity: float = peak_equity
+        self.trough_equity: float = trough_equity
+        self.duration: TimeDelta = (
+            duration  # From the peak to the recovery, or to the end date.
+        )
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def depth(self) -> float:
+        return self.trough_equity - self.peak_equity
+
+    @property
+    def depth_percent(self) -> float:
+        return self.trough_equity / self.peak_equity - 1
+
+    @property
+    def is_recovered(self) -> bool:
+        return self.recovery_date is not None
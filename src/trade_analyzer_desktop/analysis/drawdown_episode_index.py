@@ -0,0 +1,179 @@
+from typing import List
+from datetime import date as Date, timedelta as TimeDelta
+
+import numpy as np
+
+from .daily_statistics import DailyStatistics
+from .drawdown_episode import DrawdownEpisode
+
+
+class DrawdownEpisodeIndex:
+    """
+    The class represents the drawdown episodes of an equity series as parallel columns, ordered by peak date.
+
+    Episodes are also ranked by depth when the index is built, so queries do not scan the equity again.
+    """
+
+    def __init__(
+        self,
+        peak_date: np.ndarray,
+        trough_date: np.ndarray,
+        recovery_date: np.ndarray,
+        peak_equity: np.ndarray,
+        trough_equity: np.ndarray,
+        end_date: np.datetime64,
+        number_of_days: int,
+    ) -> None:
+        self.__peak_date: np.ndarray = peak_date
+        self.__trough_date: np.ndarray = trough_date
+        self.__recovery_date: np.ndarray = recovery_date
+        self.__peak_equity: np.ndarray = peak_equity
+        self.__trough_equity: np.ndarray = trough_equity
+        self.__depth: np.ndarray = trough_equity - peak_equity
+        self.__depth_percent: np.ndarray = trough_equity / peak_equity - 1
+        self.__duration: np.ndarray = (
+            np.where(np.isnat(recovery_date), end_date, recovery_date) - peak_date
+        ).astype(np.int64)
+        self.__number_of_days: int = number_of_days
+
+        # Deepest first, earlier episodes first on ties.
+        self.__ranks: np.ndarray = np.argsort(self.__depth_percent, kind="stable")
+
+    def __len__(self) -> int:
+        return len(self.__peak_date)
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def episodes(self) -> List[DrawdownEpisode]:
+        return [self.get(i) for i in range(len(self))]
+
+    @property
+    def depth(self) -> np.ndarray:
+        return self.__depth
+
+    @property
+    def depth_percent(self) -> np.ndarray:
+        return self.__depth_percent
+
+    @property
+    def duration(self) -> np.ndarray:
+        """
+        Duration of each episode in days.
+        """
+        return self.__duration
+
+    @property
+    def average_depth(self) -> float:
+        return float(self.__depth.mean()) if len(self) != 0 else 0
+
+    @property
+    def average_depth_percent(self) -> float:
+        return float(self.__depth_percent.mean()) if len(self) != 0 else 0
+
+    @property
+    def time_under_water(self) -> TimeDelta:
+        """
+        Total duration of the episodes.
+        """
+        return TimeDelta(days=int(self.__duration.sum()))
+
+    @property
+    def time_under_water_ratio(self) -> float:
+        """
+        Ratio of the days below a previous peak to all days.
+        """
+        return (
+            float(self.__duration.sum()) / self.__number_of_days
+            if self.__number_of_days != 0
+            else 0
+        )
+
+    @property
+    def longest_duration(self) -> TimeDelta:
+        return TimeDelta(days=int(self.__duration.max(initial=0)))
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    @classmethod
+    def from_daily_statistics(
+        cls, daily_statistics: DailyStatistics, starting_capital: float
+    ) -> "DrawdownEpisodeIndex":
+        return cls.build(
+            list(daily_statistics.equity.keys()),
+            np.fromiter(
+                daily_statistics.equity.values(),
+                dtype=np.float64,
+                count=len(daily_statistics.equity),
+            ),
+            starting_capital,
+        )
+
+    @classmethod
+    def build(
+        cls, dates: List[Date], equity: np.ndarray, starting_capital: float
+    ) -> "DrawdownEpisodeIndex":
+        """
+        Builds the index in one pass over the equity, the starting capital is the peak at the first date.
+        """
+        if len(dates) == 0:
+            empty_dates: np.ndarray = np.zeros(0, dtype="datetime64[D]")
+            return DrawdownEpisodeIndex(
+                empty_dates,
+                empty_dates,
+                empty_dates,
+                np.zeros(0),
+                np.zeros(0),
+                np.datetime64("NaT", "D"),
+                0,
+            )
+
+        days: np.ndarray = np.array(dates, dtype="datetime64[D]")
+        days = np.concatenate((days[:1], days))
+        values: np.ndarray = np.concatenate(([starting_capital], equity))
+        max_values: np.ndarray = np.maximum.accumulate(values)
+        is_underwater: np.ndarray = values < max_values
+        was_underwater: np.ndarray = np.concatenate(([False], is_underwater[:-1]))
+
+        starts: np.ndarray = np.flatnonzero(is_underwater & ~was_underwater)
+        recoveries: np.ndarray = np.flatnonzero(~is_underwater & was_underwater)
+
+        # Underwater days are grouped by episode, the first of each group after sorting by equity is the trough.
+        underwater_indices: np.ndarray = np.flatnonzero(is_underwater)
+        episode_ids: np.ndarray = np.cumsum((is_underwater & ~was_underwater))[
+            underwater_indices
+        ]
+        order: np.ndarray = np.lexsort((values[underwater_indices], episode_ids))
+        sorted_episode_ids: np.ndarray = episode_ids[order]
+        first_of_episode: np.ndarray = sorted_episode_ids != np.concatenate(
+            ([0], sorted_episode_ids[:-1])
+        )
+        troughs: np.ndarray = underwater_indices[order][first_of_episode]
+
+        recovery_date: np.ndarray = np.full(len(starts), np.datetime64("NaT", "D"))
+        recovery_date[: len(recoveries)] = days[recoveries]
+
+        return DrawdownEpisodeIndex(
+            days[starts - 1],
+            days[troughs],
+            recovery_date,
+            values[starts - 1],
+            values[troughs],
+            days[-1],
+            int((days[-1] - days[0]).astype(np.int64)),
+        )
+
+    def get(self, index: int) -> DrawdownEpisode:
+        recovery_date: np.datetime64 = self.__recovery_date[index]
+        return DrawdownEpisode(
+            self.__peak_date[index].item(),
+            self.__trough_date[index].item(),
+            recovery_date.item() if not np.isnat(recovery_date) else None,
+            float(self.__peak_equity[index]),
+            float(self.__trough_equity[index]),
+            TimeDelta(days=int(self.__duration[index])),
+        )
+
+    def top(self, n: int) -> List[DrawdownEpisode]:
+        """
+        The n deepest episodes by depth percentage.
+        """
+        return [self.get(int(i)) for i in self.__ranks[:n]]
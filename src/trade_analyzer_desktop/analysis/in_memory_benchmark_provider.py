@@ -0,0 +1,32 @@
+from typing import Dict, List
+from datetime import date as Date
+
+from .benchmark_provider import BenchmarkProvider
+
+
+class InMemoryBenchmarkProvider(BenchmarkProvider):
+    """
+    Serves prices which are given in process, so analyses run without network or files.
+    """
+
+    def __init__(self, prices: Dict[str, Dict[Date, float]]) -> None:
+        self.__prices: Dict[str, Dict[Date, float]] = {
+            symbol: dict(sorted(symbol_prices.items()))
+            for symbol, symbol_prices in prices.items()
+        }
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    def has_symbol(self, symbol: str) -> bool:
+        return symbol in self.__prices
+
+    def get_symbols(self) -> List[str]:
+        return list(self.__prices.keys())
+
+    def fetch_prices(
+        self, symbol: str, start_date: Date, end_date: Date
+    ) -> Dict[Date, float]:
+        return {
+            date: price
+            for date, price in self.__prices.get(symbol, {}).items()
+            if start_date <= date <= end_date
+        }
@@ -0,0 +1,86 @@
+import numpy as np
+
+from ..enums import Resolution
+
+
+class IntradayEquity:
+    """
+    The class represents closed-trade equity and drawdown at the end of each bar with exits, as parallel arrays.
+    """
+
+    def __init__(
+        self,
+        resolution: Resolution,
+        starting_capital: float,
+        timestamps: np.ndarray,
+        equity: np.ndarray,
+        drawdown: np.ndarray,
+        drawdown_percent: np.ndarray,
+    ) -> None:
+        self.__resolution: Resolution = resolution
+        self.__starting_capital: float = starting_capital
+        self.__timestamps: np.ndarray = timestamps
+        self.__equity: np.ndarray = equity
+        self.__drawdown: np.ndarray = drawdown
+        self.__drawdown_percent: np.ndarray = drawdown_percent
+
+    def __len__(self) -> int:
+        return len(self.__timestamps)
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def resolution(self) -> Resolution:
+        return self.__resolution
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """
+        Start date/time of each bar as datetime64[s].
+        """
+        return self.__timestamps
+
+    @property
+    def equity(self) -> np.ndarray:
+        return self.__equity
+
+    @property
+    def cumulative_returns(self) -> np.ndarray:
+        return self.__equity / self.__starting_capital - 1
+
+    @property
+    def drawdown(self) -> np.ndarray:
+        return self.__drawdown
+
+    @property
+    def drawdown_percent(self) -> np.ndarray:
+        return self.__drawdown_percent
+
+    @property
+    def max_drawdown(self) -> float:
+        return float(self.__drawdown.min(initial=0))
+
+    @property
+    def max_drawdown_percent(self) -> float:
+        return float(self.__drawdown_percent.min(initial=0))
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    def downsample(self, max_points: int) -> "IntradayEquity":
+        """
+        Groups consecutive bars into at most max_points points for charts.
+        Each point keeps the last equity and the deepest drawdown of its group, so intraday drawdowns stay visible.
+        """
+        if len(self) <= max_points or max_points <= 0:
+            return self
+
+        starts: np.ndarray = np.unique(
+            np.linspace(0, len(self), max_points, endpoint=False).astype(np.int64)
+        )
+        ends: np.ndarray = np.append(starts[1:], len(self)) - 1
+        return IntradayEquity(
+            self.__resolution,
+            self.__starting_capital,
+            self.__timestamps[ends],
+            self.__equity[ends],
+            np.minimum.reduceat(self.__drawdown, starts),
+            np.minimum.reduceat(self.__drawdown_percent, starts),
+        )
@@ -0,0 +1,64 @@
+from typing import Dict
+
+import numpy as np
+
+from ..enums import Resolution
+from .intraday_equity import IntradayEquity
+from .trade_ledger import TradeLedger
+
+
+class IntradayEquityBuilder:
+    SECONDS_PER_BAR: Dict[Resolution, int] = {
+        Resolution.M1: 60,
+        Resolution.M3: 3 * 60,
+        Resolution.M5: 5 * 60,
+        Resolution.M15: 15 * 60,
+        Resolution.M30: 30 * 60,
+        Resolution.H1: 60 * 60,
+        Resolution.H4: 4 * 60 * 60,
+        Resolution.D: 24 * 60 * 60,
+    }
+
+    @classmethod
+    def build(
+        cls, ledger: TradeLedger, starting_capital: float, resolution: Resolution
+    ) -> IntradayEquity:
+        """
+        Buckets the exits of a ledger ordered by exit time into bars of the resolution.
+        """
+        seconds_per_bar: int = cls.SECONDS_PER_BAR[resolution]
+        exit_seconds: np.ndarray = ledger.exit_time.astype(np.int64)
+        bars: np.ndarray = exit_seconds - exit_seconds % seconds_per_bar
+
+        # Exit times are sorted, so each bar is a contiguous run of trades.
+        starts: np.ndarray = np.flatnonzero(
+            np.concatenate(([True], bars[1:] != bars[:-1]))
+        )[: len(bars)]
+        profit_loss: np.ndarray = (
+            np.add.reduceat(ledger.net_profit_loss, starts)
+            if len(starts) != 0
+            else np.zeros(0)
+        )
+
+        equity: np.ndarray = starting_capital + np.cumsum(profit_loss)
+        max_equity: np.ndarray = np.maximum.accumulate(
+            np.maximum(equity, starting_capital)
+        )
+        drawdown: np.ndarray = equity - max_equity
+
+        return IntradayEquity(
+            resolution,
+            starting_capital,
+            bars[starts].astype("datetime64[s]"),
+            equity,
+            drawdown,
+            drawdown / max_equity,
+        )
+
+    @classmethod
+    def get_finest(cls, first: Resolution, second: Resolution) -> Resolution:
+        return (
+            first
+            if cls.SECONDS_PER_BAR[first] <= cls.SECONDS_PER_BAR[second]
+            else second
+        )
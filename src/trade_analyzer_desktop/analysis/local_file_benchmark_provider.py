@@ -0,0 +1,109 @@
+import os
+from abc import abstractmethod
+from typing import Dict, List, Tuple, Union
+from datetime import date as Date
+
+import numpy as np
+import pandas as pd
+
+from .benchmark_provider import BenchmarkProvider
+
+
+class LocalFileBenchmarkProvider(BenchmarkProvider):
+    """
+    Serves prices of one file per symbol in a directory, the file name without extension is the symbol.
+    """
+
+    DATE_COLUMN: str = "Date"
+    CLOSE_COLUMN: str = "Close"
+
+    def __init__(self, directory: str, extension: str) -> None:
+        self.__directory: str = directory
+        self.__extension: str = extension
+
+        # Prices of each symbol with the modification time of the file they are read from.
+        self.__prices: Dict[str, Tuple[float, np.ndarray, np.ndarray]] = {}
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def directory(self) -> str:
+        return self.__directory
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    def has_symbol(self, symbol: str) -> bool:
+        return os.path.isfile(self.get_path(symbol))
+
+    def get_symbols(self) -> List[str]:
+        if not os.path.isdir(self.__directory):
+            return []
+
+        return sorted(
+            file_name[: -len(self.__extension)]
+            for file_name in os.listdir(self.__directory)
+            if file_name.endswith(self.__extension)
+        )
+
+    def fetch_prices(
+        self, symbol: str, start_date: Date, end_date: Date
+    ) -> Dict[Date, float]:
+        dates, closes = self.__load(symbol)
+        start: int = int(np.searchsorted(dates, np.datetime64(start_date, "D"), "left"))
+        end: int = int(np.searchsorted(dates, np.datetime64(end_date, "D"), "right"))
+        return dict(zip(dates[start:end].tolist(), closes[start:end].tolist()))
+
+    def get_path(self, symbol: str) -> str:
+        return os.path.join(self.__directory, f"{symbol}{self.__extension}")
+
+    @abstractmethod
+    def read_data_frame(self, path: str) -> pd.DataFrame:
+        """
+        Reads a file which has date and close columns.
+        """
+        ...
+
+    # -------------------------------------------------- Private Methods --------------------------------------------------
+    def __load(self, symbol: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Dates and closes of a symbol in date order, the file is read again only when it is modified.
+        """
+        path: str = self.get_path(symbol)
+        modified_time: float = os.path.getmtime(path)
+        loaded: Union[Tuple[float, np.ndarray, np.ndarray], None] = self.__prices.get(
+            symbol
+        )
+
+        if loaded is not None and loaded[0] == modified_time:
+            return loaded[1], loaded[2]
+
+        data_frame: pd.DataFrame = self.read_data_frame(path)
+
+        if self.DATE_COLUMN not in data_frame.columns:
+            data_frame = data_frame.reset_index()
+
+        if (
+            self.DATE_COLUMN not in data_frame.columns
+            or self.CLOSE_COLUMN not in data_frame.columns
+        ):
+            raise ValueError(
+                f"{path} has no {self.DATE_COLUMN} or {self.CLOSE_COLUMN} column."
+            )
+
+        # Timestamps with time zone are dated in their own time zone.
+        timestamps: pd.Series = pd.to_datetime(data_frame[self.DATE_COLUMN])
+
+        if timestamps.dt.tz is not None:
+            timestamps = timestamps.dt.tz_localize(None)
+
+        dates: np.ndarray = timestamps.to_numpy().astype("datetime64[D]")
+        closes: np.ndarray = data_frame[self.CLOSE_COLUMN].to_numpy(dtype=np.float64)
+        is_valid: np.ndarray = ~np.isnan(closes)
+        dates, closes = dates[is_valid], closes[is_valid]
+
+        # The last close of a date is kept when a file has duplicate dates.
+        order: np.ndarray = np.argsort(dates, kind="stable")
+        dates, closes = dates[order], closes[order]
+        is_last: np.ndarray = np.append(dates[1:] != dates[:-1], True)
+        dates, closes = dates[is_last], closes[is_last]
+
+        self.__prices[symbol] = (modified_time, dates, closes)
+        return dates, closes
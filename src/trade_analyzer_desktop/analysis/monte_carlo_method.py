@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class MonteCarloMethod(Enum):
+    Bootstrap = "Bootstrap"  # Draw trades with replacement.
+    Shuffle = "Shuffle"  # Reorder the realized trades.
@@ -0,0 +1,72 @@
+from typing import Dict, List
+
+import numpy as np
+
+from .monte_carlo_method import MonteCarloMethod
+
+
+class MonteCarloResults:
+    """
+    The class represents the distributions of simulated trade sequences, one value per path.
+    """
+
+    PERCENTILES: List[int] = [5, 25, 50, 75, 95]
+
+    def __init__(
+        self,
+        method: MonteCarloMethod,
+        starting_capital: float,
+        final_equity: np.ndarray,
+        max_drawdown: np.ndarray,
+        max_drawdown_percent: np.ndarray,
+        longest_drawdown: np.ndarray,
+        time_to_recovery: np.ndarray,
+    ) -> None:
+        self.method: MonteCarloMethod = method
+        self.starting_capital: float = starting_capital
+
+        # Distributions
+        self.final_equity: np.ndarray = final_equity
+        self.max_drawdown: np.ndarray = max_drawdown
+        self.max_drawdown_percent: np.ndarray = max_drawdown_percent
+        self.longest_drawdown: np.ndarray = longest_drawdown  # Number of trades.
+        self.time_to_recovery: np.ndarray = (
+            time_to_recovery  # Number of trades from the max drawdown to a new peak, -1 if never recovered.
+        )
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def number_of_simulations(self) -> int:
+        return len(self.final_equity)
+
+    @property
+    def probability_of_loss(self) -> float:
+        if self.number_of_simulations == 0:
+            return 0
+        return float((self.final_equity < self.starting_capital).mean())
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    def get_percentiles(self, values: np.ndarray) -> Dict[int, float]:
+        """
+        Percentiles of a distribution, e.g. `results.get_percentiles(results.final_equity)`.
+        """
+        if len(values) == 0:
+            return {percent: 0 for percent in self.PERCENTILES}
+        return dict(
+            zip(self.PERCENTILES, np.percentile(values, self.PERCENTILES).tolist())
+        )
+
+    @staticmethod
+    def concatenate(results: List["MonteCarloResults"]) -> "MonteCarloResults":
+        """
+        Merges results of batches simulated with the same method and capital.
+        """
+        return MonteCarloResults(
+            results[0].method,
+            results[0].starting_capital,
+            np.concatenate([result.final_equity for result in results]),
+            np.concatenate([result.max_drawdown for result in results]),
+            np.concatenate([result.max_drawdown_percent for result in results]),
+            np.concatenate([result.longest_drawdown for result in results]),
+            np.concatenate([result.time_to_recovery for result in results]),
+        )
@@ -0,0 +1,16 @@
+import pandas as pd
+
+from .local_file_benchmark_provider import LocalFileBenchmarkProvider
+
+
+class ParquetBenchmarkProvider(LocalFileBenchmarkProvider):
+    """
+    Reads columnar parquet files, which needs the optional pyarrow dependency.
+    """
+
+    def __init__(self, directory: str) -> None:
+        super().__init__(directory, ".parquet")
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    def read_data_frame(self, path: str) -> pd.DataFrame:
+        return pd.read_parquet(path)
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class Period(Enum):
+    Monthly = "Monthly"
+    Quarterly = "Quarterly"
+    Yearly = "Yearly"
@@ -0,0 +1,25 @@
+from typing import Dict, List, Union
+
+from .period import Period
+from .periodical_statistics import PeriodicalStatistics
+
+
+class PeriodicalPerformance:
+    """
+    The class represents periodical statistics for each calendar period.
+    """
+
+    def __init__(self, statistics: List[PeriodicalStatistics]) -> None:
+        self.__statistics: Dict[Period, PeriodicalStatistics] = {
+            periodical_statistics.period: periodical_statistics
+            for periodical_statistics in statistics
+        }
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def periods(self) -> List[Period]:
+        return list(self.__statistics.keys())
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    def get(self, period: Period) -> Union[PeriodicalStatistics, None]:
+        return self.__statistics.get(period)
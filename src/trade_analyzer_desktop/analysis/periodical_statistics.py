@@ -0,0 +1,34 @@
+from typing import Dict
+from datetime import date as Date
+
+from .period import Period
+
+
+class PeriodicalStatistics:
+    """
+    The class represents statistics of each calendar period, keyed by the first date of the period.
+    """
+
+    def __init__(self, period: Period) -> None:
+        self.period: Period = period
+
+        # Daily statistics
+        self.net_profit_loss: Dict[Date, float] = {}
+        self.returns: Dict[Date, float] = {}  # Compounded return over the period.
+        self.max_drawdown_percent: Dict[Date, float] = (
+            {}
+        )  # Drawdown from the highest equity within the period.
+        self.win_rate: Dict[Date, float] = (
+            {}
+        )  # The ratio of winning days to the trading days of the period.
+        self.downside_deviation: Dict[Date, float] = (
+            {}
+        )  # Downside deviation of daily returns.
+
+        # Trade statistics
+        self.number_of_trades: Dict[Date, int] = {}
+        self.number_of_winning_trades: Dict[Date, int] = {}
+        self.trade_net_profit: Dict[Date, float] = (
+            {}
+        )  # Net profit of trades which exit in the period.
+        self.trade_win_rate: Dict[Date, float] = {}
@@ -0,0 +1,184 @@
+from typing import Dict, List, Union
+from datetime import date as Date
+
+import numpy as np
+
+from .daily_statistics import DailyStatistics
+from .period import Period
+from .periodical_performance import PeriodicalPerformance
+from .periodical_statistics import PeriodicalStatistics
+from .statistics_kernels import StatisticsKernels
+from .trade_ledger import TradeLedger
+
+
+class PeriodicalStatisticsBuilder:
+    MONTHS_PER_PERIOD: Dict[Period, int] = {
+        Period.Monthly: 1,
+        Period.Quarterly: 3,
+        Period.Yearly: 12,
+    }
+
+    @classmethod
+    def build(
+        cls,
+        daily_statistics: DailyStatistics,
+        starting_capital: float,
+        ledger: Union[TradeLedger, None] = None,
+    ) -> PeriodicalPerformance:
+        """
+        Builds statistics of every period, trades are not counted for benchmark which has no ledger.
+        """
+        dates: List[Date] = list(daily_statistics.returns.keys())
+        months: np.ndarray = np.array(dates, dtype="datetime64[M]").astype(np.int64)
+        returns: np.ndarray = np.fromiter(
+            daily_statistics.returns.values(), dtype=np.float64, count=len(dates)
+        )
+        profit_loss: np.ndarray = np.fromiter(
+            daily_statistics.net_profit_loss.values(),
+            dtype=np.float64,
+            count=len(dates),
+        )
+        equity: np.ndarray = np.concatenate(
+            (
+                [starting_capital],
+                np.fromiter(
+                    daily_statistics.equity.values(), dtype=np.float64, count=len(dates)
+                ),
+            )
+        )
+        trade_months: Union[np.ndarray, None] = (
+            ledger.exit_time.astype("datetime64[M]").astype(np.int64)
+            if ledger is not None
+            else None
+        )
+
+        return PeriodicalPerformance(
+            [
+                cls.build_period(
+                    period,
+                    months,
+                    returns,
+                    profit_loss,
+                    equity,
+                    trade_months,
+                    ledger.net_profit_loss if ledger is not None else None,
+                )
+                for period in Period
+            ]
+        )
+
+    @classmethod
+    def build_period(
+        cls,
+        period: Period,
+        months: np.ndarray,
+        returns: np.ndarray,
+        profit_loss: np.ndarray,
+        equity: np.ndarray,
+        trade_months: Union[np.ndarray, None],
+        trade_profit_loss: Union[np.ndarray, None],
+    ) -> PeriodicalStatistics:
+        """
+        Builds statistics of one period length. Months are counted from 1970-01, equity has the starting capital as its first value.
+        """
+        periodical_statistics: PeriodicalStatistics = PeriodicalStatistics(period)
+
+        if len(months) == 0:
+            return periodical_statistics
+
+        months_per_period: int = cls.MONTHS_PER_PERIOD[period]
+        period_ids: np.ndarray = months // months_per_period
+
+        # Dates are ascending, so each period is a contiguous segment of days.
+        starts: np.ndarray = np.flatnonzero(
+            np.concatenate(([True], period_ids[1:] != period_ids[:-1]))
+        )
+        ends: np.ndarray = np.append(starts[1:], len(period_ids))
+        unique_period_ids: np.ndarray = period_ids[starts]
+        period_dates: List[Date] = (
+            (unique_period_ids * months_per_period)
+            .astype("datetime64[M]")
+            .astype("datetime64[D]")
+            .tolist()
+        )
+        number_of_days: np.ndarray = ends - starts
+
+        max_drawdown_percent: List[float] = []
+        downside_deviation: List[float] = []
+
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            # Drawdown is measured from the equity at the end of the previous period.
+            period_equity: np.ndarray = equity[start : end + 1]
+            max_drawdown_percent.append(
+                float((period_equity / np.maximum.accumulate(period_equity) - 1).min())
+            )
+            downside_deviation.append(
+                StatisticsKernels.downside_deviation(returns[start:end])
+            )
+
+        periodical_statistics.net_profit_loss = cls.__to_series(
+            period_dates, np.add.reduceat(profit_loss, starts)
+        )
+        periodical_statistics.returns = cls.__to_series(
+            period_dates, equity[ends] / equity[starts] - 1
+        )
+        periodical_statistics.max_drawdown_percent = dict(
+            zip(period_dates, max_drawdown_percent)
+        )
+        periodical_statistics.win_rate = cls.__to_series(
+            period_dates,
+            np.add.reduceat((profit_loss > 0).astype(np.int64), starts)
+            / number_of_days,
+        )
+        periodical_statistics.downside_deviation = dict(
+            zip(period_dates, downside_deviation)
+        )
+
+        if trade_months is None or trade_profit_loss is None:
+            return periodical_statistics
+
+        # Trades are grouped by the period of their exit, those out of the date range are not counted.
+        trade_period_ids: np.ndarray = trade_months // months_per_period
+        indices: np.ndarray = np.searchsorted(unique_period_ids, trade_period_ids)
+        is_matched: np.ndarray = indices < len(unique_period_ids)
+        is_matched[is_matched] = (
+            unique_period_ids[indices[is_matched]] == trade_period_ids[is_matched]
+        )
+        matched_indices: np.ndarray = indices[is_matched]
+        matched_profit_loss: np.ndarray = trade_profit_loss[is_matched]
+
+        number_of_trades: np.ndarray = np.bincount(
+            matched_indices, minlength=len(unique_period_ids)
+        )
+        number_of_winning_trades: np.ndarray = np.bincount(
+            matched_indices[matched_profit_loss > 0], minlength=len(unique_period_ids)
+        )
+
+        periodical_statistics.number_of_trades = cls.__to_series(
+            period_dates, number_of_trades
+        )
+        periodical_statistics.number_of_winning_trades = cls.__to_series(
+            period_dates, number_of_winning_trades
+        )
+        periodical_statistics.trade_net_profit = cls.__to_series(
+            period_dates,
+            np.bincount(
+                matched_indices,
+                weights=matched_profit_loss,
+                minlength=len(unique_period_ids),
+            ),
+        )
+        periodical_statistics.trade_win_rate = cls.__to_series(
+            period_dates,
+            np.divide(
+                number_of_winning_trades,
+                number_of_trades,
+                out=np.zeros(len(unique_period_ids)),
+                where=number_of_trades != 0,
+            ),
+        )
+        return periodical_statistics
+
+    @staticmethod
+    def __to_series(dates: List[Date], values: np.ndarray) -> Dict[Date, float]:
+        return dict(zip(dates, values.tolist()))
@@ -0,0 +1,232 @@
+import os
+import shutil
+import pickle
+import hashlib
+from typing import Any, Dict, List, Tuple, Union
+from datetime import date as Date
+
+from ..enums import Resolution, StrategyType
+from ..trading.instruments import InstrumentRegistry
+from .benchmark import Benchmark
+from .benchmark_symbol import BenchmarkSymbol
+from .composite_benchmark import CompositeBenchmark
+from .simulation_checkpoint import SimulationCheckpoint
+from .statistics_results import StatisticsResults
+
+
+class ResultsCache:
+    """
+    On-disk cache of strategy statistics results, keyed by report, analysis settings and benchmark returns.
+    """
+
+    DIRECTORY: str = "cache"
+    VERSION: int = 10  # Bump when the layout of statistics results changes.
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    @classmethod
+    def get(
+        cls,
+        strategy_id: str,
+        strategy_type: StrategyType,
+        starting_capital: float,
+        start_date: Date,
+        end_date: Date,
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark],
+        benchmark_returns: Dict[Date, float],
+        instruments: InstrumentRegistry,
+        resolution: Resolution,
+    ) -> Union[StatisticsResults, None]:
+        """
+        Returns cached results of a report, or None when there is no valid entry.
+        """
+        return cls.__load(
+            cls.__get_entry_path(
+                strategy_id,
+                strategy_type,
+                starting_capital,
+                start_date,
+                end_date,
+                benchmark_symbol,
+                benchmark_returns,
+                instruments,
+                resolution,
+            )
+        )
+
+    @classmethod
+    def put(
+        cls,
+        strategy_id: str,
+        strategy_type: StrategyType,
+        starting_capital: float,
+        start_date: Date,
+        end_date: Date,
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark],
+        benchmark_returns: Dict[Date, float],
+        instruments: InstrumentRegistry,
+        resolution: Resolution,
+        statistics_results: StatisticsResults,
+    ) -> None:
+        cls.__dump(
+            cls.__get_entry_path(
+                strategy_id,
+                strategy_type,
+                starting_capital,
+                start_date,
+                end_date,
+                benchmark_symbol,
+                benchmark_returns,
+                instruments,
+                resolution,
+            ),
+            statistics_results,
+        )
+
+    @classmethod
+    def get_checkpoint(
+        cls,
+        strategy_id: str,
+        strategy_type: StrategyType,
+        start_date: Date,
+        instruments: InstrumentRegistry,
+    ) -> Union[SimulationCheckpoint, None]:
+        """
+        Returns the latest simulation checkpoint of a report started from the start date, or None when there is no valid entry.
+        """
+        return cls.__load(
+            cls.__get_checkpoint_path(
+                strategy_id, strategy_type, start_date, instruments
+            )
+        )
+
+    @classmethod
+    def put_checkpoint(
+        cls,
+        strategy_id: str,
+        strategy_type: StrategyType,
+        start_date: Date,
+        instruments: InstrumentRegistry,
+        checkpoint: SimulationCheckpoint,
+    ) -> None:
+        cls.__dump(
+            cls.__get_checkpoint_path(
+                strategy_id, strategy_type, start_date, instruments
+            ),
+            checkpoint,
+        )
+
+    @classmethod
+    def invalidate(cls, strategy_id: str) -> None:
+        """
+        Removes all cached results of a report, the strategy id is formatted as `{strategy id}:{report id}`.
+        """
+        shutil.rmtree(cls.__get_report_directory(strategy_id), ignore_errors=True)
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Removes all cached results.
+        """
+        shutil.rmtree(cls.DIRECTORY, ignore_errors=True)
+
+    # -------------------------------------------------- Event Handlers --------------------------------------------------
+    @classmethod
+    def on_orders_changed(cls, strategy_id: str) -> None:
+        cls.invalidate(strategy_id)
+
+    @classmethod
+    def on_instruments_changed(cls, symbols: List[str]) -> None:
+        # Instrument settings are shared by reports, so every entry may be affected.
+        cls.clear()
+
+    # -------------------------------------------------- Private Methods --------------------------------------------------
+    @classmethod
+    def __get_report_directory(cls, strategy_id: str) -> str:
+        # Strategy ids contain characters which are not allowed in file names.
+        return os.path.join(
+            cls.DIRECTORY, hashlib.sha1(strategy_id.encode()).hexdigest()
+        )
+
+    @classmethod
+    def __get_entry_path(
+        cls,
+        strategy_id: str,
+        strategy_type: StrategyType,
+        starting_capital: float,
+        start_date: Date,
+        end_date: Date,
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark],
+        benchmark_returns: Dict[Date, float],
+        instruments: InstrumentRegistry,
+        resolution: Resolution,
+    ) -> str:
+        settings: Tuple = (
+            cls.VERSION,
+            strategy_type.value,
+            starting_capital,
+            start_date.isoformat(),
+            end_date.isoformat(),
+            BenchmarkSymbol.to_symbol(benchmark_symbol),
+            Benchmark.get_digest(benchmark_returns),
+            cls.__get_instrument_settings(instruments),
+            resolution.value,
+        )
+        return os.path.join(
+            cls.__get_report_directory(strategy_id),
+            f"{hashlib.sha1(repr(settings).encode()).hexdigest()}.pickle",
+        )
+
+    @classmethod
+    def __get_checkpoint_path(
+        cls,
+        strategy_id: str,
+        strategy_type: StrategyType,
+        start_date: Date,
+        instruments: InstrumentRegistry,
+    ) -> str:
+        # Simulation does not depend on the end date, capital or benchmark, a later end date continues from it.
+        # The strategy type decides day trades and so their fees.
+        settings: Tuple = (
+            cls.VERSION,
+            strategy_type.value,
+            start_date.isoformat(),
+            cls.__get_instrument_settings(instruments),
+        )
+        return os.path.join(
+            cls.__get_report_directory(strategy_id),
+            f"checkpoint-{hashlib.sha1(repr(settings).encode()).hexdigest()}.pickle",
+        )
+
+    @classmethod
+    def __get_instrument_settings(cls, instruments: InstrumentRegistry) -> List[Tuple]:
+        return sorted(
+            (
+                instrument.symbol,
+                instrument.exchange.id,
+                instrument.type.value,
+                instrument.fee_pricing,
+                instrument.point_value,
+            )
+            for instrument in instruments.instruments
+        )
+
+    @classmethod
+    def __load(cls, path: str) -> Any:
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "rb") as file:
+                return pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+            os.remove(path)
+            return None
+
+    @classmethod
+    def __dump(cls, path: str, value: Any) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write to a temporary file first, so a reader never sees a partial entry.
+        with open(f"{path}.tmp", "wb") as file:
+            pickle.dump(value, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(f"{path}.tmp", path)
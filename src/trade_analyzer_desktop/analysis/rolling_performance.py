@@ -0,0 +1,24 @@
+from typing import Dict, List, Union
+
+from .rolling_statistics import RollingStatistics
+
+
+class RollingPerformance:
+    """
+    The class represents rolling statistics for each window length.
+    """
+
+    def __init__(self, statistics: List[RollingStatistics]) -> None:
+        self.__statistics: Dict[int, RollingStatistics] = {
+            rolling_statistics.window: rolling_statistics
+            for rolling_statistics in statistics
+        }
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def windows(self) -> List[int]:
+        return list(self.__statistics.keys())
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    def get(self, window: int) -> Union[RollingStatistics, None]:
+        return self.__statistics.get(window)
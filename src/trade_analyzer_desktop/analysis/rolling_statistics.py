@@ -0,0 +1,21 @@
+from typing import Dict
+from datetime import date as Date
+
+
+class RollingStatistics:
+    """
+    The class represents statistics of a trailing window, keyed by the last date of each window.
+    """
+
+    def __init__(self, window: int) -> None:
+        self.window: int = window  # Number of trading days in each window.
+
+        # Series
+        self.returns: Dict[Date, float] = {}  # Compounded return over the window.
+        self.volatility: Dict[Date, float] = {}  # Annualized standard deviation.
+        self.sharpe_ratio: Dict[Date, float] = {}
+        self.beta: Dict[Date, float] = {}
+        self.alpha: Dict[Date, float] = {}
+        self.max_drawdown: Dict[Date, float] = (
+            {}
+        )  # Max drawdown percentage within the window.
@@ -0,0 +1,203 @@
+from typing import Dict, List, Tuple, Union
+from datetime import date as Date
+
+import numpy as np
+
+from .daily_statistics import DailyStatistics
+from .daily_statistics_builder import DailyStatisticsBuilder
+from .rolling_performance import RollingPerformance
+from .rolling_statistics import RollingStatistics
+
+
+class RollingStatisticsBuilder:
+    WINDOWS: List[int] = [21, 63, 126, 252]  # 1, 3, 6 and 12 months of trading days.
+
+    @classmethod
+    def build(
+        cls,
+        daily_statistics: DailyStatistics,
+        benchmark_returns: Dict[Date, float],
+        starting_capital: float,
+        windows: Union[List[int], None] = None,
+    ) -> RollingPerformance:
+        """
+        Builds rolling statistics of daily series aligned with the benchmark returns.
+        """
+        dates: List[Date] = list(daily_statistics.returns.keys())
+        returns: np.ndarray = np.fromiter(
+            daily_statistics.returns.values(), dtype=np.float64, count=len(dates)
+        )
+        benchmark: np.ndarray = np.array(
+            [benchmark_returns.get(date, 0) for date in dates], dtype=np.float64
+        )
+        equity: np.ndarray = np.concatenate(
+            (
+                [starting_capital],
+                np.fromiter(
+                    daily_statistics.equity.values(), dtype=np.float64, count=len(dates)
+                ),
+            )
+        )
+
+        return RollingPerformance(
+            [
+                cls.build_window(dates, returns, benchmark, equity, window)
+                for window in (windows if windows is not None else cls.WINDOWS)
+            ]
+        )
+
+    @classmethod
+    def build_window(
+        cls,
+        dates: List[Date],
+        returns: np.ndarray,
+        benchmark: np.ndarray,
+        equity: np.ndarray,
+        window: int,
+    ) -> RollingStatistics:
+        """
+        Builds statistics of one window length in linear time, equity has the starting capital as its first value.
+        """
+        rolling_statistics: RollingStatistics = RollingStatistics(window)
+
+        # Min amount of samples to calculate variance.
+        if window < 2 or len(returns) < window:
+            return rolling_statistics
+
+        trading_days: int = DailyStatisticsBuilder.TRADING_DAYS_PER_YEAR
+        risk_free_interest: float = DailyStatisticsBuilder.RISK_FREE_INTEREST
+        window_dates: List[Date] = dates[window - 1 :]
+
+        # Moments are shifted by the overall mean, so window sums do not lose precision.
+        centered_returns: np.ndarray = returns - returns.mean()
+        centered_benchmark: np.ndarray = benchmark - benchmark.mean()
+
+        mean: np.ndarray = cls.__rolling_mean(returns, window)
+        benchmark_mean: np.ndarray = cls.__rolling_mean(benchmark, window)
+        variance: np.ndarray = np.maximum(
+            cls.__rolling_mean(centered_returns**2, window)
+            - cls.__rolling_mean(centered_returns, window) ** 2,
+            0,
+        )
+        benchmark_variance: np.ndarray = np.maximum(
+            cls.__rolling_mean(centered_benchmark**2, window)
+            - cls.__rolling_mean(centered_benchmark, window) ** 2,
+            0,
+        )
+        covariance: np.ndarray = cls.__rolling_mean(
+            centered_returns * centered_benchmark, window
+        ) - cls.__rolling_mean(centered_returns, window) * cls.__rolling_mean(
+            centered_benchmark, window
+        )
+
+        annual_returns: np.ndarray = np.power(mean + 1, trading_days) - 1
+        benchmark_annual_returns: np.ndarray = (
+            np.power(benchmark_mean + 1, trading_days) - 1
+        )
+        volatility: np.ndarray = np.sqrt(variance * trading_days)
+        has_volatility: np.ndarray = volatility != 0
+        sharpe_ratio: np.ndarray = np.divide(
+            annual_returns - risk_free_interest,
+            volatility,
+            out=np.zeros_like(volatility),
+            where=has_volatility,
+        )
+        beta: np.ndarray = np.divide(
+            covariance,
+            benchmark_variance,
+            out=np.zeros_like(covariance),
+            where=benchmark_variance != 0,
+        )
+        alpha: np.ndarray = np.where(
+            beta != 0,
+            annual_returns
+            - (
+                risk_free_interest
+                + beta * (benchmark_annual_returns - risk_free_interest)
+            ),
+            0,
+        )
+
+        rolling_statistics.returns = cls.__to_series(
+            window_dates, equity[window:] / equity[:-window] - 1
+        )
+        rolling_statistics.volatility = cls.__to_series(window_dates, volatility)
+        rolling_statistics.sharpe_ratio = cls.__to_series(window_dates, sharpe_ratio)
+        rolling_statistics.beta = cls.__to_series(window_dates, beta)
+        rolling_statistics.alpha = cls.__to_series(window_dates, alpha)
+        rolling_statistics.max_drawdown = cls.__to_series(
+            window_dates, cls.__rolling_max_drawdown(equity, window + 1)
+        )
+        return rolling_statistics
+
+    @staticmethod
+    def __rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+        sums: np.ndarray = np.concatenate(([0], np.cumsum(values)))
+        return (sums[window:] - sums[:-window]) / window
+
+    @staticmethod
+    def __rolling_max_drawdown(values: np.ndarray, size: int) -> np.ndarray:
+        """
+        Max drawdown percentage of each `size` long window of values.
+
+        Windows are aggregated with a two-stack queue of (max, min, max drawdown) summaries,
+        every value is pushed and moved once, so the cost is linear in the number of values.
+        """
+        combine = RollingStatisticsBuilder.__combine_drawdown_summaries
+
+        # Front stack holds the oldest values, each with the summary from it to the newest value in the stack.
+        front: List[Tuple[float, float, float]] = []
+        back: List[float] = []
+        back_summary: Union[Tuple[float, float, float], None] = None
+        drawdowns: List[float] = []
+
+        for i, value in enumerate(values.tolist()):
+            back.append(value)
+            back_summary = (
+                combine(back_summary, (value, value, 0))
+                if back_summary is not None
+                else (value, value, 0)
+            )
+
+            if i < size - 1:
+                continue
+
+            if i >= size:
+                if not front:
+                    while back:
+                        element: float = back.pop()
+                        front.append(
+                            combine((element, element, 0), front[-1])
+                            if front
+                            else (element, element, 0)
+                        )
+                    back_summary = None
+                front.pop()
+
+            if not front:
+                drawdowns.append(back_summary[2])
+            elif back_summary is None:
+                drawdowns.append(front[-1][2])
+            else:
+                drawdowns.append(combine(front[-1], back_summary)[2])
+
+        return np.array(drawdowns, dtype=np.float64)
+
+    @staticmethod
+    def __combine_drawdown_summaries(
+        earlier: Tuple[float, float, float], later: Tuple[float, float, float]
+    ) -> Tuple[float, float, float]:
+        """
+        Summary of two adjacent segments, the later segment can draw down from the peak of the earlier one.
+        """
+        # As the divisions of the rolling ratios, a zero peak gives 0 instead of failing.
+        drawdown: float = later[1] / earlier[0] - 1 if earlier[0] != 0 else 0
+        return (
+            max(earlier[0], later[0]),
+            min(earlier[1], later[1]),
+            min(earlier[2], later[2], drawdown),
+        )
+
+    @staticmethod
+    def __to_series(dates: List[Date], values: np.ndarray) -> Dict[Date, float]:
+        return dict(zip(dates, values.tolist()))
@@ -0,0 +1,25 @@
+from datetime import date as Date
+
+from ..trading.strategies import Strategy
+
+
+class SimulationCheckpoint:
+    """
+    The class represents the state of a simulated strategy after all orders up to the end date are replayed.
+    """
+
+    def __init__(self, strategy: Strategy, end_date: Date) -> None:
+        self.__strategy: Strategy = strategy
+        self.__end_date: Date = end_date
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def strategy(self) -> Strategy:
+        """
+        Strategy instance with its open positions and closed trades.
+        """
+        return self.__strategy
+
+    @property
+    def end_date(self) -> Date:
+        return self.__end_date
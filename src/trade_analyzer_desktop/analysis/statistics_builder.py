@@ -1,43 +1,146 @@
-from typing import List, Dict
+from typing import Dict, List, Union
 from datetime import date as Date
 
+from ..enums import Resolution
+from .benchmark import Benchmark
+from .benchmark_statistics_cache import BenchmarkStatisticsCache
+from .benchmark_store import BenchmarkStore
 from .benchmark_symbol import BenchmarkSymbol
+from .composite_benchmark import CompositeBenchmark
+from .drawdown_episode_index import DrawdownEpisodeIndex
+from .periodical_performance import PeriodicalPerformance
+from .periodical_statistics_builder import PeriodicalStatisticsBuilder
+from .rolling_performance import RollingPerformance
 from .statistics_results import StatisticsResults
 from .benchmark_performance import BenchmarkPerformance
 from .strategy_performance import StrategyPerformance
-from ..entities import Trade
+from .rolling_statistics_builder import RollingStatisticsBuilder
+from .trade_ledger import TradeLedger
+from .trade_statistics_accumulator import TradeStatisticsAccumulator
 
 
 class StatisticsBuilder:
     @classmethod
     def build_benchmark(
         cls,
-        benchmark_symbol: BenchmarkSymbol,
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark],
         starting_capital: float,
         start_date: Date,
         end_date: Date,
+        returns: Union[Dict[Date, float], None] = None,
     ) -> StatisticsResults:
         """
-        Builds the statistics and returns the results of benchmark.
+        Builds the statistics and returns the results of benchmark, daily returns are fetched unless given.
+        Results of fetched returns are shared by analyses of the same settings and benchmark data.
         """
-        benchmark_performance = BenchmarkPerformance(
-            benchmark_symbol, starting_capital, start_date, end_date
+        if returns is not None:
+            return cls.__build_benchmark(
+                benchmark_symbol, starting_capital, start_date, end_date, returns
+            )
+
+        # Returns are fetched before the lookup, so refreshed prices or reloaded files are never served stale.
+        returns = Benchmark.daily_returns(
+            BenchmarkStore.get_prices(benchmark_symbol, start_date, end_date),
+            start_date,
+            end_date,
+        )
+        returns_digest: str = Benchmark.get_digest(returns)
+        cached_results: Union[StatisticsResults, None] = BenchmarkStatisticsCache.get(
+            benchmark_symbol, starting_capital, start_date, end_date, returns_digest
+        )
+
+        if cached_results is not None:
+            return cached_results
+
+        statistics_results: StatisticsResults = cls.__build_benchmark(
+            benchmark_symbol, starting_capital, start_date, end_date, returns
         )
-        return StatisticsResults(benchmark_performance, None, None)
+
+        # Results of prices which are not final yet are not kept.
+        if BenchmarkStore.is_complete(benchmark_symbol, start_date, end_date):
+            BenchmarkStatisticsCache.put(
+                benchmark_symbol,
+                starting_capital,
+                start_date,
+                end_date,
+                returns_digest,
+                statistics_results,
+            )
+        return statistics_results
 
     @classmethod
     def build_strategy(
         cls,
-        trades: List[Trade],
+        ledger: TradeLedger,
         benchmark_returns: Dict[Date, float],
         starting_capital: float,
         start_date: Date,
         end_date: Date,
+        resolution: Resolution = Resolution.D,
+        chunk_accumulators: Union[List[TradeStatisticsAccumulator], None] = None,
     ) -> StatisticsResults:
         """
         Generates the statistics and returns the results of strategy.
         """
         strategy_performance: StrategyPerformance = StrategyPerformance(
-            trades, benchmark_returns, starting_capital, start_date, end_date
+            ledger,
+            benchmark_returns,
+            starting_capital,
+            start_date,
+            end_date,
+            resolution,
+            chunk_accumulators,
+        )
+        rolling_performance: RollingPerformance = RollingStatisticsBuilder.build(
+            strategy_performance.daily_statistics, benchmark_returns, starting_capital
+        )
+        periodical_performance: PeriodicalPerformance = (
+            PeriodicalStatisticsBuilder.build(
+                strategy_performance.daily_statistics, starting_capital, ledger
+            )
+        )
+        drawdown_episodes: DrawdownEpisodeIndex = (
+            DrawdownEpisodeIndex.from_daily_statistics(
+                strategy_performance.daily_statistics, starting_capital
+            )
+        )
+        return StatisticsResults(
+            strategy_performance,
+            rolling_performance,
+            periodical_performance,
+            drawdown_episodes,
+        )
+
+    @classmethod
+    def __build_benchmark(
+        cls,
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark],
+        starting_capital: float,
+        start_date: Date,
+        end_date: Date,
+        returns: Dict[Date, float],
+    ) -> StatisticsResults:
+        benchmark_performance = BenchmarkPerformance(
+            benchmark_symbol, starting_capital, start_date, end_date, returns
+        )
+        rolling_performance: RollingPerformance = RollingStatisticsBuilder.build(
+            benchmark_performance.daily_statistics,
+            benchmark_performance.daily_statistics.returns,
+            starting_capital,
+        )
+        periodical_performance: PeriodicalPerformance = (
+            PeriodicalStatisticsBuilder.build(
+                benchmark_performance.daily_statistics, starting_capital
+            )
+        )
+        drawdown_episodes: DrawdownEpisodeIndex = (
+            DrawdownEpisodeIndex.from_daily_statistics(
+                benchmark_performance.daily_statistics, starting_capital
+            )
+        )
+        return StatisticsResults(
+            benchmark_performance,
+            rolling_performance,
+            periodical_performance,
+            drawdown_episodes,
         )
-        return StatisticsResults(strategy_performance, None, None)
@@ -0,0 +1,70 @@
+import math
+
+import numpy as np
+
+
+class StatisticsKernels:
+    """
+    Vectorized statistics over return series, each kernel runs in linear time.
+    """
+
+    @staticmethod
+    def mean(values: np.ndarray) -> float:
+        return float(values.mean()) if len(values) != 0 else 0
+
+    @staticmethod
+    def variance(values: np.ndarray) -> float:
+        """
+        Population variance.
+        """
+        return float(values.var()) if len(values) != 0 else 0
+
+    @staticmethod
+    def covariance(values1: np.ndarray, values2: np.ndarray) -> float:
+        """
+        Population covariance of two aligned series.
+        """
+        if len(values1) != len(values2):
+            raise ValueError("Series must have the same length.")
+
+        if len(values1) == 0:
+            return 0
+        return float(
+            np.dot(values1 - values1.mean(), values2 - values2.mean()) / len(values1)
+        )
+
+    @staticmethod
+    def annual_returns(values: np.ndarray, trading_days_per_year: int = 252) -> float:
+        return math.pow(StatisticsKernels.mean(values) + 1, trading_days_per_year) - 1
+
+    @staticmethod
+    def annual_variance(values: np.ndarray, trading_days_per_year: int = 252) -> float:
+        variance: float = StatisticsKernels.variance(values)
+        return variance * trading_days_per_year if variance != 0 else 0
+
+    @staticmethod
+    def tracking_error(
+        values: np.ndarray,
+        benchmark_values: np.ndarray,
+        trading_days_per_year: int = 252,
+    ) -> float:
+        """
+        Square root of the annual returns of the performance difference, 0 if the series are not aligned.
+        """
+        if len(values) != len(benchmark_values):
+            return 0
+
+        annual_performance: float = StatisticsKernels.annual_returns(
+            values - benchmark_values, trading_days_per_year
+        )
+        return math.sqrt(annual_performance) if annual_performance >= 0 else 0
+
+    @staticmethod
+    def downside_deviation(values: np.ndarray, target: float = 0) -> float:
+        """
+        Root mean square of the shortfalls below the target.
+        """
+        if len(values) == 0:
+            return 0
+        shortfalls: np.ndarray = np.minimum(values - target, 0)
+        return math.sqrt(float(np.dot(shortfalls, shortfalls)) / len(values))
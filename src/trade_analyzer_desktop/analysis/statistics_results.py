@@ -1,23 +1,29 @@
-from typing import Dict, TypeVar
+from typing import TypeVar, Union
 
 from .strategy_performance import StrategyPerformance
 from .benchmark_performance import BenchmarkPerformance
-
+from .drawdown_episode_index import DrawdownEpisodeIndex
+from .periodical_performance import PeriodicalPerformance
+from .rolling_performance import RollingPerformance
 
 T = TypeVar("T", StrategyPerformance, BenchmarkPerformance)
 
 
 class StatisticsResults:
     """
-    The class represents total/rolling/perdical statistics.
+    The class represents total/rolling/perdical statistics and drawdown episodes.
     """
 
     def __init__(
         self,
         total_performance: T,
-        rolling_performance: Dict[str, T],
-        periodical_performance: Dict[str, T],
+        rolling_performance: Union[RollingPerformance, None],
+        periodical_performance: Union[PeriodicalPerformance, None],
+        drawdown_episodes: Union[DrawdownEpisodeIndex, None],
     ) -> None:
         self.total_performance: T = total_performance
-        self.rolling_performance: Dict[str, T] = rolling_performance
-        self.periodical_performance: Dict[str, T] = periodical_performance
+        self.rolling_performance: Union[RollingPerformance, None] = rolling_performance
+        self.periodical_performance: Union[PeriodicalPerformance, None] = (
+            periodical_performance
+        )
+        self.drawdown_episodes: Union[DrawdownEpisodeIndex, None] = drawdown_episodes
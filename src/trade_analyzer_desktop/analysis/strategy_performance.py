@@ -1,67 +1,106 @@
-from typing import List, Dict
+from typing import List, Dict, Union
 from datetime import date as Date
 
+from .intraday_equity import IntradayEquity
+from .intraday_equity_builder import IntradayEquityBuilder
+from .trade_ledger import TradeLedger
 from .trade_statistics import TradeStatistics
+from .trade_statistics_accumulator import TradeStatisticsAccumulator
 from .strategy_daily_statistics import StrategyDailyStatistics
 from .trade_statistics_builder import TradeStatisticsBuilder
 from .daily_statistics_builder import DailyStatisticsBuilder
 from ..entities import Trade
-from ..enums import Side
+from ..enums import Resolution
 
 
 class StrategyPerformance:
     def __init__(
         self,
-        trades: List[Trade],
+        ledger: TradeLedger,
         benchmark_returns: Dict[Date, float],
         starting_capital: float,
         start_date: Date,
         end_date: Date,
+        resolution: Resolution = Resolution.D,
+        chunk_accumulators: Union[List[TradeStatisticsAccumulator], None] = None,
     ) -> None:
-        self.__closed_trades: List[Trade] = trades
+        """
+        Trade statistics of a ledger which joins other ledgers, e.g. of a portfolio, are merged from the accumulators of those ledgers when they are given.
+        """
+        self.__ledger: TradeLedger = ledger
         self.__starting_capital: float = starting_capital
         self.__start_date: Date = start_date
         self.__end_date: Date = end_date
         self.__benchmark_returns: Dict[Date, float] = benchmark_returns
+        self.__resolution: Resolution = resolution
+        self.__trade_accumulator: TradeStatisticsAccumulator = (
+            TradeStatisticsAccumulator.from_ledger(ledger)
+            if chunk_accumulators is None
+            else TradeStatisticsAccumulator.from_chunks(chunk_accumulators, ledger)
+        )
         self.__trade_statistics: TradeStatistics = TradeStatisticsBuilder.build(
-            trades, starting_capital, start_date, end_date
+            ledger, starting_capital, start_date, end_date, self.__trade_accumulator
         )
         self.daily_statistics: StrategyDailyStatistics = (
             DailyStatisticsBuilder.build_strategy(
-                trades, benchmark_returns, starting_capital, start_date, end_date
+                ledger, benchmark_returns, starting_capital, start_date, end_date
             )
         )
 
+        # Side performances are built on first access.
+        self.__long: Union[StrategyPerformance, None] = None
+        self.__short: Union[StrategyPerformance, None] = None
+        self.__intraday_equity: Union[IntradayEquity, None] = None
+
     @property
     def long(self) -> "StrategyPerformance":
-        long_trades: List[Trade] = list(
-            filter(lambda trade: trade.side == Side.Long, self.__closed_trades)
-        )
-        return StrategyPerformance(
-            long_trades,
-            self.__benchmark_returns,
-            self.__starting_capital,
-            self.__start_date,
-            self.__end_date,
-        )
+        if self.__long is None:
+            self.__long = self.__build_side(TradeLedger.LONG)
+        return self.__long
 
     @property
     def short(self) -> "StrategyPerformance":
-        long_trades: List[Trade] = list(
-            filter(lambda trade: trade.side == Side.Short, self.__closed_trades)
-        )
-        return StrategyPerformance(
-            long_trades,
-            self.__benchmark_returns,
-            self.__starting_capital,
-            self.__start_date,
-            self.__end_date,
-        )
+        if self.__short is None:
+            self.__short = self.__build_side(TradeLedger.SHORT)
+        return self.__short
+
+    @property
+    def resolution(self) -> Resolution:
+        return self.__resolution
+
+    @property
+    def intraday_equity(self) -> IntradayEquity:
+        """
+        Closed-trade equity at the resolution of the strategy, built on first access.
+        """
+        if self.__intraday_equity is None:
+            self.__intraday_equity = IntradayEquityBuilder.build(
+                self.__ledger, self.__starting_capital, self.__resolution
+            )
+        return self.__intraday_equity
+
+    @property
+    def trade_accumulator(self) -> TradeStatisticsAccumulator:
+        return self.__trade_accumulator
 
     @property
     def trade_statistics(self) -> TradeStatistics:
         return self.__trade_statistics
 
+    @property
+    def ledger(self) -> TradeLedger:
+        return self.__ledger
+
     @property
     def closed_trades(self) -> List[Trade]:
-        return self.__closed_trades
+        return self.__ledger.trades
+
+    def __build_side(self, side: int) -> "StrategyPerformance":
+        return StrategyPerformance(
+            self.__ledger.select(self.__ledger.side == side),
+            self.__benchmark_returns,
+            self.__starting_capital,
+            self.__start_date,
+            self.__end_date,
+            self.__resolution,
+        )
@@ -0,0 +1,37 @@
+from typing import Dict, List
+
+import numpy as np
+
+from .distribution_metric import DistributionMetric
+
+
+class TradeDistribution:
+    """
+    The class represents the histogram, quantiles and tail statistics of a metric over closed trades.
+    """
+
+    QUANTILES: List[float] = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]
+
+    def __init__(self, metric: DistributionMetric) -> None:
+        self.metric: DistributionMetric = metric
+        self.number_of_values: int = 0
+
+        # Histogram, counts[i] is the number of values in [bin_edges[i], bin_edges[i + 1]).
+        self.bin_edges: np.ndarray = np.zeros(0)
+        self.counts: np.ndarray = np.zeros(0, dtype=np.int64)
+
+        self.quantiles: Dict[float, float] = {}
+
+        self.mean: float = 0
+        self.standard_deviation: float = 0
+        self.skewness: float = 0
+        self.kurtosis: float = 0  # Excess kurtosis.
+        self.min: float = 0
+        self.max: float = 0
+
+        # Tail statistics
+        self.left_tail_mean: float = 0  # Mean of the values below the 5% quantile.
+        self.right_tail_mean: float = 0  # Mean of the values above the 95% quantile.
+        self.tail_ratio: float = (
+            0  # Ratio of the 95% quantile to the absolute 5% quantile.
+        )
@@ -0,0 +1,108 @@
+from typing import Dict
+
+import numpy as np
+
+from .distribution_metric import DistributionMetric
+from .trade_distribution import TradeDistribution
+from .trade_ledger import TradeLedger
+
+
+class TradeDistributionBuilder:
+    NUMBER_OF_BINS: int = 50
+
+    @classmethod
+    def build(
+        cls, ledger: TradeLedger, starting_capital: float
+    ) -> Dict[DistributionMetric, TradeDistribution]:
+        """
+        Builds the distribution of every metric over the trades of a ledger.
+        """
+        return {
+            metric: cls.build_values(
+                metric, cls.get_values(ledger, metric, starting_capital)
+            )
+            for metric in DistributionMetric
+        }
+
+    @staticmethod
+    def get_values(
+        ledger: TradeLedger, metric: DistributionMetric, starting_capital: float
+    ) -> np.ndarray:
+        profit_loss: np.ndarray = ledger.net_profit_loss
+
+        if metric == DistributionMetric.ProfitLoss:
+            return profit_loss
+
+        if metric == DistributionMetric.Returns:
+            # Returns on the equity before each trade, same as the trade statistics.
+            previous_equity: np.ndarray = (
+                starting_capital + np.cumsum(profit_loss) - profit_loss
+            )
+            return np.divide(
+                profit_loss,
+                previous_equity,
+                out=np.zeros_like(profit_loss),
+                where=previous_equity != 0,
+            )
+
+        if metric == DistributionMetric.Duration:
+            return ledger.duration / 3600
+
+        if metric == DistributionMetric.RMultiple:
+            # R is the average loss, same as the system quality number.
+            lossing_profit_loss: np.ndarray = profit_loss[profit_loss <= 0]
+            r: float = (
+                abs(float(lossing_profit_loss.mean()))
+                if len(lossing_profit_loss) != 0
+                else 0
+            )
+            return profit_loss / r if r != 0 else np.zeros_like(profit_loss)
+
+        raise ValueError(f"Unsupported distribution metric: {metric}")
+
+    @classmethod
+    def build_values(
+        cls, metric: DistributionMetric, values: np.ndarray
+    ) -> TradeDistribution:
+        distribution: TradeDistribution = TradeDistribution(metric)
+        number_of_values: int = len(values)
+
+        if number_of_values == 0:
+            return distribution
+
+        distribution.number_of_values = number_of_values
+        distribution.counts, distribution.bin_edges = np.histogram(
+            values, bins=cls.NUMBER_OF_BINS
+        )
+
+        quantiles: np.ndarray = np.quantile(values, TradeDistribution.QUANTILES)
+        distribution.quantiles = dict(
+            zip(TradeDistribution.QUANTILES, quantiles.tolist())
+        )
+
+        mean: float = float(values.mean())
+        deviations: np.ndarray = values - mean
+        variance: float = float(np.dot(deviations, deviations)) / number_of_values
+        standard_deviation: float = variance**0.5
+
+        distribution.mean = mean
+        distribution.standard_deviation = standard_deviation
+        distribution.min = float(values.min())
+        distribution.max = float(values.max())
+
+        if standard_deviation != 0:
+            standardized: np.ndarray = deviations / standard_deviation
+            squared: np.ndarray = standardized * standardized
+            distribution.skewness = (
+                float(np.dot(squared, standardized)) / number_of_values
+            )
+            distribution.kurtosis = (
+                float(np.dot(squared, squared)) / number_of_values - 3
+            )
+
+        lower: float = distribution.quantiles[0.05]
+        upper: float = distribution.quantiles[0.95]
+        distribution.left_tail_mean = float(values[values <= lower].mean())
+        distribution.right_tail_mean = float(values[values >= upper].mean())
+        distribution.tail_ratio = upper / abs(lower) if lower != 0 else 0
+        return distribution
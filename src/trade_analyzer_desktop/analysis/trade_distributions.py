@@ -0,0 +1,48 @@
+from typing import Dict, Tuple, Union
+
+from ..enums import Side
+from .analysis_results import AnalysisResults
+from .distribution_metric import DistributionMetric
+from .statistics_results import StatisticsResults
+from .strategy_performance import StrategyPerformance
+from .trade_distribution import TradeDistribution
+from .trade_distribution_builder import TradeDistributionBuilder
+
+
+class TradeDistributions:
+    """
+    The class represents trade distributions of analysis results, built on first access of each result key and side.
+    """
+
+    def __init__(self, results: AnalysisResults) -> None:
+        self.__results: AnalysisResults = results
+        self.__distributions: Dict[
+            Tuple[str, Side], Dict[DistributionMetric, TradeDistribution]
+        ] = {}
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    def get(
+        self, key: str, side: Side, metric: DistributionMetric
+    ) -> Union[TradeDistribution, None]:
+        """
+        Returns None for results which have no trades, e.g. benchmark.
+        """
+        if (key, side) not in self.__distributions:
+            statistics_results: Union[StatisticsResults, None] = self.__results.get(key)
+
+            if statistics_results is None or not isinstance(
+                statistics_results.total_performance, StrategyPerformance
+            ):
+                return None
+
+            performance: StrategyPerformance = statistics_results.total_performance
+
+            if side == Side.Long:
+                performance = performance.long
+            elif side == Side.Short:
+                performance = performance.short
+
+            self.__distributions[(key, side)] = TradeDistributionBuilder.build(
+                performance.ledger, self.__results.starting_capital
+            )
+        return self.__distributions[(key, side)].get(metric)
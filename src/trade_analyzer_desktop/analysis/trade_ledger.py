@@ -0,0 +1,239 @@
+from typing import Any, Dict, List
+
+import numpy as np
+
+from ..entities import Trade
+from ..enums import Side
+
+
+class TradeLedger:
+    """
+    The class represents a list of closed trades as parallel columns, so statistics can be computed as vectorized reductions.
+    """
+
+    LONG: int = 1
+    SHORT: int = -1
+
+    def __init__(
+        self,
+        trades: List[Trade],
+        strategy_ids: List[str],
+        entry_time: np.ndarray,
+        exit_time: np.ndarray,
+        side: np.ndarray,
+        size: np.ndarray,
+        entry_price: np.ndarray,
+        exit_price: np.ndarray,
+        gross_profit_loss: np.ndarray,
+        fee: np.ndarray,
+        mae: np.ndarray,
+        mfe: np.ndarray,
+        strategy_index: np.ndarray,
+    ) -> None:
+        self.__trades: List[Trade] = list(trades)
+        self.__strategy_ids: List[str] = list(strategy_ids)
+        self.__entry_time: np.ndarray = entry_time
+        self.__exit_time: np.ndarray = exit_time
+        self.__side: np.ndarray = side
+        self.__size: np.ndarray = size
+        self.__entry_price: np.ndarray = entry_price
+        self.__exit_price: np.ndarray = exit_price
+        self.__gross_profit_loss: np.ndarray = gross_profit_loss
+        self.__fee: np.ndarray = fee
+        self.__net_profit_loss: np.ndarray = gross_profit_loss - fee
+        self.__mae: np.ndarray = mae
+        self.__mfe: np.ndarray = mfe
+        self.__strategy_index: np.ndarray = strategy_index
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def trades(self) -> List[Trade]:
+        return self.__trades
+
+    @property
+    def strategy_ids(self) -> List[str]:
+        return self.__strategy_ids
+
+    @property
+    def entry_time(self) -> np.ndarray:
+        """
+        Entry date/time of each trade as datetime64[s].
+        """
+        return self.__entry_time
+
+    @property
+    def exit_time(self) -> np.ndarray:
+        """
+        Exit date/time of each trade as datetime64[s].
+        """
+        return self.__exit_time
+
+    @property
+    def exit_date(self) -> np.ndarray:
+        """
+        Exit date of each trade as datetime64[D].
+        """
+        return self.__exit_time.astype("datetime64[D]")
+
+    @property
+    def duration(self) -> np.ndarray:
+        """
+        Duration of each trade in seconds.
+        """
+        return (self.__exit_time - self.__entry_time).astype(np.float64)
+
+    @property
+    def side(self) -> np.ndarray:
+        """
+        Side of each trade, 1 for long and -1 for short.
+        """
+        return self.__side
+
+    @property
+    def size(self) -> np.ndarray:
+        return self.__size
+
+    @property
+    def entry_price(self) -> np.ndarray:
+        return self.__entry_price
+
+    @property
+    def exit_price(self) -> np.ndarray:
+        return self.__exit_price
+
+    @property
+    def gross_profit_loss(self) -> np.ndarray:
+        return self.__gross_profit_loss
+
+    @property
+    def fee(self) -> np.ndarray:
+        return self.__fee
+
+    @property
+    def net_profit_loss(self) -> np.ndarray:
+        return self.__net_profit_loss
+
+    @property
+    def mae(self) -> np.ndarray:
+        return self.__mae
+
+    @property
+    def mfe(self) -> np.ndarray:
+        return self.__mfe
+
+    @property
+    def strategy_index(self) -> np.ndarray:
+        """
+        Index of each trade's strategy id in `strategy_ids`.
+        """
+        return self.__strategy_index
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    @classmethod
+    def from_trades(cls, trades: List[Trade]) -> "TradeLedger":
+        """
+        Create ledger from closed trades, keeping the order of the given list.
+        """
+        strategy_indices: Dict[str, int] = {}
+        strategy_index: List[int] = []
+
+        for trade in trades:
+            strategy_index.append(
+                strategy_indices.setdefault(trade.strategy_id, len(strategy_indices))
+            )
+
+        return cls(
+            trades,
+            list(strategy_indices.keys()),
+            np.array([trade.entry_time for trade in trades], dtype="datetime64[s]"),
+            np.array([trade.exit_time for trade in trades], dtype="datetime64[s]"),
+            np.array(
+                [
+                    cls.LONG if trade.side == Side.Long else cls.SHORT
+                    for trade in trades
+                ],
+                dtype=np.int8,
+            ),
+            np.array([trade.trade_size for trade in trades], dtype=np.float64),
+            np.array([trade.entry_price for trade in trades], dtype=np.float64),
+            np.array([trade.exit_price for trade in trades], dtype=np.float64),
+            np.array([trade.gross_profit_loss for trade in trades], dtype=np.float64),
+            np.array([trade.fee for trade in trades], dtype=np.float64),
+            np.array([trade.mae for trade in trades], dtype=np.float64),
+            np.array([trade.mfe for trade in trades], dtype=np.float64),
+            np.array(strategy_index, dtype=np.int32),
+        )
+
+    @classmethod
+    def concatenate(cls, ledgers: List["TradeLedger"]) -> "TradeLedger":
+        """
+        Combine ledgers into one ordered by exit time, trades are shared with the given ledgers.
+        """
+        strategy_indices: Dict[str, int] = {}
+        strategy_index: List[np.ndarray] = []
+
+        for ledger in ledgers:
+            mapping: np.ndarray = np.array(
+                [
+                    strategy_indices.setdefault(strategy_id, len(strategy_indices))
+                    for strategy_id in ledger.strategy_ids
+                ],
+                dtype=np.int32,
+            )
+            strategy_index.append(mapping[ledger.strategy_index])
+
+        combined: TradeLedger = cls(
+            [trade for ledger in ledgers for trade in ledger.trades],
+            list(strategy_indices.keys()),
+            cls.__concatenate(
+                [ledger.entry_time for ledger in ledgers], "datetime64[s]"
+            ),
+            cls.__concatenate(
+                [ledger.exit_time for ledger in ledgers], "datetime64[s]"
+            ),
+            cls.__concatenate([ledger.side for ledger in ledgers], np.int8),
+            cls.__concatenate([ledger.size for ledger in ledgers], np.float64),
+            cls.__concatenate([ledger.entry_price for ledger in ledgers], np.float64),
+            cls.__concatenate([ledger.exit_price for ledger in ledgers], np.float64),
+            cls.__concatenate(
+                [ledger.gross_profit_loss for ledger in ledgers], np.float64
+            ),
+            cls.__concatenate([ledger.fee for ledger in ledgers], np.float64),
+            cls.__concatenate([ledger.mae for ledger in ledgers], np.float64),
+            cls.__concatenate([ledger.mfe for ledger in ledgers], np.float64),
+            cls.__concatenate(strategy_index, np.int32),
+        )
+
+        # Stable, so trades with the same exit time keep the order of the given ledgers.
+        return combined.select(np.argsort(combined.exit_time, kind="stable"))
+
+    def select(self, mask: np.ndarray) -> "TradeLedger":
+        """
+        Returns a new ledger with the rows of the given boolean mask or index array.
+        """
+        indices: np.ndarray = (
+            np.flatnonzero(mask) if mask.dtype == np.bool_ else np.asarray(mask)
+        )
+        return TradeLedger(
+            [self.__trades[i] for i in indices],
+            self.__strategy_ids,
+            self.__entry_time[indices],
+            self.__exit_time[indices],
+            self.__side[indices],
+            self.__size[indices],
+            self.__entry_price[indices],
+            self.__exit_price[indices],
+            self.__gross_profit_loss[indices],
+            self.__fee[indices],
+            self.__mae[indices],
+            self.__mfe[indices],
+            self.__strategy_index[indices],
+        )
+
+    def __len__(self) -> int:
+        return len(self.__exit_time)
+
+    # -------------------------------------------------- Private Methods --------------------------------------------------
+    @staticmethod
+    def __concatenate(columns: List[np.ndarray], dtype: Any) -> np.ndarray:
+        return np.concatenate(columns) if columns else np.array([], dtype=dtype)
@@ -0,0 +1,527 @@
+import copy
+import math
+from typing import List, Tuple
+from datetime import timedelta as TimeDelta
+
+import numpy as np
+
+from .trade_ledger import TradeLedger
+from .trade_statistics import TradeStatistics
+
+
+class TradeStatisticsAccumulator:
+    """
+    The class represents the running state of trade statistics over a chunk of closed trades.
+
+    Accumulators of chunks are merged associatively. Counts, sums, moments and extremes do not depend on the order of the chunks,
+    streaks, drawdowns and peaks are kept as summaries of the path, so those are exact when the later chunk is merged into the earlier one.
+    """
+
+    def __init__(self) -> None:
+        self.number_of_trades: int = 0
+        self.number_of_winning_trades: int = 0
+        self.number_of_lossing_trades: int = 0
+
+        self.first_entry_time: np.datetime64 = np.datetime64("NaT", "s")
+        self.start_datetime: np.datetime64 = np.datetime64("NaT", "s")
+        self.end_datetime: np.datetime64 = np.datetime64("NaT", "s")
+
+        # Sums
+        self.total_profit: float = 0
+        self.total_loss: float = 0
+        self.total_fees: float = 0
+        self.total_mae: float = 0
+        self.total_mfe: float = 0
+        self.total_duration: float = 0
+        self.total_winning_duration: float = 0
+        self.total_lossing_duration: float = 0
+
+        # Moments (Welford), mean and sum of squared deviations.
+        self.mean: float = 0
+        self.squared_deviations: float = 0
+        self.lossing_mean: float = 0
+        self.lossing_squared_deviations: float = 0
+
+        # Extremes
+        self.largest_profit: float = 0
+        self.largest_loss: float = 0
+        self.largest_mae: float = 0
+        self.largest_mfe: float = 0
+        self.max_end_trade_drawdown: float = 0
+
+        # Streaks, runs of the same outcome at both ends of the chunk.
+        self.first_run_is_winning: bool = False
+        self.first_run_length: int = 0
+        self.last_run_is_winning: bool = False
+        self.last_run_length: int = 0
+        self.max_consecutive_winning_trades: int = 0
+        self.max_consecutive_lossing_trades: int = 0
+
+        # Path summaries, totals are relative to the start of the chunk.
+        self.total_net_profit: float = 0
+        self.peak: float = -math.inf  # Max total profit/loss.
+        self.closed_trade_lowest: float = (
+            math.inf
+        )  # Min total profit/loss at a lossing trade.
+        self.closed_trade_drawdown: float = (
+            math.inf
+        )  # Min drawdown at a lossing trade from the peak within the chunk.
+        self.intra_trade_peak: float = -math.inf  # Max total profit/loss with mfe.
+        self.intra_trade_lowest: float = math.inf  # Min total profit/loss with mae.
+        self.intra_trade_drawdown: float = math.inf
+
+        # Trades which make a new peak within the chunk.
+        self.peak_totals: np.ndarray = np.zeros(0)
+        self.peak_exit_times: np.ndarray = np.zeros(0, dtype="datetime64[s]")
+        self.peak_lossing_counts: np.ndarray = np.zeros(0, dtype=np.int64)
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    @classmethod
+    def from_ledger(cls, ledger: TradeLedger) -> "TradeStatisticsAccumulator":
+        """
+        Builds the accumulator of a chunk of trades ordered by exit time.
+        """
+        accumulator: TradeStatisticsAccumulator = TradeStatisticsAccumulator()
+        number_of_trades: int = len(ledger)
+
+        if number_of_trades == 0:
+            return accumulator
+
+        profit_loss: np.ndarray = ledger.net_profit_loss
+        is_winning: np.ndarray = profit_loss > 0
+        winning_profit_loss: np.ndarray = profit_loss[is_winning]
+        lossing_profit_loss: np.ndarray = profit_loss[~is_winning]
+        duration: np.ndarray = ledger.duration
+
+        accumulator.number_of_trades = number_of_trades
+        accumulator.number_of_winning_trades = len(winning_profit_loss)
+        accumulator.number_of_lossing_trades = len(lossing_profit_loss)
+
+        accumulator.start_datetime = ledger.entry_time.min()
+        accumulator.end_datetime = ledger.exit_time.max()
+
+        accumulator.total_profit = float(winning_profit_loss.sum())
+        accumulator.total_loss = float(lossing_profit_loss.sum())
+        accumulator.total_fees = float(ledger.fee.sum())
+        accumulator.total_mae = float(ledger.mae.sum())
+        accumulator.total_mfe = float(ledger.mfe.sum())
+        accumulator.total_duration = float(duration.sum())
+        accumulator.total_winning_duration = float(duration[is_winning].sum())
+        accumulator.total_lossing_duration = float(duration[~is_winning].sum())
+
+        accumulator.mean = float(profit_loss.mean())
+        accumulator.squared_deviations = float(
+            np.square(profit_loss - accumulator.mean).sum()
+        )
+
+        if len(lossing_profit_loss) != 0:
+            accumulator.lossing_mean = float(lossing_profit_loss.mean())
+            accumulator.lossing_squared_deviations = float(
+                np.square(lossing_profit_loss - accumulator.lossing_mean).sum()
+            )
+
+        accumulator.largest_profit = float(max(0, profit_loss.max()))
+        accumulator.largest_loss = float(min(0, lossing_profit_loss.min(initial=0)))
+        accumulator.largest_mae = float(min(0, ledger.mae.min()))
+        accumulator.largest_mfe = float(max(0, ledger.mfe.max()))
+        accumulator.max_end_trade_drawdown = float(
+            min(0, (profit_loss - ledger.mfe).min())
+        )
+        accumulator.__accumulate_path(ledger)
+        return accumulator
+
+    @classmethod
+    def from_chunks(
+        cls, accumulators: List["TradeStatisticsAccumulator"], ledger: TradeLedger
+    ) -> "TradeStatisticsAccumulator":
+        """
+        Builds the accumulator of chunks whose trades interleave, e.g. strategies of a portfolio, the ledger holds all their trades ordered by exit time.
+        Counts, sums, moments and extremes are merged from the chunks, only the path is accumulated again from the ledger.
+        """
+        accumulator: TradeStatisticsAccumulator = TradeStatisticsAccumulator()
+
+        for chunk in accumulators:
+            accumulator = accumulator.merge(chunk)
+
+        if accumulator.number_of_trades != len(ledger):
+            raise ValueError("Ledger does not hold the trades of the chunks.")
+
+        # Merge may return one of the chunks, which must not be modified.
+        accumulator = copy.copy(accumulator)
+
+        if len(ledger) != 0:
+            accumulator.__accumulate_path(ledger)
+        return accumulator
+
+    def merge(
+        self, other: "TradeStatisticsAccumulator"
+    ) -> "TradeStatisticsAccumulator":
+        """
+        Merges the accumulator of the trades which follow this chunk, neither accumulator is modified.
+        """
+        if other.number_of_trades == 0:
+            return self
+
+        if self.number_of_trades == 0:
+            return other
+
+        merged: TradeStatisticsAccumulator = TradeStatisticsAccumulator()
+        number_of_trades: int = self.number_of_trades + other.number_of_trades
+
+        merged.number_of_trades = number_of_trades
+        merged.number_of_winning_trades = (
+            self.number_of_winning_trades + other.number_of_winning_trades
+        )
+        merged.number_of_lossing_trades = (
+            self.number_of_lossing_trades + other.number_of_lossing_trades
+        )
+
+        merged.first_entry_time = self.first_entry_time
+        merged.start_datetime = min(self.start_datetime, other.start_datetime)
+        merged.end_datetime = max(self.end_datetime, other.end_datetime)
+
+        merged.total_profit = self.total_profit + other.total_profit
+        merged.total_loss = self.total_loss + other.total_loss
+        merged.total_fees = self.total_fees + other.total_fees
+        merged.total_mae = self.total_mae + other.total_mae
+        merged.total_mfe = self.total_mfe + other.total_mfe
+        merged.total_duration = self.total_duration + other.total_duration
+        merged.total_winning_duration = (
+            self.total_winning_duration + other.total_winning_duration
+        )
+        merged.total_lossing_duration = (
+            self.total_lossing_duration + other.total_lossing_duration
+        )
+
+        merged.mean, merged.squared_deviations = self.__merge_moments(
+            self.number_of_trades,
+            self.mean,
+            self.squared_deviations,
+            other.number_of_trades,
+            other.mean,
+            other.squared_deviations,
+        )
+        merged.lossing_mean, merged.lossing_squared_deviations = self.__merge_moments(
+            self.number_of_lossing_trades,
+            self.lossing_mean,
+            self.lossing_squared_deviations,
+            other.number_of_lossing_trades,
+            other.lossing_mean,
+            other.lossing_squared_deviations,
+        )
+
+        merged.largest_profit = max(self.largest_profit, other.largest_profit)
+        merged.largest_loss = min(self.largest_loss, other.largest_loss)
+        merged.largest_mae = min(self.largest_mae, other.largest_mae)
+        merged.largest_mfe = max(self.largest_mfe, other.largest_mfe)
+        merged.max_end_trade_drawdown = min(
+            self.max_end_trade_drawdown, other.max_end_trade_drawdown
+        )
+
+        # The last run of this chunk continues into the first run of the other.
+        is_joined: bool = self.last_run_is_winning == other.first_run_is_winning
+        joined_run_length: int = (
+            self.last_run_length + other.first_run_length if is_joined else 0
+        )
+        merged.first_run_is_winning = self.first_run_is_winning
+        merged.first_run_length = (
+            joined_run_length
+            if is_joined and self.first_run_length == self.number_of_trades
+            else self.first_run_length
+        )
+        merged.last_run_is_winning = other.last_run_is_winning
+        merged.last_run_length = (
+            joined_run_length
+            if is_joined and other.last_run_length == other.number_of_trades
+            else other.last_run_length
+        )
+        merged.max_consecutive_winning_trades = max(
+            self.max_consecutive_winning_trades,
+            other.max_consecutive_winning_trades,
+            joined_run_length if is_joined and self.last_run_is_winning else 0,
+        )
+        merged.max_consecutive_lossing_trades = max(
+            self.max_consecutive_lossing_trades,
+            other.max_consecutive_lossing_trades,
+            joined_run_length if is_joined and not self.last_run_is_winning else 0,
+        )
+
+        # Totals of the other chunk are shifted by the total of this one,
+        # its drawdowns are also measured from the peak of this chunk.
+        offset: float = self.total_net_profit
+        merged.total_net_profit = offset + other.total_net_profit
+        merged.peak = max(self.peak, offset + other.peak)
+        merged.closed_trade_lowest = min(
+            self.closed_trade_lowest, offset + other.closed_trade_lowest
+        )
+        merged.closed_trade_drawdown = min(
+            self.closed_trade_drawdown,
+            offset + other.closed_trade_lowest - self.peak,
+            other.closed_trade_drawdown,
+        )
+        merged.intra_trade_peak = max(
+            self.intra_trade_peak, offset + other.intra_trade_peak
+        )
+        merged.intra_trade_lowest = min(
+            self.intra_trade_lowest, offset + other.intra_trade_lowest
+        )
+        merged.intra_trade_drawdown = min(
+            self.intra_trade_drawdown,
+            offset + other.intra_trade_lowest - self.intra_trade_peak,
+            other.intra_trade_drawdown,
+        )
+
+        is_new_peak: np.ndarray = offset + other.peak_totals > self.peak
+        merged.peak_totals = np.concatenate(
+            (self.peak_totals, offset + other.peak_totals[is_new_peak])
+        )
+        merged.peak_exit_times = np.concatenate(
+            (self.peak_exit_times, other.peak_exit_times[is_new_peak])
+        )
+        merged.peak_lossing_counts = np.concatenate(
+            (
+                self.peak_lossing_counts,
+                self.number_of_lossing_trades + other.peak_lossing_counts[is_new_peak],
+            )
+        )
+        return merged
+
+    def fill(self, trade_statistics: TradeStatistics) -> None:
+        """
+        Sets the summary statistics, the series by trade number are not included.
+        """
+        number_of_trades: int = self.number_of_trades
+
+        if number_of_trades == 0:
+            return
+
+        trade_statistics.start_datetime = self.start_datetime.item()
+        trade_statistics.end_datetime = self.end_datetime.item()
+
+        trade_statistics.total_number_of_trades = number_of_trades
+        trade_statistics.number_of_winning_trades = self.number_of_winning_trades
+        trade_statistics.number_of_lossing_trades = self.number_of_lossing_trades
+
+        trade_statistics.total_net_profit = self.total_net_profit
+        trade_statistics.total_profit = self.total_profit
+        trade_statistics.total_loss = self.total_loss
+        trade_statistics.total_fees = self.total_fees
+
+        trade_statistics.largest_profit = self.largest_profit
+        trade_statistics.largest_loss = self.largest_loss
+        trade_statistics.largest_mae = self.largest_mae
+        trade_statistics.largest_mfe = self.largest_mfe
+
+        trade_statistics.average_profit_loss = self.mean
+        trade_statistics.average_profit = (
+            self.total_profit / self.number_of_winning_trades
+            if self.number_of_winning_trades != 0
+            else 0
+        )
+        trade_statistics.average_loss = (
+            self.total_loss / self.number_of_lossing_trades
+            if self.number_of_lossing_trades != 0
+            else 0
+        )
+        trade_statistics.average_mae = self.total_mae / number_of_trades
+        trade_statistics.average_mfe = self.total_mfe / number_of_trades
+
+        trade_statistics.avearage_trade_duration = TimeDelta(
+            seconds=self.total_duration / number_of_trades
+        )
+        trade_statistics.average_winning_trade_duration = TimeDelta(
+            seconds=(
+                self.total_winning_duration / self.number_of_winning_trades
+                if self.number_of_winning_trades != 0
+                else 0
+            )
+        )
+        trade_statistics.average_lossing_trade_duration = TimeDelta(
+            seconds=(
+                self.total_lossing_duration / self.number_of_lossing_trades
+                if self.number_of_lossing_trades != 0
+                else 0
+            )
+        )
+
+        trade_statistics.max_consecutive_winning_trades = (
+            self.max_consecutive_winning_trades
+        )
+        trade_statistics.max_consecutive_lossing_trades = (
+            self.max_consecutive_lossing_trades
+        )
+
+        # Drawdowns of the whole path are measured from a peak of at least 0.
+        trade_statistics.max_closed_trade_drawdown = min(
+            0, self.closed_trade_lowest, self.closed_trade_drawdown
+        )
+        trade_statistics.max_intra_trade_drawdown = min(
+            0, self.intra_trade_lowest, self.intra_trade_drawdown
+        )
+        trade_statistics.max_end_trade_drawdown = self.max_end_trade_drawdown
+
+        # Drawdown duration is measured from the previous peak to the exit of the trade which makes a new peak.
+        is_above_zero: np.ndarray = self.peak_totals > 0
+        peak_exit_times: np.ndarray = self.peak_exit_times[is_above_zero]
+        peak_lossing_counts: np.ndarray = self.peak_lossing_counts[is_above_zero]
+
+        if len(peak_exit_times) != 0:
+            previous_peak_time: np.ndarray = np.concatenate(
+                ([self.first_entry_time], peak_exit_times[:-1])
+            )
+            is_recovered: np.ndarray = (
+                np.diff(np.concatenate(([0], peak_lossing_counts))) > 0
+            )
+
+            if is_recovered.any():
+                durations: np.ndarray = (peak_exit_times - previous_peak_time)[
+                    is_recovered
+                ]
+                trade_statistics.max_drawdown_duration = max(
+                    TimeDelta(), durations.max().item()
+                )
+
+        # Standard deviation and downside deviation are sample statistics.
+        trade_statistics.profit_loss_standard_deviation = (
+            math.sqrt(self.squared_deviations / (number_of_trades - 1))
+            if number_of_trades > 1
+            else 0
+        )
+        trade_statistics.profit_loss_downside_deviation = (
+            math.sqrt(
+                self.lossing_squared_deviations / (self.number_of_lossing_trades - 1)
+            )
+            if self.number_of_lossing_trades > 1
+            else 0
+        )
+
+        # System quality number from R-multiples, where R is the average loss,
+        # so it is the ratio of the mean to the population standard deviation.
+        population_standard_deviation: float = math.sqrt(
+            self.squared_deviations / number_of_trades
+        )
+        trade_statistics.system_quality_number = (
+            self.mean / population_standard_deviation * math.sqrt(100)
+            if trade_statistics.average_loss != 0 and population_standard_deviation != 0
+            else 0
+        )
+
+        trade_statistics.profit_loss_ratio = (
+            trade_statistics.average_profit / abs(trade_statistics.average_loss)
+            if trade_statistics.average_loss != 0
+            else 0
+        )
+        trade_statistics.win_rate = (
+            trade_statistics.number_of_winning_trades
+            / trade_statistics.total_number_of_trades
+            if trade_statistics.total_number_of_trades != 0
+            else 0
+        )
+        trade_statistics.profit_factor = (
+            trade_statistics.total_profit / abs(trade_statistics.total_loss)
+            if trade_statistics.total_loss != 0
+            else 0
+        )
+        trade_statistics.sharpe_ratio = (
+            trade_statistics.average_profit_loss
+            / trade_statistics.profit_loss_standard_deviation
+            if trade_statistics.profit_loss_standard_deviation != 0
+            else 0
+        )
+        trade_statistics.sortino_ratio = (
+            trade_statistics.average_profit_loss
+            / trade_statistics.profit_loss_downside_deviation
+            if trade_statistics.profit_loss_downside_deviation != 0
+            else 0
+        )
+        trade_statistics.profit_to_max_drawdown_ratio = (
+            trade_statistics.total_net_profit
+            / abs(trade_statistics.max_closed_trade_drawdown)
+            if trade_statistics.max_closed_trade_drawdown != 0
+            else 0
+        )
+        trade_statistics.average_end_trade_drawdown = (
+            trade_statistics.average_profit_loss - trade_statistics.average_mae
+        )
+
+    # -------------------------------------------------- Private Methods --------------------------------------------------
+    def __accumulate_path(self, ledger: TradeLedger) -> None:
+        """
+        Sets the streaks, path summaries and peaks of trades ordered by exit time.
+        """
+        number_of_trades: int = len(ledger)
+        profit_loss: np.ndarray = ledger.net_profit_loss
+        is_winning: np.ndarray = profit_loss > 0
+
+        self.first_entry_time = ledger.entry_time[0]
+
+        run_starts: np.ndarray = np.flatnonzero(
+            np.concatenate(([True], is_winning[1:] != is_winning[:-1]))
+        )
+        run_lengths: np.ndarray = np.diff(np.append(run_starts, number_of_trades))
+        run_is_winning: np.ndarray = is_winning[run_starts]
+
+        self.first_run_is_winning = bool(run_is_winning[0])
+        self.first_run_length = int(run_lengths[0])
+        self.last_run_is_winning = bool(run_is_winning[-1])
+        self.last_run_length = int(run_lengths[-1])
+        self.max_consecutive_winning_trades = int(
+            run_lengths[run_is_winning].max(initial=0)
+        )
+        self.max_consecutive_lossing_trades = int(
+            run_lengths[~run_is_winning].max(initial=0)
+        )
+
+        total_profit_loss: np.ndarray = np.cumsum(profit_loss)
+        max_total_profit_loss: np.ndarray = np.maximum.accumulate(total_profit_loss)
+        previous_total_profit_loss: np.ndarray = total_profit_loss - profit_loss
+        intra_trade_lowest: np.ndarray = previous_total_profit_loss + ledger.mae
+        intra_trade_highest: np.ndarray = previous_total_profit_loss + ledger.mfe
+
+        self.total_net_profit = float(total_profit_loss[-1])
+        self.peak = float(max_total_profit_loss[-1])
+        self.closed_trade_lowest = float(
+            total_profit_loss[~is_winning].min(initial=math.inf)
+        )
+        self.closed_trade_drawdown = float(
+            (total_profit_loss - max_total_profit_loss)[~is_winning].min(
+                initial=math.inf
+            )
+        )
+        self.intra_trade_peak = float(intra_trade_highest.max())
+        self.intra_trade_lowest = float(intra_trade_lowest.min())
+        self.intra_trade_drawdown = float(
+            (intra_trade_lowest - np.maximum.accumulate(intra_trade_highest)).min()
+        )
+
+        is_new_peak: np.ndarray = total_profit_loss > np.concatenate(
+            ([-math.inf], max_total_profit_loss[:-1])
+        )
+        self.peak_totals = total_profit_loss[is_new_peak]
+        self.peak_exit_times = ledger.exit_time[is_new_peak]
+        self.peak_lossing_counts = np.cumsum(~is_winning)[is_new_peak]
+
+    @staticmethod
+    def __merge_moments(
+        count1: int,
+        mean1: float,
+        squared_deviations1: float,
+        count2: int,
+        mean2: float,
+        squared_deviations2: float,
+    ) -> Tuple[float, float]:
+        """
+        Merges means and sums of squared deviations of two samples (Chan et al.).
+        """
+        count: int = count1 + count2
+
+        if count == 0:
+            return 0, 0
+
+        delta: float = mean2 - mean1
+        return (
+            mean1 + delta * count2 / count,
+            squared_deviations1
+            + squared_deviations2
+            + delta * delta * count1 * count2 / count,
+        )
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class WalkForwardMode(Enum):
+    Anchored = "Anchored"  # In-sample windows all start at the start date.
+    Rolling = "Rolling"  # In-sample windows have a fixed length.
@@ -0,0 +1,180 @@
+import calendar
+from typing import Dict, List, Union
+from datetime import date as Date, timedelta as TimeDelta
+
+import numpy as np
+
+from ..entities import Strategy as StrategyModel
+from .analysis_results import AnalysisResults
+from .analyzer import Analyzer
+from .benchmark_symbol import BenchmarkSymbol
+from .composite_benchmark import CompositeBenchmark
+from .statistics_builder import StatisticsBuilder
+from .statistics_results import StatisticsResults
+from .trade_ledger import TradeLedger
+from .walk_forward_mode import WalkForwardMode
+from .walk_forward_window import WalkForwardWindow
+
+
+class WalkForwardRunner:
+    @classmethod
+    def run(
+        cls,
+        strategies: List[StrategyModel],
+        starting_capital: float,
+        start_date: Date,
+        end_date: Date,
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark],
+        in_sample_months: int,
+        out_of_sample_months: int,
+        mode: WalkForwardMode = WalkForwardMode.Rolling,
+        max_workers: int = 1,
+    ) -> List[WalkForwardWindow]:
+        """
+        Analyzes the whole date range once, then builds the results of every in-sample/out-of-sample window from it.
+        """
+        results: AnalysisResults = Analyzer.analyze_strategies(
+            strategies,
+            starting_capital,
+            start_date,
+            end_date,
+            benchmark_symbol,
+            max_workers,
+        )
+        windows: List[WalkForwardWindow] = cls.split(
+            start_date, end_date, in_sample_months, out_of_sample_months, mode
+        )
+
+        for window in windows:
+            window.in_sample_results = cls.slice(
+                results, window.in_sample_start_date, window.in_sample_end_date
+            )
+            window.out_of_sample_results = cls.slice(
+                results,
+                window.out_of_sample_start_date,
+                window.out_of_sample_end_date,
+            )
+        return windows
+
+    @classmethod
+    def split(
+        cls,
+        start_date: Date,
+        end_date: Date,
+        in_sample_months: int,
+        out_of_sample_months: int,
+        mode: WalkForwardMode = WalkForwardMode.Rolling,
+    ) -> List[WalkForwardWindow]:
+        """
+        Splits a date range into windows, out-of-sample periods follow each other and the last one ends at the end date.
+        """
+        if in_sample_months <= 0 or out_of_sample_months <= 0:
+            raise ValueError("Window lengths must be positive.")
+
+        windows: List[WalkForwardWindow] = []
+        step: int = 0
+
+        while True:
+            out_of_sample_start_date: Date = cls.__add_months(
+                start_date, in_sample_months + step * out_of_sample_months
+            )
+
+            if out_of_sample_start_date > end_date:
+                break
+
+            in_sample_start_date: Date = (
+                start_date
+                if mode == WalkForwardMode.Anchored
+                else cls.__add_months(start_date, step * out_of_sample_months)
+            )
+            windows.append(
+                WalkForwardWindow(
+                    in_sample_start_date,
+                    out_of_sample_start_date - TimeDelta(days=1),
+                    out_of_sample_start_date,
+                    min(
+                        cls.__add_months(
+                            start_date,
+                            in_sample_months + (step + 1) * out_of_sample_months,
+                        )
+                        - TimeDelta(days=1),
+                        end_date,
+                    ),
+                )
+            )
+            step += 1
+        return windows
+
+    @classmethod
+    def slice(
+        cls, results: AnalysisResults, start_date: Date, end_date: Date
+    ) -> AnalysisResults:
+        """
+        Builds the results of a sub-period without replaying orders or fetching the benchmark again.
+        Trades are counted in the period of their exit.
+        """
+        benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark] = (
+            results.benchmark_symbol
+        )
+        benchmark_key: str = f"Benchmark:{BenchmarkSymbol.to_symbol(benchmark_symbol)}"
+        benchmark_results: Union[StatisticsResults, None] = results.get(benchmark_key)
+        assert benchmark_results is not None
+
+        # The first day of a period has no return, same as a benchmark fetched for the period.
+        benchmark_returns: Dict[Date, float] = {
+            date: returns
+            for date, returns in benchmark_results.total_performance.daily_statistics.returns.items()
+            if start_date <= date <= end_date
+        }
+
+        if len(benchmark_returns) != 0:
+            benchmark_returns[next(iter(benchmark_returns))] = 0
+
+        sliced_results: AnalysisResults = AnalysisResults(
+            results.starting_capital, start_date, end_date, benchmark_symbol
+        )
+        lower: np.datetime64 = np.datetime64(start_date, "D")
+        upper: np.datetime64 = np.datetime64(end_date, "D")
+
+        for key in results.keys:
+            if key == benchmark_key:
+                continue
+
+            statistics_results: Union[StatisticsResults, None] = results.get(key)
+            assert statistics_results is not None
+            ledger: TradeLedger = statistics_results.total_performance.ledger
+            exit_date: np.ndarray = ledger.exit_date
+
+            sliced_results.add(
+                key,
+                StatisticsBuilder.build_strategy(
+                    ledger.select((exit_date >= lower) & (exit_date <= upper)),
+                    benchmark_returns,
+                    results.starting_capital,
+                    start_date,
+                    end_date,
+                    statistics_results.total_performance.resolution,
+                ),
+            )
+
+        sliced_results.add(
+            benchmark_key,
+            StatisticsBuilder.build_benchmark(
+                benchmark_symbol,
+                results.starting_capital,
+                start_date,
+                end_date,
+                benchmark_returns,
+            ),
+        )
+        return sliced_results
+
+    @staticmethod
+    def __add_months(date: Date, months: int) -> Date:
+        """
+        Same day of a later month, clamped to the end of the month.
+        """
+        month_index: int = date.month - 1 + months
+        year: int = date.year + month_index // 12
+        month: int = month_index % 12 + 1
+        return Date(year, month, min(date.day, calendar.monthrange(year, month)[1]))
@@ -0,0 +1,26 @@
+from typing import Union
+from datetime import date as Date
+
+from .analysis_results import AnalysisResults
+
+
+class WalkForwardWindow:
+    """
+    The class represents an in-sample period followed by its out-of-sample period.
+    """
+
+    def __init__(
+        self,
+        in_sample_start_date: Date,
+        in_sample_end_date: Date,
+        out_of_sample_start_date: Date,
+        out_of_sample_end_date: Date,
+    ) -> None:
+        self.in_sample_start_date: Date = in_sample_start_date
+        self.in_sample_end_date: Date = in_sample_end_date
+        self.out_of_sample_start_date: Date = out_of_sample_start_date
+        self.out_of_sample_end_date: Date = out_of_sample_end_date
+
+        # Results
+        self.in_sample_results: Union[AnalysisResults, None] = None
+        self.out_of_sample_results: Union[AnalysisResults, None] = None
@@ -0,0 +1,68 @@
+from typing import Dict, List
+from datetime import date as Date, timedelta as TimeDelta
+
+import numpy as np
+from yfinance import Ticker
+from pandas import DataFrame, DatetimeIndex
+
+from ..repositories import BenchmarkPriceRepository
+from .benchmark_provider import BenchmarkProvider
+from .benchmark_symbol import BenchmarkSymbol
+
+
+class YahooFinanceBenchmarkProvider(BenchmarkProvider):
+    def __init__(self) -> None:
+        # Whether yahoo finance has prices of tickers which have been looked up.
+        self.__known_tickers: Dict[str, bool] = {}
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def is_remote(self) -> bool:
+        return True
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    def has_symbol(self, symbol: str) -> bool:
+        """
+        Presets and stored symbols are known, other tickers are looked up once.
+        """
+        if symbol in self.get_symbols():
+            return True
+
+        if BenchmarkPriceRepository.query_range_by_symbol(symbol) is not None:
+            return True
+
+        if symbol not in self.__known_tickers:
+            try:
+                self.__known_tickers[symbol] = (
+                    not Ticker(symbol).history(period="5d").empty
+                )
+            except Exception as exception:
+                # The ticker may still exist, it is looked up again next time.
+                print(f"Failed to look up {symbol} on yahoo finance: {exception}")
+                return True
+        return self.__known_tickers[symbol]
+
+    def get_symbols(self) -> List[str]:
+        return [benchmark_symbol.value for benchmark_symbol in BenchmarkSymbol]
+
+    def fetch_prices(
+        self, symbol: str, start_date: Date, end_date: Date
+    ) -> Dict[Date, float]:
+        data_frame: DataFrame = Ticker(symbol).history(
+            interval="1d",
+            start=start_date.strftime("%Y-%m-%d"),
+            end=(end_date + TimeDelta(days=1)).strftime("%Y-%m-%d"),
+        )
+
+        if data_frame.empty:
+            return {}
+
+        # Bars are stamped at midnight of the exchange, which dates them in its own time zone.
+        index: DatetimeIndex = data_frame.index
+
+        if index.tz is not None:
+            index = index.tz_localize(None)
+
+        dates: np.ndarray = index.normalize().to_numpy().astype("datetime64[D]")
+        closes: np.ndarray = data_frame["Close"].to_numpy(dtype=np.float64)
+        return dict(zip(dates.tolist(), closes.tolist()))
@@ -2,6 +2,14 @@ from PyQt6.QtWidgets import QApplication
 
 from .qt.main_window import MainWindow
 from .database_manager import DatabaseManager
+from .analysis import (
+    Analyzer,
+    ResultsCache,
+    BenchmarkStore,
+    CsvBenchmarkProvider,
+    ParquetBenchmarkProvider,
+)
+from .repositories import OrderRepository, InstrumentRepository
 
 
 class TradeAnalyzerClientDesktop(QApplication):
@@ -10,6 +18,21 @@ class TradeAnalyzerClientDesktop(QApplication):
         # DatabaseManager.reset_database()
         DatabaseManager.connect()
 
+        # Drop cached analysis results whenever the data behind them changes.
+        OrderRepository.register_orders_changed_callback(ResultsCache.on_orders_changed)
+        InstrumentRepository.register_instruments_changed_callback(
+            ResultsCache.on_instruments_changed
+        )
+
+        # Price files of the benchmark directory take precedence over yahoo finance.
+        BenchmarkStore.register_provider(
+            ParquetBenchmarkProvider(BenchmarkStore.DIRECTORY)
+        )
+        BenchmarkStore.register_provider(CsvBenchmarkProvider(BenchmarkStore.DIRECTORY))
+
+        # Worker processes of analyses are kept until the application quits.
+        self.aboutToQuit.connect(Analyzer.shutdown)
+
         self.__main_window: MainWindow = MainWindow()
 
     # -------------------------------------------------- Properties --------------------------------------------------
@@ -45,6 +45,10 @@ class DatabaseManager:
     )
     """
 
+    CREATE_ORDERS_INDEX_SQL: str = """
+    CREATE INDEX IF NOT EXISTS orders_strategy_id_datetime ON orders (strategy_id, datetime)
+    """
+
     CREATE_INSTRUMENTS_TABLE_SQL: str = """
     CREATE TABLE instruments (
         symbol VARCHAR(50) PRIMARY KEY,
@@ -56,6 +60,23 @@ class DatabaseManager:
     )
     """
 
+    CREATE_BENCHMARK_PRICES_TABLE_SQL: str = """
+    CREATE TABLE IF NOT EXISTS benchmark_prices (
+        symbol VARCHAR(50) NOT NULL,
+        date VARCHAR(50) NOT NULL,
+        close FLOAT NOT NULL,
+        PRIMARY KEY (symbol, date)
+    )
+    """
+
+    CREATE_BENCHMARK_PRICE_RANGES_TABLE_SQL: str = """
+    CREATE TABLE IF NOT EXISTS benchmark_price_ranges (
+        symbol VARCHAR(50) NOT NULL PRIMARY KEY,
+        start_date VARCHAR(50) NOT NULL,
+        end_date VARCHAR(50) NOT NULL
+    )
+    """
+
     @classmethod
     def connect(cls) -> None:
         if cls.__sqlite:
@@ -66,6 +87,11 @@ class DatabaseManager:
         cls.__sqlite.open()
         print(f"Sqlite database is connected.")
 
+        # Databases created before the index and benchmark tables existed get them on connect.
+        QSqlQuery().exec(cls.CREATE_ORDERS_INDEX_SQL)
+        QSqlQuery().exec(cls.CREATE_BENCHMARK_PRICES_TABLE_SQL)
+        QSqlQuery().exec(cls.CREATE_BENCHMARK_PRICE_RANGES_TABLE_SQL)
+
     @classmethod
     def reset_database(cls) -> None:
         if os.path.exists(cls.DATABASE_NAME):
@@ -85,7 +111,16 @@ class DatabaseManager:
         if query.exec(cls.CREATE_ORDERS_TABLE_SQL):
             print("Created table orders.")
 
+        if query.exec(cls.CREATE_ORDERS_INDEX_SQL):
+            print("Created index of orders.")
+
         if query.exec(cls.CREATE_INSTRUMENTS_TABLE_SQL):
             print("Created table instruments.")
+
+        if query.exec(cls.CREATE_BENCHMARK_PRICES_TABLE_SQL):
+            print("Created table benchmark_prices.")
+
+        if query.exec(cls.CREATE_BENCHMARK_PRICE_RANGES_TABLE_SQL):
+            print("Created table benchmark_price_ranges.")
         connection.close()
         return
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Optional, Union
 from datetime import date as Date
 
 from PyQt6.QtWidgets import (
@@ -7,21 +7,22 @@ from PyQt6.QtWidgets import (
     QLabel,
     QComboBox,
     QDoubleSpinBox,
+    QLineEdit,
+    QMessageBox,
     QPushButton,
     QDateEdit,
     QGridLayout,
 )
 from PyQt6.QtCore import pyqtSignal
 
-from ..analysis import BenchmarkSymbol
+from ..analysis import BenchmarkSymbol, BenchmarkStore, CompositeBenchmark, Period
 
 
 class AnalysisSettingsDialog(QDialog):
     DATE_FORMAT: str = "yyyy-MM-dd"
 
-    analysis_settings_confirmed: pyqtSignal = pyqtSignal(
-        float, Date, Date, BenchmarkSymbol
-    )
+    # Benchmark is a preset symbol, the string symbol of a provider or a composite benchmark.
+    analysis_settings_confirmed: pyqtSignal = pyqtSignal(float, Date, Date, object)
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
@@ -40,6 +41,12 @@ class AnalysisSettingsDialog(QDialog):
 
         self.__benchmark_combo: QComboBox = QComboBox()
 
+        # Weighted symbols such as "SPY: 60, TLT: 40", which take precedence over the benchmark combo.
+        self.__composite_input: QLineEdit = QLineEdit()
+        self.__composite_input.setPlaceholderText("SPY: 60, TLT: 40")
+
+        self.__rebalance_combo: QComboBox = QComboBox()
+
         self.__confirm_button: QPushButton = QPushButton("Confirm")
         self.__confirm_button.clicked.connect(self.on_confirm_button_clicked)
 
@@ -60,12 +67,26 @@ class AnalysisSettingsDialog(QDialog):
         layout.addWidget(QLabel("Benchmark"), 3, 0, 1, 1)
         layout.addWidget(self.__benchmark_combo, 3, 1, 1, 3)
 
-        layout.addWidget(self.__confirm_button, 4, 0, 1, 2)
-        layout.addWidget(self.__cancel_button, 4, 2, 1, 2)
+        layout.addWidget(QLabel("Composite"), 4, 0, 1, 1)
+        layout.addWidget(self.__composite_input, 4, 1, 1, 3)
+
+        layout.addWidget(QLabel("Rebalance"), 5, 0, 1, 1)
+        layout.addWidget(self.__rebalance_combo, 5, 1, 1, 3)
+
+        layout.addWidget(self.__confirm_button, 6, 0, 1, 2)
+        layout.addWidget(self.__cancel_button, 6, 2, 1, 2)
         # Data
         for i, symbol in enumerate(BenchmarkSymbol):
             self.__benchmark_combo.addItem(symbol.value, symbol)
 
+        for symbol in BenchmarkStore.get_symbols():
+            if self.__benchmark_combo.findText(symbol) == -1:
+                self.__benchmark_combo.addItem(symbol, symbol)
+
+        for period in Period:
+            self.__rebalance_combo.addItem(period.value, period)
+        self.__rebalance_combo.addItem("Buy and Hold", None)
+
     # -------------------------------------------------- Properties --------------------------------------------------
     @property
     def starting_capital(self) -> float:
@@ -92,14 +113,29 @@ class AnalysisSettingsDialog(QDialog):
         self.__end_date_input.setDate(date)
 
     @property
-    def benchmark_symbol(self) -> BenchmarkSymbol:
-        return self.__benchmark_combo.currentData()
+    def benchmark_symbol(self) -> Union[BenchmarkSymbol, str, CompositeBenchmark]:
+        """
+        Raises ValueError when the composite input is not valid.
+        """
+        if self.__composite_input.text().strip() == "":
+            return self.__benchmark_combo.currentData()
+        return self.__parse_composite(
+            self.__composite_input.text(), self.__rebalance_combo.currentData()
+        )
 
     # -------------------------------------------------- Event Handlers --------------------------------------------------
     def on_confirm_button_clicked(self, checked: bool) -> None:
+        try:
+            benchmark_symbol: Union[BenchmarkSymbol, str, CompositeBenchmark] = (
+                self.benchmark_symbol
+            )
+        except ValueError as error:
+            QMessageBox.warning(self, "WARN", str(error))
+            return
+
         self.close()
         self.analysis_settings_confirmed.emit(
-            self.starting_capital, self.start_date, self.end_date, self.benchmark_symbol
+            self.starting_capital, self.start_date, self.end_date, benchmark_symbol
         )
 
     def on_cancel_button_clicked(self, checked: bool) -> None:
@@ -108,3 +144,29 @@ class AnalysisSettingsDialog(QDialog):
     # -------------------------------------------------- Public Methods --------------------------------------------------
 
     # -------------------------------------------------- Private Methods --------------------------------------------------
+    @staticmethod
+    def __parse_composite(
+        text: str, rebalance_period: Union[Period, None]
+    ) -> CompositeBenchmark:
+        weights: Dict[Union[BenchmarkSymbol, str], float] = {}
+
+        for component in text.split(","):
+            if component.strip() == "":
+                continue
+
+            symbol, separator, weight = component.partition(":")
+            symbol = symbol.strip()
+
+            if separator == "" or symbol == "":
+                raise ValueError(
+                    f"Composite component must be 'SYMBOL: weight': {component.strip()}"
+                )
+
+            if BenchmarkStore.get_provider(symbol) is None:
+                raise ValueError(f"No benchmark provider serves {symbol}.")
+
+            try:
+                weights[symbol] = float(weight)
+            except ValueError:
+                raise ValueError(f"Invalid weight of {symbol}: {weight.strip()}")
+        return CompositeBenchmark(weights, rebalance_period)
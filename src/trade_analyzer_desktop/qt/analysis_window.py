@@ -4,6 +4,9 @@ from PyQt6.QtWidgets import QWidget, QTabWidget, QGridLayout
 
 from .overview_window import OverviewWindow
 from .equity_chart_window import EquityChartWindow
+from .rolling_chart_window import RollingChartWindow
+from .periodical_returns_window import PeriodicalReturnsWindow
+from .drawdown_episodes_window import DrawdownEpisodesWindow
 from .trade_analysis_window import TradeAnalysisWindow
 from .list_of_trades_window import ListOfTradesWindow
 from .correlation_analysis_window import CorrelationAnalysisWindow
@@ -20,6 +23,13 @@ class AnalysisWindow(QWidget):
         # Widgets
         self.__overview_window: OverviewWindow = OverviewWindow(results)
         self.__equity_chart_window: EquityChartWindow = EquityChartWindow(results)
+        self.__rolling_chart_window: RollingChartWindow = RollingChartWindow(results)
+        self.__periodical_returns_window: PeriodicalReturnsWindow = (
+            PeriodicalReturnsWindow(results)
+        )
+        self.__drawdown_episodes_window: DrawdownEpisodesWindow = (
+            DrawdownEpisodesWindow(results)
+        )
         self.__trade_analysis_window: TradeAnalysisWindow = TradeAnalysisWindow(results)
         self.__list_of_trades_window: ListOfTradesWindow = ListOfTradesWindow(results)
         self.__correlation_analysis_window: CorrelationAnalysisWindow = (
@@ -31,6 +41,17 @@ class AnalysisWindow(QWidget):
         self.__tab.addTab(
             self.__equity_chart_window, self.__equity_chart_window.windowTitle()
         )
+        self.__tab.addTab(
+            self.__rolling_chart_window, self.__rolling_chart_window.windowTitle()
+        )
+        self.__tab.addTab(
+            self.__periodical_returns_window,
+            self.__periodical_returns_window.windowTitle(),
+        )
+        self.__tab.addTab(
+            self.__drawdown_episodes_window,
+            self.__drawdown_episodes_window.windowTitle(),
+        )
         self.__tab.addTab(
             self.__trade_analysis_window, self.__trade_analysis_window.windowTitle()
         )
@@ -16,7 +16,7 @@ from ..entities import BacktestReport, Strategy
 from ..repositories import BacktestReportRepository, OrderRepository, StrategyRepository
 from .analysis_window import AnalysisWindow
 from .analysis_setting_dialog import AnalysisSettingsDialog
-from ..analysis import AnalysisResults, Analyzer, BenchmarkSymbol
+from ..analysis import AnalysisResults, Analyzer, BenchmarkSymbol, CompositeBenchmark
 
 
 class BacktestReportTable(QTableWidget):
@@ -158,7 +158,7 @@ class BacktestReportTable(QTableWidget):
         starting_capital: float,
         start_date: Date,
         end_date: Date,
-        benchmark_sybol: BenchmarkSymbol,
+        benchmark_sybol: Union[BenchmarkSymbol, str, CompositeBenchmark],
     ) -> None:
         results: AnalysisResults = Analyzer.analyze_reports(
             self.selected_backtest_reports,
@@ -166,6 +166,7 @@ class BacktestReportTable(QTableWidget):
             start_date,
             end_date,
             benchmark_sybol,
+            Analyzer.DEFAULT_MAX_WORKERS,
         )
         self.__analysis_window: AnalysisWindow = AnalysisWindow(results)
         self.__analysis_window.showMaximized()
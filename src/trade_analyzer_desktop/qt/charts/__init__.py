@@ -1,5 +1,7 @@
 from .equity_chart import EquityChart
 from .drawdown_chart import DrawdownChart
+from .histogram_chart import HistogramChart
 from .chart_point import ChartPoint
 from .axis_type import AxisType
-from .display_units import DisplayUnits
\ No newline at end of file
+from .display_units import DisplayUnits
+from .rolling_metric import RollingMetric
\ No newline at end of file
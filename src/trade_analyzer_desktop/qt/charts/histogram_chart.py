@@ -0,0 +1,69 @@
+from typing import List
+
+import numpy as np
+from PyQt6.QtCharts import (
+    QChartView,
+    QChart,
+    QBarSeries,
+    QBarSet,
+    QBarCategoryAxis,
+    QValueAxis,
+)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPainter
+
+
+class HistogramChart(QChartView):
+    """
+    A bar chart to display the distribution of values.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Create chart.
+        chart: QChart = QChart()
+        chart.setTheme(QChart.ChartTheme.ChartThemeDark)
+        chart.legend().setVisible(False)
+        self.setChart(chart)
+
+        self.x_axis: QBarCategoryAxis = QBarCategoryAxis()
+        self.x_axis.setLabelsAngle(45)
+        self.x_axis.setGridLineVisible(False)
+
+        self.y_axis: QValueAxis = QValueAxis()
+        self.y_axis.setLabelFormat("%d")
+        self.y_axis.setGridLineVisible(False)
+        chart.addAxis(self.x_axis, Qt.AlignmentFlag.AlignBottom)
+        chart.addAxis(self.y_axis, Qt.AlignmentFlag.AlignLeft)
+
+        self.__series: QBarSeries = QBarSeries()
+        self.__series.setBarWidth(1)
+        chart.addSeries(self.__series)
+        self.__series.attachAxis(self.x_axis)
+        self.__series.attachAxis(self.y_axis)
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    def set_histogram(
+        self, name: str, bin_edges: np.ndarray, counts: np.ndarray, decimals: int = 2
+    ) -> None:
+        """
+        Replace the bars by the counts of each bin, bins are labeled by their lower edges.
+        """
+        self.clear()
+
+        bar_set: QBarSet = QBarSet(name)
+        bar_set.append([float(count) for count in counts.tolist()])
+        self.__series.append(bar_set)
+
+        labels: List[str] = [
+            str(round(edge, decimals)) for edge in bin_edges[:-1].tolist()
+        ]
+        self.x_axis.append(labels)
+        self.y_axis.setRange(0, float(counts.max(initial=0)))
+
+    def clear(self) -> None:
+        self.__series.clear()
+        self.x_axis.clear()
+        self.y_axis.setRange(0, 1)
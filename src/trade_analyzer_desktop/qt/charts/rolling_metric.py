@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class RollingMetric(Enum):
+    Returns = "Returns"
+    Volatility = "Volatility"
+    SharpeRatio = "Sharpe Ratio"
+    Beta = "Beta"
+    Alpha = "Alpha"
+    MaxDrawdown = "Max Drawdown"
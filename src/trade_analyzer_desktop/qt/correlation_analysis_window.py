@@ -1,8 +1,22 @@
 from typing import Optional
 
-from PyQt6.QtWidgets import QWidget, QGridLayout
+import numpy as np
+from PyQt6.QtWidgets import (
+    QWidget,
+    QGridLayout,
+    QLabel,
+    QComboBox,
+    QTableWidget,
+    QTableWidgetItem,
+)
+from PyQt6.QtGui import QColor
 
-from ..analysis import AnalysisResults
+from ..analysis import (
+    AnalysisResults,
+    CorrelationMatrix,
+    CorrelationMatrices,
+    CorrelationMethod,
+)
 
 
 class CorrelationAnalysisWindow(QWidget):
@@ -13,17 +27,69 @@ class CorrelationAnalysisWindow(QWidget):
         self.setWindowTitle("Correlation Analysis")
 
         # Widgets
+        self.__method_combo: QComboBox = QComboBox()
+
+        self.__correlation_table: QTableWidget = QTableWidget()
+        self.__correlation_table.setEditTriggers(
+            QTableWidget.EditTrigger.NoEditTriggers
+        )
 
         # Layout
         layout: QGridLayout = QGridLayout(self)
+        layout.addWidget(QLabel("Method"), 0, 0, 1, 1)
+        layout.addWidget(self.__method_combo, 0, 1, 1, 3)
+        layout.addWidget(self.__correlation_table, 1, 0, 9, 10)
 
         # Default Data
         self.__analysis_results: AnalysisResults = results
+        self.__correlation_matrices: CorrelationMatrices = CorrelationMatrices(results)
+
+        for method in CorrelationMethod:
+            self.__method_combo.addItem(method.value, method)
+
+        self.__method_combo.currentIndexChanged.connect(
+            self.on_method_combo_current_index_changed
+        )
 
     # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def current_method(self) -> CorrelationMethod:
+        return self.__method_combo.currentData()
 
     # -------------------------------------------------- Event Handlers --------------------------------------------------
+    def on_method_combo_current_index_changed(self, index: int) -> None:
+        self.reload_table()
+
+    def showEvent(self, event) -> None:
+        # The matrix is built when the tab is shown first.
+        if self.__correlation_table.rowCount() == 0:
+            self.reload_table()
+        super().showEvent(event)
 
     # -------------------------------------------------- Public Methods --------------------------------------------------
+    def reload_table(self) -> None:
+        correlation_matrix: CorrelationMatrix = self.__correlation_matrices.get(
+            self.current_method
+        )
+        values: np.ndarray = correlation_matrix.values
+
+        self.__correlation_table.clear()
+        self.__correlation_table.setRowCount(len(correlation_matrix.keys))
+        self.__correlation_table.setColumnCount(len(correlation_matrix.keys))
+        self.__correlation_table.setHorizontalHeaderLabels(correlation_matrix.keys)
+        self.__correlation_table.setVerticalHeaderLabels(correlation_matrix.keys)
+
+        for row, row_values in enumerate(values.tolist()):
+            for column, value in enumerate(row_values):
+                item: QTableWidgetItem = QTableWidgetItem(str(round(value, 2)))
+                item.setBackground(self.__get_color(value))
+                self.__correlation_table.setItem(row, column, item)
 
     # -------------------------------------------------- Private Methods --------------------------------------------------
+    @staticmethod
+    def __get_color(value: float) -> QColor:
+        """
+        Green for positive and red for negative correlations, stronger for larger magnitudes.
+        """
+        alpha: int = int(abs(value) * 160)
+        return QColor(0, 160, 0, alpha) if value >= 0 else QColor(200, 0, 0, alpha)
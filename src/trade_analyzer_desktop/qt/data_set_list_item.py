@@ -1,9 +1,10 @@
-from typing import Optional, Union, List
+from typing import Optional, Union, List, Dict, Tuple
+from datetime import date as Date, datetime as DateTime
 
 from PyQt6.QtWidgets import QWidget, QGridLayout, QLabel, QCheckBox
 from PyQt6.QtCore import pyqtSignal
 
-from .charts import AxisType, DisplayUnits, ChartPoint
+from .charts import AxisType, DisplayUnits, ChartPoint, RollingMetric
 from ..enums import Side
 from ..analysis import (
     StatisticsResults,
@@ -11,10 +12,14 @@ from ..analysis import (
     BenchmarkPerformance,
     TradeStatistics,
     DailyStatistics,
+    RollingStatistics,
+    IntradayEquity,
 )
 
 
 class DataSetListItem(QWidget):
+    MAX_INTRADAY_CHART_POINTS: int = 5000
+
     checked: pyqtSignal = pyqtSignal(str, bool)
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
@@ -145,6 +150,46 @@ class DataSetListItem(QWidget):
 
         return drawdown_chart_points
 
+    def get_intraday_chart_points(
+        self, side: Side, display_units: DisplayUnits
+    ) -> Tuple[List[ChartPoint], List[ChartPoint]]:
+        """
+        Equity and drawdown points at the resolution of the strategy, benchmark has daily points only.
+        """
+        assert self.statistics_results is not None
+
+        if self.is_benchmark:
+            return (
+                self.get_equity_chart_points(side, AxisType.DateTime, display_units),
+                self.get_drawdown_chart_points(side, AxisType.DateTime, display_units),
+            )
+
+        total_performance: StrategyPerformance = (
+            self.statistics_results.total_performance
+        )
+
+        if side == Side.Long:
+            total_performance = total_performance.long
+        elif side == Side.Short:
+            total_performance = total_performance.short
+
+        intraday_equity: IntradayEquity = total_performance.intraday_equity.downsample(
+            self.MAX_INTRADAY_CHART_POINTS
+        )
+        timestamps: List[DateTime] = intraday_equity.timestamps.tolist()
+
+        if display_units == DisplayUnits.Percentage:
+            equity: List[float] = intraday_equity.cumulative_returns.tolist()
+            drawdown: List[float] = intraday_equity.drawdown_percent.tolist()
+        else:
+            equity = intraday_equity.equity.tolist()
+            drawdown = intraday_equity.drawdown.tolist()
+
+        return (
+            [ChartPoint(x, y) for x, y in zip(timestamps, equity)],
+            [ChartPoint(x, y) for x, y in zip(timestamps, drawdown)],
+        )
+
     def get_profit_loss_chart_points(
         self, side: Side, x_axis_type: AxisType, display_units: DisplayUnits
     ) -> List[ChartPoint]:
@@ -180,4 +225,29 @@ class DataSetListItem(QWidget):
 
         return profit_loss_chart_points
 
+    def get_rolling_chart_points(
+        self, window: int, metric: RollingMetric
+    ) -> List[ChartPoint]:
+        assert self.statistics_results is not None
+
+        if self.statistics_results.rolling_performance is None:
+            return []
+
+        statistics: Optional[RollingStatistics] = (
+            self.statistics_results.rolling_performance.get(window)
+        )
+
+        if not statistics:
+            return []
+
+        series: Dict[Date, float] = {
+            RollingMetric.Returns: statistics.returns,
+            RollingMetric.Volatility: statistics.volatility,
+            RollingMetric.SharpeRatio: statistics.sharpe_ratio,
+            RollingMetric.Beta: statistics.beta,
+            RollingMetric.Alpha: statistics.alpha,
+            RollingMetric.MaxDrawdown: statistics.max_drawdown,
+        }[metric]
+        return [ChartPoint(x, y) for x, y in series.items()]
+
     # -------------------------------------------------- Private Methods --------------------------------------------------
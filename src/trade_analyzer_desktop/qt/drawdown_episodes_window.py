@@ -0,0 +1,131 @@
+from typing import Optional, Union, List
+
+from PyQt6.QtWidgets import (
+    QWidget,
+    QGridLayout,
+    QLabel,
+    QComboBox,
+    QHeaderView,
+    QTableWidget,
+    QTableWidgetItem,
+)
+
+from ..analysis import (
+    AnalysisResults,
+    StatisticsResults,
+    DrawdownEpisode,
+    DrawdownEpisodeIndex,
+)
+
+
+class DrawdownEpisodesWindow(QWidget):
+    """
+    Drawdown episodes of a data set, deepest first.
+    """
+
+    FIELDS: List[str] = [
+        "Rank",
+        "Peak Date",
+        "Trough Date",
+        "Recovery Date",
+        "Depth",
+        "Depth%",
+        "Duration (Days)",
+    ]
+    MAX_EPISODES: int = 100
+
+    def __init__(
+        self, results: AnalysisResults, parent: Optional[QWidget] = None
+    ) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Drawdown Episodes")
+
+        # Widgets
+        self.__data_set_combo: QComboBox = QComboBox()
+        self.__data_set_combo.currentIndexChanged.connect(
+            self.on_data_set_combo_current_index_changed
+        )
+
+        self.__summary_label: QLabel = QLabel()
+
+        self.__episode_table: QTableWidget = QTableWidget()
+        self.__episode_table.verticalHeader().setVisible(False)
+        self.__episode_table.setColumnCount(len(self.FIELDS))
+        self.__episode_table.setHorizontalHeaderLabels(self.FIELDS)
+        self.__episode_table.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Stretch
+        )
+        self.__episode_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+
+        # Layout
+        layout: QGridLayout = QGridLayout(self)
+        layout.addWidget(QLabel("Data Set"), 0, 0, 1, 1)
+        layout.addWidget(self.__data_set_combo, 0, 1, 1, 3)
+        layout.addWidget(self.__summary_label, 0, 4, 1, 6)
+        layout.addWidget(self.__episode_table, 1, 0, 9, 10)
+
+        # Data
+        for key in results.keys:
+            self.__data_set_combo.addItem(key, results.get(key))
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def current_statistics_results(self) -> Union[StatisticsResults, None]:
+        return self.__data_set_combo.currentData()
+
+    # -------------------------------------------------- Event Handlers --------------------------------------------------
+    def on_data_set_combo_current_index_changed(self, index: int) -> None:
+        self.reload_table()
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    def reload_table(self) -> None:
+        self.__episode_table.clearContents()
+        self.__episode_table.setRowCount(0)
+        self.__summary_label.clear()
+
+        statistics_results: Union[StatisticsResults, None] = (
+            self.current_statistics_results
+        )
+
+        if statistics_results is None or statistics_results.drawdown_episodes is None:
+            return
+
+        drawdown_episodes: DrawdownEpisodeIndex = statistics_results.drawdown_episodes
+        self.__summary_label.setText(
+            f"# of Episodes: {len(drawdown_episodes)}    "
+            f"Avg Depth: {round(drawdown_episodes.average_depth_percent * 100, 2)}%    "
+            f"Longest: {drawdown_episodes.longest_duration.days} days    "
+            f"Time Under Water: {round(drawdown_episodes.time_under_water_ratio * 100, 2)}%"
+        )
+
+        episodes: List[DrawdownEpisode] = drawdown_episodes.top(self.MAX_EPISODES)
+        self.__episode_table.setRowCount(len(episodes))
+
+        for row, episode in enumerate(episodes):
+            self.__episode_table.setItem(row, 0, QTableWidgetItem(str(row + 1)))
+            self.__episode_table.setItem(
+                row, 1, QTableWidgetItem(str(episode.peak_date))
+            )
+            self.__episode_table.setItem(
+                row, 2, QTableWidgetItem(str(episode.trough_date))
+            )
+            self.__episode_table.setItem(
+                row,
+                3,
+                QTableWidgetItem(
+                    str(episode.recovery_date) if episode.is_recovered else "-"
+                ),
+            )
+            self.__episode_table.setItem(
+                row, 4, QTableWidgetItem(str(round(episode.depth, 2)))
+            )
+            self.__episode_table.setItem(
+                row,
+                5,
+                QTableWidgetItem(f"{round(episode.depth_percent * 100, 2)}%"),
+            )
+            self.__episode_table.setItem(
+                row, 6, QTableWidgetItem(str(episode.duration.days))
+            )
+
+    # -------------------------------------------------- Private Methods --------------------------------------------------
@@ -58,6 +58,9 @@ class EquityChartWindow(QWidget):
         self.__by_trade_button: QRadioButton = QRadioButton("By Trade")
         self.__by_trade_button.clicked.connect(self.on_by_trade_button_clicked)
 
+        self.__intraday_button: QRadioButton = QRadioButton("Intraday")
+        self.__intraday_button.clicked.connect(self.on_intraday_button_clicked)
+
         self.__display_units_combo: QComboBox = QComboBox()
         self.__display_units_combo.currentIndexChanged.connect(
             self.on_display_units_combo_currenct_index_changed
@@ -83,14 +86,15 @@ class EquityChartWindow(QWidget):
         layout.addWidget(axis_label, 0, 14, 1, 2)
         layout.addWidget(self.__by_time_button, 0, 16, 1, 2)
         layout.addWidget(self.__by_trade_button, 0, 18, 1, 2)
+        layout.addWidget(self.__intraday_button, 0, 20, 1, 2)
 
         display_units_label: QLabel = QLabel("Display Units")
         display_units_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(display_units_label, 0, 20, 1, 2)
-        layout.addWidget(self.__display_units_combo, 0, 22, 1, 2)
+        layout.addWidget(display_units_label, 0, 22, 1, 2)
+        layout.addWidget(self.__display_units_combo, 0, 24, 1, 2)
 
-        layout.addWidget(self.__equity_chart, 1, 6, 15, 18)
-        layout.addWidget(self.__drawdown_chart, 16, 6, 4, 18)
+        layout.addWidget(self.__equity_chart, 1, 6, 15, 20)
+        layout.addWidget(self.__drawdown_chart, 16, 6, 4, 20)
 
         # Data
         for i, units in enumerate(DisplayUnits):
@@ -118,12 +122,16 @@ class EquityChartWindow(QWidget):
     @property
     def x_axis_type(self) -> AxisType:
         axis_type: AxisType = AxisType.DateTime
-        if self.__by_time_button.isChecked():
+        if self.__by_time_button.isChecked() or self.__intraday_button.isChecked():
             axis_type = AxisType.DateTime
         elif self.__by_trade_button.isChecked():
             axis_type = AxisType.Value
         return axis_type
 
+    @property
+    def is_intraday(self) -> bool:
+        return self.__intraday_button.isChecked()
+
     @property
     def display_units(self) -> DisplayUnits:
         return self.__display_units_combo.currentData()
@@ -147,6 +155,9 @@ class EquityChartWindow(QWidget):
     def on_by_trade_button_clicked(self, checked: bool) -> None:
         self.reload_charts()
 
+    def on_intraday_button_clicked(self, checked: bool) -> None:
+        self.reload_charts()
+
     def on_display_units_combo_currenct_index_changed(self, index: int) -> None:
         self.reload_charts()
 
@@ -169,17 +180,25 @@ class EquityChartWindow(QWidget):
         """
         Add a series to equity/drawdown chart.
         """
-        equity_chart_points: List[ChartPoint] = self.__data_set_list.get_item(
-            name
-        ).get_equity_chart_points(self.side, self.x_axis_type, self.display_units)
-        drawdown_chart_points: List[ChartPoint] = self.__data_set_list.get_item(
-            name
-        ).get_drawdown_chart_points(self.side, self.x_axis_type, self.display_units)
+        item: DataSetListItem = self.__data_set_list.get_item(name)
+        equity_chart_points: List[ChartPoint] = []
+        drawdown_chart_points: List[ChartPoint] = []
+
+        if self.is_intraday:
+            equity_chart_points, drawdown_chart_points = item.get_intraday_chart_points(
+                self.side, self.display_units
+            )
+        else:
+            equity_chart_points = item.get_equity_chart_points(
+                self.side, self.x_axis_type, self.display_units
+            )
+            drawdown_chart_points = item.get_drawdown_chart_points(
+                self.side, self.x_axis_type, self.display_units
+            )
 
         if name.startswith("Benchmark") and self.x_axis_type == AxisType.Value:
-            benchmark_item: DataSetListItem = self.__data_set_list.get_item(name)
             self.remove_series(name)
-            benchmark_item.is_checked = False
+            item.is_checked = False
         else:
             self.__equity_chart.add_series(
                 name, equity_chart_points, self.x_axis_type, self.display_units
@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from PyQt6.QtWidgets import QWidget, QGridLayout, QComboBox, QLabel, QPushButton
 
@@ -73,18 +73,23 @@ class ListOfTradesWindow(QWidget):
 
     def on_long_side_button_clicked(self, checked: bool) -> None:
         if checked:
-            long_trades: List[Trade] = list(
-                filter(lambda trade: trade.side == Side.Long, self.current_trade_list)
-            )
-            self.__trade_table.set_trades(long_trades)
+            self.__set_side_trades(Side.Long)
 
     def on_short_side_button_clicked(self, checked: bool) -> None:
         if checked:
-            long_trades: List[Trade] = list(
-                filter(lambda trade: trade.side == Side.Short, self.current_trade_list)
-            )
-            self.__trade_table.set_trades(long_trades)
+            self.__set_side_trades(Side.Short)
 
     # -------------------------------------------------- Public Methods --------------------------------------------------
 
     # -------------------------------------------------- Private Methods --------------------------------------------------
+    def __set_side_trades(self, side: Side) -> None:
+        # Keep the numbers of trades in the whole data set.
+        numbered_trades: List[Tuple[int, Trade]] = [
+            (number, trade)
+            for number, trade in enumerate(self.current_trade_list, 1)
+            if trade.side == side
+        ]
+        self.__trade_table.set_trades(
+            [trade for _, trade in numbered_trades],
+            [number for number, _ in numbered_trades],
+        )
@@ -11,6 +11,7 @@ from PyQt6.QtGui import QAction
 from .strategy_window import StrategyWindow
 from .create_strategy_dialog import CreateStrategyDialog
 from .instrument_window import InstrumentWindow
+from ..analysis import BenchmarkStore
 
 
 class MainWindow(QMainWindow):
@@ -26,6 +27,12 @@ class MainWindow(QMainWindow):
         new_strategy_action: QAction = new_menu.addAction("New Strategy")
         new_strategy_action.triggered.connect(self.on_new_strategy_action_clicked)
 
+        # Benchmarks are served from the local store only while working offline.
+        work_offline_action: QAction = file_menu.addAction("Work Offline")
+        work_offline_action.setCheckable(True)
+        work_offline_action.setChecked(BenchmarkStore.is_offline)
+        work_offline_action.triggered.connect(self.on_work_offline_action_clicked)
+
         # Menu - View
         view_menu: QMenu = self.menuBar().addMenu("View")
 
@@ -49,6 +56,9 @@ class MainWindow(QMainWindow):
         )
         self.__strategy_form.exec()
 
+    def on_work_offline_action_clicked(self, checked: bool) -> None:
+        BenchmarkStore.is_offline = checked
+
     def on_instruments_action_clicked(self, checked: bool) -> None:
         self.__instrument_window: InstrumentWindow = InstrumentWindow(self)
         self.__instrument_window.exec()
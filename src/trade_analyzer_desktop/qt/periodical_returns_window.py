@@ -0,0 +1,122 @@
+from typing import Optional, Union, List
+
+from PyQt6.QtWidgets import (
+    QWidget,
+    QGridLayout,
+    QLabel,
+    QComboBox,
+    QHeaderView,
+    QTableWidget,
+    QTableWidgetItem,
+)
+
+from ..analysis import (
+    AnalysisResults,
+    StatisticsResults,
+    PeriodicalStatistics,
+    Period,
+)
+
+
+class PeriodicalReturnsWindow(QWidget):
+    """
+    Month-by-year returns grid of a data set.
+    """
+
+    FIELDS: List[str] = [
+        "Jan",
+        "Feb",
+        "Mar",
+        "Apr",
+        "May",
+        "Jun",
+        "Jul",
+        "Aug",
+        "Sep",
+        "Oct",
+        "Nov",
+        "Dec",
+        "Year",
+    ]
+
+    def __init__(
+        self, results: AnalysisResults, parent: Optional[QWidget] = None
+    ) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Periodical Returns")
+
+        # Widgets
+        self.__data_set_combo: QComboBox = QComboBox()
+        self.__data_set_combo.currentIndexChanged.connect(
+            self.on_data_set_combo_current_index_changed
+        )
+
+        self.__returns_table: QTableWidget = QTableWidget()
+        self.__returns_table.setColumnCount(len(self.FIELDS))
+        self.__returns_table.setHorizontalHeaderLabels(self.FIELDS)
+        self.__returns_table.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Stretch
+        )
+        self.__returns_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+
+        # Layout
+        layout: QGridLayout = QGridLayout(self)
+        layout.addWidget(QLabel("Data Set"), 0, 0, 1, 1)
+        layout.addWidget(self.__data_set_combo, 0, 1, 1, 3)
+        layout.addWidget(self.__returns_table, 1, 0, 9, 10)
+
+        # Data
+        for key in results.keys:
+            self.__data_set_combo.addItem(key, results.get(key))
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def current_statistics_results(self) -> Union[StatisticsResults, None]:
+        return self.__data_set_combo.currentData()
+
+    # -------------------------------------------------- Event Handlers --------------------------------------------------
+    def on_data_set_combo_current_index_changed(self, index: int) -> None:
+        self.reload_table()
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    def reload_table(self) -> None:
+        self.__returns_table.clearContents()
+        self.__returns_table.setRowCount(0)
+
+        statistics_results: Union[StatisticsResults, None] = (
+            self.current_statistics_results
+        )
+
+        if (
+            statistics_results is None
+            or statistics_results.periodical_performance is None
+        ):
+            return
+
+        monthly: Union[PeriodicalStatistics, None] = (
+            statistics_results.periodical_performance.get(Period.Monthly)
+        )
+        yearly: Union[PeriodicalStatistics, None] = (
+            statistics_results.periodical_performance.get(Period.Yearly)
+        )
+        assert monthly is not None and yearly is not None
+
+        years: List[int] = sorted(set(date.year for date in yearly.returns.keys()))
+        self.__returns_table.setRowCount(len(years))
+        self.__returns_table.setVerticalHeaderLabels([str(year) for year in years])
+
+        for date, returns in monthly.returns.items():
+            self.__returns_table.setItem(
+                years.index(date.year),
+                date.month - 1,
+                QTableWidgetItem(f"{round(returns * 100, 2)}%"),
+            )
+
+        for date, returns in yearly.returns.items():
+            self.__returns_table.setItem(
+                years.index(date.year),
+                len(self.FIELDS) - 1,
+                QTableWidgetItem(f"{round(returns * 100, 2)}%"),
+            )
+
+    # -------------------------------------------------- Private Methods --------------------------------------------------
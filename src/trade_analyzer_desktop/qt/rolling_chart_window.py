@@ -0,0 +1,120 @@
+from typing import Optional, Union, List
+
+from PyQt6.QtWidgets import QWidget, QGridLayout, QLabel, QComboBox
+from PyQt6.QtCore import Qt
+
+from .data_set_list import DataSetList
+from .data_set_list_item import DataSetListItem
+from .charts import EquityChart, ChartPoint, AxisType, DisplayUnits, RollingMetric
+from ..analysis import AnalysisResults, StatisticsResults, RollingStatisticsBuilder
+
+
+class RollingChartWindow(QWidget):
+    def __init__(
+        self, results: AnalysisResults, parent: Optional[QWidget] = None
+    ) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Rolling Performance")
+
+        # Widgets
+        self.__data_set_list: DataSetList = DataSetList()
+        self.__data_set_list.setResizeMode(DataSetList.ResizeMode.Adjust)
+        self.__data_set_list.item_checked.connect(self.on_data_list_item_checked)
+
+        self.__window_combo: QComboBox = QComboBox()
+        self.__metric_combo: QComboBox = QComboBox()
+
+        self.__rolling_chart: EquityChart = EquityChart()
+
+        # Layout
+        layout: QGridLayout = QGridLayout(self)
+        layout.setSpacing(10)
+        layout.addWidget(self.__data_set_list, 0, 0, 20, 6)
+
+        window_label: QLabel = QLabel("Window")
+        window_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(window_label, 0, 6, 1, 2)
+        layout.addWidget(self.__window_combo, 0, 8, 1, 2)
+
+        metric_label: QLabel = QLabel("Metric")
+        metric_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(metric_label, 0, 10, 1, 2)
+        layout.addWidget(self.__metric_combo, 0, 12, 1, 2)
+
+        layout.addWidget(self.__rolling_chart, 1, 6, 19, 18)
+
+        # Data
+        for window in RollingStatisticsBuilder.WINDOWS:
+            self.__window_combo.addItem(f"{window} days", window)
+
+        for metric in RollingMetric:
+            self.__metric_combo.addItem(metric.value, metric)
+
+        self.__window_combo.currentIndexChanged.connect(
+            self.on_window_combo_current_index_changed
+        )
+        self.__metric_combo.currentIndexChanged.connect(
+            self.on_metric_combo_current_index_changed
+        )
+
+        for key in results.keys:
+            statistics_results: Union[StatisticsResults, None] = results.get(key)
+            assert statistics_results is not None
+            self.__data_set_list.add_data(key, statistics_results)
+            self.add_series(key)
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def rolling_window(self) -> int:
+        return self.__window_combo.currentData()
+
+    @property
+    def rolling_metric(self) -> RollingMetric:
+        return self.__metric_combo.currentData()
+
+    # -------------------------------------------------- Event Handlers --------------------------------------------------
+    def on_data_list_item_checked(self, key: str, checked: bool) -> None:
+        self.add_series(key) if checked else self.remove_series(key)
+
+    def on_window_combo_current_index_changed(self, index: int) -> None:
+        self.reload_chart()
+
+    def on_metric_combo_current_index_changed(self, index: int) -> None:
+        self.reload_chart()
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    def reload_chart(self) -> None:
+        """
+        Reload series which data sets are checked.
+        """
+        existing_items: List[DataSetListItem] = list(
+            filter(lambda item: item.is_checked, self.__data_set_list.items)
+        )
+
+        for item in existing_items:
+            self.remove_series(item.key)
+            self.add_series(item.key)
+
+    def add_series(self, name: str) -> None:
+        """
+        Add a series of the current window and metric to chart.
+        """
+        rolling_chart_points: List[ChartPoint] = self.__data_set_list.get_item(
+            name
+        ).get_rolling_chart_points(self.rolling_window, self.rolling_metric)
+
+        # Data sets shorter than the window have no rolling statistics.
+        if len(rolling_chart_points) == 0:
+            return
+
+        self.__rolling_chart.add_series(
+            name,
+            rolling_chart_points,
+            AxisType.DateTime,
+            DisplayUnits.Percentage,
+        )
+
+    def remove_series(self, name: str) -> None:
+        self.__rolling_chart.remove_series(name)
+
+    # -------------------------------------------------- Private Methods --------------------------------------------------
@@ -19,7 +19,7 @@ from .analysis_setting_dialog import AnalysisSettingsDialog
 from .edit_strategy_dialog import EditStrategyDialog
 from .upload_backtest_report_dialog import UploadBacktestReportDialog
 from ..entities import BacktestReport, Strategy
-from ..analysis import Analyzer, BenchmarkSymbol, AnalysisResults
+from ..analysis import Analyzer, BenchmarkSymbol, AnalysisResults, CompositeBenchmark
 from .analysis_window import AnalysisWindow
 from ..repositories import StrategyRepository, BacktestReportRepository, OrderRepository
 
@@ -233,7 +233,7 @@ class StrategyTable(QTableWidget):
         starting_capital: float,
         start_date: Date,
         end_date: Date,
-        benchmark_sybol: BenchmarkSymbol,
+        benchmark_sybol: Union[BenchmarkSymbol, str, CompositeBenchmark],
     ) -> None:
         results: AnalysisResults = Analyzer.analyze_strategies(
             self.selected_strategies,
@@ -241,6 +241,7 @@ class StrategyTable(QTableWidget):
             start_date,
             end_date,
             benchmark_sybol,
+            Analyzer.DEFAULT_MAX_WORKERS,
         )
         self.__analysis_window: AnalysisWindow = AnalysisWindow(results)
         self.__analysis_window.showMaximized()
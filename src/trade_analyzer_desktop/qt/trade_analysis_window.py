@@ -1,11 +1,30 @@
-from typing import Optional
+from typing import Optional, Union, List, Tuple
 
-from PyQt6.QtWidgets import QWidget, QGridLayout
+from PyQt6.QtWidgets import (
+    QWidget,
+    QGridLayout,
+    QLabel,
+    QPushButton,
+    QButtonGroup,
+    QComboBox,
+    QHeaderView,
+    QTableWidget,
+    QTableWidgetItem,
+)
 
-from ..analysis import AnalysisResults
+from .charts import HistogramChart
+from ..enums import Side
+from ..analysis import (
+    AnalysisResults,
+    DistributionMetric,
+    TradeDistribution,
+    TradeDistributions,
+)
 
 
 class TradeAnalysisWindow(QWidget):
+    FIELDS: List[str] = ["Statistic", "Value"]
+
     def __init__(
         self, results: AnalysisResults, parent: Optional[QWidget] = None
     ) -> None:
@@ -13,17 +32,163 @@ class TradeAnalysisWindow(QWidget):
         self.setWindowTitle("Trade Analysis")
 
         # Widgets
+        self.__data_set_combo: QComboBox = QComboBox()
+
+        self.__all_side_button: QPushButton = QPushButton("All")
+        self.__all_side_button.setAutoExclusive(True)
+        self.__all_side_button.setCheckable(True)
+        self.__all_side_button.setChecked(True)
+        self.__all_side_button.clicked.connect(self.on_all_side_button_clicked)
+
+        self.__long_side_button: QPushButton = QPushButton("Long")
+        self.__long_side_button.setAutoExclusive(True)
+        self.__long_side_button.setCheckable(True)
+        self.__long_side_button.clicked.connect(self.on_long_side_button_clicked)
+
+        self.__short_side_button: QPushButton = QPushButton("Short")
+        self.__short_side_button.setAutoExclusive(True)
+        self.__short_side_button.setCheckable(True)
+        self.__short_side_button.clicked.connect(self.on_short_side_button_clicked)
+
+        self.__side_button_group: QButtonGroup = QButtonGroup()
+        self.__side_button_group.addButton(self.__all_side_button, 1)
+        self.__side_button_group.addButton(self.__long_side_button, 2)
+        self.__side_button_group.addButton(self.__short_side_button, 3)
+
+        self.__metric_combo: QComboBox = QComboBox()
+
+        self.__histogram_chart: HistogramChart = HistogramChart()
+
+        self.__statistics_table: QTableWidget = QTableWidget()
+        self.__statistics_table.verticalHeader().setVisible(False)
+        self.__statistics_table.setColumnCount(len(self.FIELDS))
+        self.__statistics_table.setHorizontalHeaderLabels(self.FIELDS)
+        self.__statistics_table.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Stretch
+        )
+        self.__statistics_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
 
         # Layout
         layout: QGridLayout = QGridLayout(self)
+        layout.addWidget(QLabel("Data Set"), 0, 0, 1, 1)
+        layout.addWidget(self.__data_set_combo, 0, 1, 1, 3)
+
+        layout.addWidget(QLabel("Side"), 0, 4, 1, 1)
+        layout.addWidget(self.__all_side_button, 0, 5, 1, 1)
+        layout.addWidget(self.__long_side_button, 0, 6, 1, 1)
+        layout.addWidget(self.__short_side_button, 0, 7, 1, 1)
+
+        layout.addWidget(QLabel("Metric"), 0, 8, 1, 1)
+        layout.addWidget(self.__metric_combo, 0, 9, 1, 1)
+
+        layout.addWidget(self.__histogram_chart, 1, 0, 9, 7)
+        layout.addWidget(self.__statistics_table, 1, 7, 9, 3)
 
         # Default Data
         self.__analysis_results: AnalysisResults = results
+        self.__trade_distributions: TradeDistributions = TradeDistributions(results)
+
+        for key in results.keys:
+            if not key.startswith("Benchmark"):
+                self.__data_set_combo.addItem(key, key)
+
+        for metric in DistributionMetric:
+            self.__metric_combo.addItem(metric.value, metric)
+
+        self.__data_set_combo.currentIndexChanged.connect(
+            self.on_data_set_combo_current_index_changed
+        )
+        self.__metric_combo.currentIndexChanged.connect(
+            self.on_metric_combo_current_index_changed
+        )
+        self.reload_distribution()
 
     # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def current_key(self) -> Union[str, None]:
+        return self.__data_set_combo.currentData()
+
+    @property
+    def current_side(self) -> Side:
+        if self.__long_side_button.isChecked():
+            return Side.Long
+
+        if self.__short_side_button.isChecked():
+            return Side.Short
+        return Side.All
+
+    @property
+    def current_metric(self) -> DistributionMetric:
+        return self.__metric_combo.currentData()
 
     # -------------------------------------------------- Event Handlers --------------------------------------------------
+    def on_data_set_combo_current_index_changed(self, index: int) -> None:
+        self.reload_distribution()
+
+    def on_metric_combo_current_index_changed(self, index: int) -> None:
+        self.reload_distribution()
+
+    def on_all_side_button_clicked(self, checked: bool) -> None:
+        self.reload_distribution()
+
+    def on_long_side_button_clicked(self, checked: bool) -> None:
+        self.reload_distribution()
+
+    def on_short_side_button_clicked(self, checked: bool) -> None:
+        self.reload_distribution()
 
     # -------------------------------------------------- Public Methods --------------------------------------------------
+    def reload_distribution(self) -> None:
+        """
+        Reload histogram and statistics of the current data set, side and metric.
+        """
+        self.__histogram_chart.clear()
+        self.__statistics_table.clearContents()
+        self.__statistics_table.setRowCount(0)
+
+        key: Union[str, None] = self.current_key
+
+        if key is None:
+            return
+
+        distribution: Union[TradeDistribution, None] = self.__trade_distributions.get(
+            key, self.current_side, self.current_metric
+        )
+
+        if distribution is None or distribution.number_of_values == 0:
+            return
+
+        self.__histogram_chart.set_histogram(
+            key, distribution.bin_edges, distribution.counts
+        )
+
+        rows: List[Tuple[str, float]] = [
+            ("# of Trades", distribution.number_of_values),
+            ("Mean", distribution.mean),
+            ("Standard Deviation", distribution.standard_deviation),
+            ("Skewness", distribution.skewness),
+            ("Kurtosis", distribution.kurtosis),
+            ("Min", distribution.min),
+            ("Max", distribution.max),
+        ]
+        rows.extend(
+            (f"{round(quantile * 100)}% Quantile", value)
+            for quantile, value in distribution.quantiles.items()
+        )
+        rows.extend(
+            [
+                ("Left Tail Mean", distribution.left_tail_mean),
+                ("Right Tail Mean", distribution.right_tail_mean),
+                ("Tail Ratio", distribution.tail_ratio),
+            ]
+        )
+
+        self.__statistics_table.setRowCount(len(rows))
+
+        for row, (name, value) in enumerate(rows):
+            self.__statistics_table.setItem(row, 0, QTableWidgetItem(name))
+            self.__statistics_table.setItem(
+                row, 1, QTableWidgetItem(str(round(value, 4)))
+            )
 
     # -------------------------------------------------- Private Methods --------------------------------------------------
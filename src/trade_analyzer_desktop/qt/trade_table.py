@@ -48,10 +48,8 @@ class TradeTable(QTableWidget):
 
     @property
     def current_trade(self) -> Union[Trade, None]:
-        return next(
-            filter(lambda trade: trade.id == self.current_strategy_id, self.__trades),
-            None,
-        )
+        row: int = self.currentRow()
+        return self.__trades[row] if 0 <= row < len(self.__trades) else None
 
     # -------------------------------------------------- Event Handlers --------------------------------------------------
 
@@ -75,14 +73,23 @@ class TradeTable(QTableWidget):
 
     # -------------------------------------------------- Public Methods --------------------------------------------------
 
-    def set_trades(self, trades: List[Trade]) -> None:
+    def set_trades(
+        self, trades: List[Trade], numbers: Optional[List[int]] = None
+    ) -> None:
+        """
+        Numbers are the trade numbers in the data set, trades are numbered from 1 in list order by default.
+        """
         self.clearContents()
         self.setRowCount(0)
 
-        for trade in trades:
+        # Trades may be shared by several data sets, so their own id is not used as number.
+        if numbers is None:
+            numbers = list(range(1, len(trades) + 1))
+
+        for number, trade in zip(numbers, trades):
             row: int = self.rowCount()
             self.setRowCount(row + 1)
-            self.setItem(row, 0, QTableWidgetItem(str(trade.id)))
+            self.setItem(row, 0, QTableWidgetItem(str(number)))
             self.setItem(row, 1, QTableWidgetItem(trade.symbol))
             self.setItem(row, 2, QTableWidgetItem(trade.side.value))
             self.setItem(row, 3, QTableWidgetItem(str(trade.entry_time)))
@@ -2,3 +2,4 @@ from .strategy_repository import StrategyRepository
 from .backtest_report_repository import BacktestReportRepository
 from .order_repository import OrderRepository
 from .instrument_repository import InstrumentRepository
+from .benchmark_price_repository import BenchmarkPriceRepository
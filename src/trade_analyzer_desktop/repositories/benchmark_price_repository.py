@@ -0,0 +1,93 @@
+from typing import Dict, Tuple, Union
+from datetime import date as Date
+
+from PyQt6.QtSql import QSqlQuery
+
+
+class BenchmarkPriceRepository:
+    SELECT_BY_SYMBOL_AND_DATE_RANGE_SQL: str = """
+    SELECT date, close FROM benchmark_prices
+    WHERE symbol = :symbol AND date >= :start_date AND date <= :end_date
+    ORDER BY date
+    """
+
+    INSERT_OR_REPLACE_PRICES_SQL: str = """
+    INSERT OR REPLACE INTO benchmark_prices (symbol, date, close) VALUES (?, ?, ?)
+    """
+
+    SELECT_RANGE_BY_SYMBOL_SQL: str = """
+    SELECT start_date, end_date FROM benchmark_price_ranges WHERE symbol = :symbol
+    """
+
+    INSERT_OR_REPLACE_RANGE_SQL: str = """
+    INSERT OR REPLACE INTO benchmark_price_ranges (symbol, start_date, end_date) VALUES (
+        :symbol, :start_date, :end_date
+    )
+    """
+
+    @classmethod
+    def query_by_symbol_and_date_range(
+        cls, symbol: str, start_date: Date, end_date: Date
+    ) -> Dict[Date, float]:
+        """
+        Returns close prices of a symbol between the start and end date (both inclusive) in date order.
+        """
+        prices: Dict[Date, float] = {}
+
+        query: QSqlQuery = QSqlQuery()
+        query.setForwardOnly(True)
+        query.prepare(cls.SELECT_BY_SYMBOL_AND_DATE_RANGE_SQL)
+        query.bindValue(":symbol", symbol)
+        query.bindValue(":start_date", start_date.strftime("%Y-%m-%d"))
+        query.bindValue(":end_date", end_date.strftime("%Y-%m-%d"))
+        query.exec()
+
+        while query.next():
+            prices[Date.fromisoformat(query.value(0))] = float(query.value(1))
+        return prices
+
+    @classmethod
+    def insert_batch(cls, symbol: str, prices: Dict[Date, float]) -> bool:
+        """
+        Inserts close prices of a symbol, prices of dates which are already stored are replaced.
+        """
+        if len(prices) == 0:
+            return True
+
+        query: QSqlQuery = QSqlQuery()
+        query.prepare(cls.INSERT_OR_REPLACE_PRICES_SQL)
+
+        query.addBindValue([symbol] * len(prices))
+        query.addBindValue([date.strftime("%Y-%m-%d") for date in prices.keys()])
+        query.addBindValue(list(prices.values()))
+        success: bool = query.execBatch()
+
+        if not success:
+            print(query.lastError().text())
+        return success
+
+    @classmethod
+    def query_range_by_symbol(cls, symbol: str) -> Union[Tuple[Date, Date], None]:
+        """
+        Returns the date range which has been fetched for a symbol, or None when nothing is stored.
+        """
+        query: QSqlQuery = QSqlQuery()
+        query.prepare(cls.SELECT_RANGE_BY_SYMBOL_SQL)
+        query.bindValue(":symbol", symbol)
+        query.exec()
+
+        if not query.next():
+            return None
+        return (
+            Date.fromisoformat(query.value(0)),
+            Date.fromisoformat(query.value(1)),
+        )
+
+    @classmethod
+    def update_range(cls, symbol: str, start_date: Date, end_date: Date) -> bool:
+        query: QSqlQuery = QSqlQuery()
+        query.prepare(cls.INSERT_OR_REPLACE_RANGE_SQL)
+        query.bindValue(":symbol", symbol)
+        query.bindValue(":start_date", start_date.strftime("%Y-%m-%d"))
+        query.bindValue(":end_date", end_date.strftime("%Y-%m-%d"))
+        return query.exec()
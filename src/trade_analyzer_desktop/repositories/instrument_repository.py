@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import Callable, List, Union
 
 from PyQt6.QtSql import QSqlQuery
 
@@ -18,6 +18,8 @@ class InstrumentRepository:
     VALUES (?, ?, ?, ?, ?, ?)
     """
 
+    __instruments_changed_callbacks: List[Callable[[List[str]], None]] = []
+
     @classmethod
     def query_all(cls) -> List[Instrument]:
         instruments: List[Instrument] = []
@@ -56,4 +58,16 @@ class InstrumentRepository:
 
         if not success:
             print(query.lastError().text())
+        else:
+            for callback in cls.__instruments_changed_callbacks:
+                callback([instrument.symbol for instrument in instruments])
         return success
+
+    @classmethod
+    def register_instruments_changed_callback(
+        cls, callback: Callable[[List[str]], None]
+    ) -> None:
+        """
+        Registers a callback which is called with the symbols of inserted instruments.
+        """
+        cls.__instruments_changed_callbacks.append(callback)
@@ -1,4 +1,5 @@
-from typing import List
+from typing import Callable, Iterator, List
+from datetime import date as Date, timedelta as TimeDelta
 
 from PyQt6.QtSql import QSqlQuery
 
@@ -21,6 +22,15 @@ class OrderRepository:
     SELECT * FROM orders WHERE strategy_id = :strategy_id
     """
 
+    SELECT_BY_STRATEGY_ID_AND_DATETIME_RANGE_SQL: str = """
+    SELECT * FROM orders
+    WHERE
+    strategy_id = :strategy_id AND datetime >= :start_datetime AND datetime < :end_datetime
+    ORDER BY datetime, rowid
+    """
+
+    __orders_changed_callbacks: List[Callable[[str], None]] = []
+
     @classmethod
     def insert_batch(cls, orders: List[Order]) -> bool:
         query: QSqlQuery = QSqlQuery()
@@ -39,6 +49,9 @@ class OrderRepository:
 
         if not success:
             print(query.lastError().text())
+        else:
+            for strategy_id in dict.fromkeys(order.strategy_id for order in orders):
+                cls.__on_orders_changed(strategy_id)
         return success
 
     @classmethod
@@ -46,7 +59,11 @@ class OrderRepository:
         query: QSqlQuery = QSqlQuery()
         query.prepare(cls.DELETE_SQL)
         query.bindValue(":strategy_id", strategy_id)
-        return query.exec()
+        success: bool = query.exec()
+
+        if success:
+            cls.__on_orders_changed(strategy_id)
+        return success
 
     @classmethod
     def query_by_strategy_id(cls, strategy_id: str) -> List[Order]:
@@ -60,3 +77,38 @@ class OrderRepository:
         while query.next():
             orders.append(Order.from_query(query))
         return orders
+
+    @classmethod
+    def iter_by_strategy_id_and_date_range(
+        cls, strategy_id: str, start_date: Date, end_date: Date
+    ) -> Iterator[Order]:
+        """
+        Yields orders of a strategy between the start and end date (both inclusive) in datetime order.
+        """
+        query: QSqlQuery = QSqlQuery()
+        query.setForwardOnly(True)
+        query.prepare(cls.SELECT_BY_STRATEGY_ID_AND_DATETIME_RANGE_SQL)
+        query.bindValue(":strategy_id", strategy_id)
+
+        # Datetime is stored as text, which sorts in time order.
+        query.bindValue(":start_datetime", start_date.strftime("%Y-%m-%d 00:00:00"))
+        query.bindValue(
+            ":end_datetime",
+            (end_date + TimeDelta(days=1)).strftime("%Y-%m-%d 00:00:00"),
+        )
+        query.exec()
+
+        while query.next():
+            yield Order.from_query(query)
+
+    @classmethod
+    def register_orders_changed_callback(cls, callback: Callable[[str], None]) -> None:
+        """
+        Registers a callback which is called with the strategy id whenever orders of a strategy are inserted or deleted.
+        """
+        cls.__orders_changed_callbacks.append(callback)
+
+    @classmethod
+    def __on_orders_changed(cls, strategy_id: str) -> None:
+        for callback in cls.__orders_changed_callbacks:
+            callback(strategy_id)
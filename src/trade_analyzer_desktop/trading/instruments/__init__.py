@@ -0,0 +1 @@
+from .instrument_registry import InstrumentRegistry
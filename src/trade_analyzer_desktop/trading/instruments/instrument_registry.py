@@ -0,0 +1,35 @@
+from typing import Dict, List, Union
+
+from ...entities import Instrument
+from ...repositories import InstrumentRepository
+
+
+class InstrumentRegistry:
+    """
+    Lookup table of instruments by symbol, loaded once and shared by the simulation and trade construction.
+    """
+
+    def __init__(self, instruments: List[Instrument]) -> None:
+        self.__instruments: Dict[str, Instrument] = {
+            instrument.symbol: instrument for instrument in instruments
+        }
+
+    # -------------------------------------------------- Properties --------------------------------------------------
+    @property
+    def instruments(self) -> List[Instrument]:
+        return list(self.__instruments.values())
+
+    # -------------------------------------------------- Public Methods --------------------------------------------------
+    @classmethod
+    def load(cls) -> "InstrumentRegistry":
+        return cls(InstrumentRepository.query_all())
+
+    def get(self, symbol: str) -> Instrument:
+        instrument: Union[Instrument, None] = self.__instruments.get(symbol)
+
+        if instrument is None:
+            raise RuntimeError(f"No data avaliable for this instrument: {symbol}")
+        return instrument
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.__instruments
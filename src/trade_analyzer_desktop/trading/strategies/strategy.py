@@ -1,18 +1,25 @@
-from typing import List, Union
+from typing import List
 from datetime import datetime as DateTime
 
+from ..instruments import InstrumentRegistry
 from ..positions import PositionManager
-from ...repositories import InstrumentRepository
 from ...entities import Position, Instrument, Trade
 from ...events import OrderFilledEvent
 from ...enums import StrategyType, Side
 
 
 class Strategy:
-    def __init__(self, id: str, description: str, type: StrategyType) -> None:
+    def __init__(
+        self,
+        id: str,
+        description: str,
+        type: StrategyType,
+        instruments: InstrumentRegistry,
+    ) -> None:
         self.__id: str = id
         self.__description: str = description
         self.__type: StrategyType = type
+        self.__instruments: InstrumentRegistry = instruments
         self.__position_manager: PositionManager = PositionManager()
         self.__position_manager.register_position_closed_callback(
             self.on_position_closed
@@ -32,6 +39,10 @@ class Strategy:
     def type(self) -> StrategyType:
         return self.__type
 
+    @property
+    def instruments(self) -> InstrumentRegistry:
+        return self.__instruments
+
     @property
     def open_positions(self) -> List[Position]:
         return self.__position_manager.open_positions
@@ -48,9 +59,7 @@ class Strategy:
         self.__position_manager.on_order_filled(e)
 
     def on_position_closed(self, position: Position) -> None:
-        instrument: Union[Instrument, None] = InstrumentRepository.query_by_symbol(
-            position.symbol
-        )
+        instrument: Instrument = self.__instruments.get(position.symbol)
         buy_fills: List[OrderFilledEvent] = position.buy_fills
         sell_fills: List[OrderFilledEvent] = position.sell_fills
         entry_time: DateTime = position.fills[0].datetime
@@ -79,7 +88,6 @@ class Strategy:
                 / position.total_exit_size
             )
 
-        assert instrument is not None
         gross_profit_loss: float = (
             instrument.point_value
             * position.total_buy_size